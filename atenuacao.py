@@ -0,0 +1,212 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Tabelas de Atenuação
+=============================================================
+
+Coeficientes de atenuação μ/ρ contínuos em energia, de 10 keV
+a 10 MeV, para elementos e compostos, sem nenhuma dependência
+do Streamlit.
+
+Os dados ficam em dados/*.npy (gerados por
+dados/gerar_atenuacao.py), com ln E, ln μ/ρ e a inclinação de
+cada trecho já calculados. Cada material vira um registro
+imutável, montado uma vez por processo; avaliar μ em qualquer
+array de energias é uma busca binária e uma multiplicação:
+
+    ln μ/ρ(E) = ln μ/ρᵢ + sᵢ·(ln E - ln Eᵢ)
+
+Nas bordas K a energia aparece duas vezes na tabela (abaixo e
+acima da borda); exatamente na borda vale o valor de cima.
+Fora da faixa tabelada o valor é o da ponta mais próxima.
+
+Misturas de composição qualquer (frações em massa) são montadas
+pela regra das misturas, μ/ρ = Σ wᵢ·(μ/ρ)ᵢ, e ficam em cache no
+processo, compartilhadas por todas as sessões.
+=============================================================
+"""
+
+import functools
+import math
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+PASTA_DADOS = Path(__file__).resolve().parent / "dados"
+
+class Material(NamedTuple):
+    """Tabela log-log de μ/ρ de um material (elemento ou composto)"""
+    indice: int
+    nome: str
+    descricao: str
+    densidade: float        # g/cm³
+    z_sobre_a: float        # Z/A médio (mol/g)
+    z: int                  # número atômico (0 para compostos)
+    massa_atomica: float    # g/mol (0 para compostos)
+    ln_energias: np.ndarray # ln E (keV), não decrescente
+    ln_mu_rho: np.ndarray   # ln μ/ρ (cm²/g)
+    inclinacoes: np.ndarray # d ln μ/ρ / d ln E até o ponto seguinte
+
+    @property
+    def elemento(self):
+        return self.z > 0
+
+    @property
+    def energias(self):
+        """Energias tabeladas (keV), com as bordas repetidas"""
+        return np.exp(self.ln_energias)
+
+# ============================================================
+# CARGA (UMA VEZ POR PROCESSO)
+# ============================================================
+
+TABELA = np.load(PASTA_DADOS / "materiais.npy", mmap_mode="r")
+PONTOS = np.load(PASTA_DADOS / "atenuacao.npy", mmap_mode="r")
+
+_POR_NOME = {}
+for _i, _registro in enumerate(TABELA):
+    _faixa = slice(int(_registro["primeiro_ponto"]),
+                   int(_registro["primeiro_ponto"] + _registro["n_pontos"]))
+    _POR_NOME[str(_registro["nome"])] = Material(
+        _i, str(_registro["nome"]), str(_registro["descricao"]),
+        float(_registro["densidade"]), float(_registro["z_sobre_a"]),
+        int(_registro["z"]), float(_registro["massa_atomica"]),
+        np.ascontiguousarray(PONTOS["ln_energia"][_faixa]),
+        np.ascontiguousarray(PONTOS["ln_mu_rho"][_faixa]),
+        np.ascontiguousarray(PONTOS["inclinacao"][_faixa]),
+    )
+
+NOMES = tuple(_POR_NOME)
+ELEMENTOS = tuple(nome for nome, m in _POR_NOME.items() if m.elemento)
+COMPOSTOS = tuple(nome for nome, m in _POR_NOME.items() if not m.elemento)
+
+E_MIN = 10.0     # keV
+E_MAX = 10000.0  # keV
+
+# Misturas montadas sob demanda: nome → (descrição, densidade g/cm³, frações em massa)
+RECEITAS = {
+    "Concreto baritado": ("Concreto com agregado de barita (NIST)", 3.35,
+                          {"H": 0.003585, "O": 0.311622, "Mg": 0.001195, "Al": 0.004183,
+                           "Si": 0.010457, "S": 0.107858, "Ca": 0.050194, "Fe": 0.047505,
+                           "Ba": 0.463400}),
+    "Vidro plumbífero": ("Vidro de chumbo para visores (Ti e As somados ao Si)", 6.22,
+                         {"O": 0.156453, "Si": 0.091609, "Pb": 0.751938}),
+    "Polietileno borado": ("Polietileno com 5% de boro", 0.95,
+                           {"H": 0.136525, "C": 0.813475, "B": 0.05}),
+}
+
+# ============================================================
+# CONSULTAS
+# ============================================================
+
+def material(nome):
+    """Registro do material pelo nome (elemento, composto ou receita)"""
+    if nome in _POR_NOME:
+        return _POR_NOME[nome]
+    if nome in RECEITAS:
+        descricao, densidade, fracoes = RECEITAS[nome]
+        return misturar(nome, densidade, fracoes, descricao)
+    raise KeyError(f"Material desconhecido: {nome!r}")
+
+def mu_rho(mat, E):
+    """μ/ρ (cm²/g) em qualquer array de energias (keV)"""
+    ln_E = np.log(np.clip(np.asarray(E, dtype=float), E_MIN, E_MAX))
+    i = np.searchsorted(mat.ln_energias, ln_E, side="right") - 1
+    i = np.clip(i, 0, len(mat.ln_energias) - 1)
+    return np.exp(mat.ln_mu_rho[i] + mat.inclinacoes[i] * (ln_E - mat.ln_energias[i]))
+
+def mu(mat, E, densidade=None):
+    """Coeficiente de atenuação linear μ (cm⁻¹); densidade em g/cm³"""
+    return mu_rho(mat, E) * (mat.densidade if densidade is None else densidade)
+
+# ============================================================
+# TRANSMISSÃO DE FEIXE ESTREITO
+# ============================================================
+
+def transmissao(mat, E, espessura):
+    """e^(-μx) com E e x em broadcasting (ex.: E[:, None] e x[None, :])"""
+    return np.exp(-mu(mat, E) * np.asarray(espessura, dtype=float))
+
+def transmissao_espectro(mat, energias, pesos, espessura):
+    """Fração dos fótons de um espectro de linhas que atravessa x (cm)
+
+    O resultado tem a forma de `espessura`: uma matriz linhas × x
+    reduzida pelos pesos (rendimentos) numa única operação.
+    """
+    pesos = np.asarray(pesos, dtype=float)
+    x = np.asarray(espessura, dtype=float)
+    atenuacoes = np.exp(-np.multiply.outer(mu(mat, energias), x))
+    return np.tensordot(pesos / pesos.sum(), atenuacoes, axes=1)
+
+def espessura_para_transmissao(mat, energias, pesos, fracao, tolerancia=1e-10):
+    """Espessura (cm) em que o espectro transmitido cai para `fracao`
+
+    Newton sobre ln T(x), que é convexa e decrescente: partindo de
+    -ln(fracao)/μ_max (à esquerda da raiz) converge sem passar dela.
+    """
+    mus = mu(mat, np.atleast_1d(energias))
+    pesos = np.atleast_1d(np.asarray(pesos, dtype=float))
+    pesos = pesos / pesos.sum()
+    alvo = math.log(fracao)
+
+    x = -alvo / mus.max()
+    for _ in range(100):
+        termos = pesos * np.exp(-mus * x)
+        T = termos.sum()
+        passo = (math.log(T) - alvo) / (termos @ mus / T)
+        x += passo
+        if passo < tolerancia * max(x, 1.0):
+            break
+    return x
+
+# ============================================================
+# MISTURAS (REGRA DAS MISTURAS, EM CACHE)
+# ============================================================
+
+def _ln_mu_rho(mat, ln_E, abaixo):
+    """ln μ/ρ na grade ln_E; `abaixo` marca os pontos que pedem o limite
+    de baixo de uma borda"""
+    direita = np.searchsorted(mat.ln_energias, ln_E, side="right") - 1
+    esquerda = np.searchsorted(mat.ln_energias, ln_E, side="left") - 1
+    i = np.clip(np.where(abaixo, esquerda, direita), 0, len(mat.ln_energias) - 1)
+    return mat.ln_mu_rho[i] + mat.inclinacoes[i] * (ln_E - mat.ln_energias[i])
+
+def misturar(nome, densidade, fracoes, descricao="Mistura personalizada"):
+    """Material de uma mistura por frações em massa {componente: w}
+
+    Os componentes podem ser elementos ou compostos da tabela; as
+    frações são normalizadas. O resultado fica em cache pela
+    composição, e pode ser usado em qualquer função deste módulo.
+    """
+    componentes = tuple(sorted((str(c), float(w)) for c, w in fracoes.items() if w > 0))
+    if not componentes:
+        raise ValueError("A mistura precisa de ao menos um componente com fração positiva")
+    return _misturar(nome, float(densidade), componentes, descricao)
+
+@functools.lru_cache(maxsize=256)
+def _misturar(nome, densidade, componentes, descricao):
+    if not densidade > 0:
+        raise ValueError(f"Densidade inválida: {densidade}")
+    mats = [material(c) for c, _ in componentes]
+    pesos = np.array([w for _, w in componentes])
+    pesos /= pesos.sum()
+
+    # União das energias dos componentes; cada borda (energia repetida
+    # numa tabela) entra duas vezes, a primeira pedindo o valor de baixo
+    bordas = np.unique(np.concatenate(
+        [m.ln_energias[1:][np.diff(m.ln_energias) == 0] for m in mats]))
+    ln_E = np.sort(np.concatenate([np.unique(np.concatenate([m.ln_energias for m in mats])),
+                                   bordas]))
+    abaixo = np.append(ln_E[:-1] == ln_E[1:], False)
+
+    # Uma linha por componente; a mistura é uma única redução pelos pesos
+    ln_componentes = np.stack([_ln_mu_rho(m, ln_E, abaixo) for m in mats])
+    ln_mistura = np.log(pesos @ np.exp(ln_componentes))
+
+    passo = np.diff(ln_E)
+    inclinacoes = np.zeros(ln_E.size)
+    np.divide(np.diff(ln_mistura), passo, out=inclinacoes[:-1], where=passo > 0)
+
+    z_sobre_a = float(pesos @ np.array([m.z_sobre_a for m in mats]))
+    return Material(-1, nome, descricao, densidade, z_sobre_a, 0, 0.0,
+                    ln_E, ln_mistura, inclinacoes)
@@ -0,0 +1,70 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Benchmark de Inicialização
+=============================================================
+
+Mede o tempo de importação a frio de cada página do jogo.
+
+Cada medição roda num interpretador novo. O Streamlit é
+importado antes do cronômetro (todas as páginas dependem dele),
+de modo que o tempo reportado é o custo próprio da página:
+o seu módulo e as bibliotecas pesadas que ele puxa.
+
+EXECUTAR: python benchmarks/bench_inicializacao.py [--repeticoes N]
+=============================================================
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+PESADAS = ["numpy", "pandas", "matplotlib"]
+
+MEDICAO = """
+import json, sys, time
+sys.path.insert(0, {raiz!r})
+import streamlit
+inicio = time.perf_counter()
+__import__({modulo!r})
+duracao = time.perf_counter() - inicio
+print(json.dumps({{"segundos": duracao,
+                  "pesadas": [m for m in {pesadas!r} if m in sys.modules]}}))
+"""
+
+def medir(modulo, repeticoes):
+    """Mediana do tempo de importação a frio e bibliotecas carregadas"""
+    tempos = []
+    pesadas = []
+    for _ in range(repeticoes):
+        codigo = MEDICAO.format(raiz=str(RAIZ), modulo=modulo, pesadas=PESADAS)
+        saida = subprocess.run([sys.executable, "-c", codigo], capture_output=True,
+                               text=True, check=True, cwd=RAIZ)
+        resultado = json.loads(saida.stdout.strip().splitlines()[-1])
+        tempos.append(resultado["segundos"])
+        pesadas = resultado["pesadas"]
+    return statistics.median(tempos), pesadas
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[5])
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(RAIZ))
+    from fmgamepy_251214_152924 import PAGINAS
+
+    modulos = [("(entrada) fmgamepy_251214_152924", "fmgamepy_251214_152924")]
+    modulos += [(f"{icone} {titulo}", f"paginas.{modulo}") for titulo, icone, modulo, _ in PAGINAS]
+
+    print(f"{'Página':<36}{'Importação (ms)':>16}  Bibliotecas pesadas")
+    print("-" * 80)
+    for nome, modulo in modulos:
+        segundos, pesadas = medir(modulo, args.repeticoes)
+        print(f"{nome:<36}{segundos * 1000:>16.1f}  {', '.join(pesadas) or '-'}")
+
+if __name__ == "__main__":
+    main()
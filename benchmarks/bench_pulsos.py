@@ -0,0 +1,67 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Benchmark do Trem de Pulsos
+=============================================================
+
+Mede os eventos por segundo do modo evento a evento dos
+contadores de pulso (chegadas, discriminador com empilhamento
+e tempo morto), em série e no pool de processos, numa faixa de
+nτ que vai do detector folgado ao muito saturado.
+
+EXECUTAR: python benchmarks/bench_pulsos.py [--eventos N] [--contador NOME]
+=============================================================
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+CARGAS = (0.01, 0.1, 1.0, 3.0, 10.0, 100.0)  # nτ
+
+def medir(simular, *args, **kwargs):
+    """Duração de uma simulação e o seu resultado"""
+    inicio = time.perf_counter()
+    resultado = simular(*args, **kwargs)
+    return time.perf_counter() - inicio, resultado
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[5])
+    parser.add_argument("--eventos", type=int, default=10_000_000)
+    parser.add_argument("--contador", default="Geiger-Müller")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(RAIZ))
+    import contagem
+    import transporte
+
+    contador = contagem.CONTADORES[args.contador]
+    processos = transporte.processos_disponiveis()
+    # Aquece o pool (a criação dos processos não entra na medição)
+    transporte.obter_executor().submit(int).result()
+
+    print(f"{args.eventos:,} eventos, {contador.nome} (τ = {contador.tempo_morto:g} µs), "
+          f"pool com {processos} processos")
+    for modelo in contagem.MODELOS_TEMPO_MORTO:
+        print(f"\n{modelo}")
+        print(f"{'nτ':>8}{'Série (ev/s)':>16}{'Pool (ev/s)':>16}{'Ganho':>8}{'m/n':>10}{'Modelo':>10}")
+        print("-" * 68)
+        for carga in CARGAS:
+            taxa = carga / (contador.tempo_morto * 1e-6)
+            serie, resultado = medir(contagem.simular_trem, contador, taxa, args.eventos,
+                                     modelo=modelo, paralelo=False)
+            pool, resultado_pool = medir(contagem.simular_trem, contador, taxa, args.eventos,
+                                         modelo=modelo)
+            assert resultado_pool.registrados == resultado.registrados, "sementes não reprodutíveis"
+
+            # Modelo sobre a taxa acima do limiar, na mesma escala de m/n
+            acima = resultado.acima_limiar / resultado.tempo
+            esperado = (contagem.MODELOS_TEMPO_MORTO[modelo](acima, contador.tempo_morto * 1e-6)
+                        * resultado.tempo / resultado.eventos)
+            print(f"{carga:>8g}{resultado.eventos / serie:>16,.0f}{resultado.eventos / pool:>16,.0f}"
+                  f"{serie / pool:>7.1f}×{resultado.registrados / resultado.eventos:>10.4f}{esperado:>10.4f}")
+
+if __name__ == "__main__":
+    main()
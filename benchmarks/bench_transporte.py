@@ -0,0 +1,65 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Benchmark do Transporte Monte Carlo
+=============================================================
+
+Mede as histórias por segundo do transporte de fótons numa
+placa, em série e no pool de processos, para cada material do
+simulador de blindagem.
+
+A espessura é a de duas camadas deci-redutoras de cada
+material (redução de 100× em feixe estreito), o caso típico
+do simulador.
+
+EXECUTAR: python benchmarks/bench_transporte.py [--historias N] [--energia keV]
+=============================================================
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+def medir(simular, *args, **kwargs):
+    """Duração de uma simulação e o seu resultado"""
+    inicio = time.perf_counter()
+    resultado = simular(*args, **kwargs)
+    return time.perf_counter() - inicio, resultado
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[5])
+    parser.add_argument("--historias", type=int, default=2_000_000)
+    parser.add_argument("--energia", type=float, default=662)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(RAIZ))
+    import atenuacao
+    import fisica
+    import transporte
+    from paginas.simuladores import MATERIAIS_BLINDAGEM, meio_transporte
+
+    processos = transporte.processos_disponiveis()
+    # Aquece o pool (a criação dos processos não entra na medição)
+    transporte.obter_executor().submit(int).result()
+
+    print(f"{args.historias:,} histórias de {args.energia:g} keV, pool com {processos} processos")
+    print(f"{'Material':<20}{'x (cm)':>8}{'Série (hist/s)':>18}{'Pool (hist/s)':>18}{'Ganho':>8}{'Buildup':>9}")
+    print("-" * 81)
+    for material in MATERIAIS_BLINDAGEM:
+        meio = meio_transporte(atenuacao.material(MATERIAIS_BLINDAGEM[material]))
+        mu = float(transporte.mu_total(meio, args.energia))
+        x = float(fisica.espessura_para_reducao(mu, 100))
+
+        serie, resultado = medir(transporte.simular_placa, meio, args.energia, x,
+                                 args.historias, paralelo=False)
+        pool, resultado_pool = medir(transporte.simular_placa, meio, args.energia, x,
+                                     args.historias)
+        assert resultado_pool.transmitidos == resultado.transmitidos, "sementes não reprodutíveis"
+
+        print(f"{material:<20}{x:>8.2f}{args.historias / serie:>18,.0f}"
+              f"{args.historias / pool:>18,.0f}{serie / pool:>7.1f}×{resultado.buildup(args.energia)[0]:>9.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Projeto de Blindagens
+=============================================================
+
+Cálculos de projeto de blindagem sobre as tabelas de
+atenuacao.py, sem nenhuma dependência do Streamlit.
+
+Otimizador de camadas: procura pilhas de até N materiais que
+levem a transmissão de feixe estreito ao alvo com o menor
+custo, massa por área ou espessura total. Em feixe estreito a
+ordem das camadas não altera a transmissão,
+
+    T = Σₖ yₖ · exp(-Σᵢ μᵢₖ·xᵢ) / Σₖ yₖ,
+
+então cada combinação de materiais é avaliada uma vez: as
+camadas livres percorrem uma grade de espessuras (uma única
+multiplicação de matrizes para todos os pontos), as pilhas
+que já violam as restrições ou já atingem o alvo sem a última
+camada são podadas, e a espessura da última camada sai por
+Newton vetorizado. Das pilhas viáveis fica a fronteira de
+Pareto dos objetivos escolhidos.
+
+Barreiras de salas (no estilo da NCRP 147/151): uma tabela com
+uma linha por barreira e tipo (primária, espalhamento do
+paciente ou fuga do cabeçote) é resolvida de uma vez,
+
+    primária:      B = P·d² / (W·U·T)
+    espalhamento:  B = P·d_esp²·d² / (a(θ)·W·T·F/400)
+    fuga:          B = P·d² / (10⁻³·W·T)
+
+e a espessura é x = -ln(B)/μ, com μ da tabela de atenuação na
+energia efetiva da linha (a do fóton espalhado a θ, pela
+fórmula de Compton, para o espalhamento). É uma estimativa de
+feixe estreito, sem buildup.
+=============================================================
+"""
+
+import bisect
+import itertools
+import math
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+import atenuacao
+import fisica
+
+# Preços de referência (R$/kg) para o objetivo de custo
+CUSTO_POR_KG = {
+    "Pb": 25.0,
+    "W": 450.0,
+    "Aço": 9.0,
+    "Cu": 60.0,
+    "Al": 25.0,
+    "Concreto comum": 0.35,
+    "Concreto baritado": 1.2,
+    "Água": 0.01,
+    "Polietileno": 15.0,
+    "Polietileno borado": 45.0,
+    "Vidro plumbífero": 250.0,
+}
+
+OBJETIVOS = {
+    "custo": "Custo (R$/m²)",
+    "massa": "Massa (kg/m²)",
+    "espessura": "Espessura total (cm)",
+}
+
+KG_M2_POR_G_CM2 = 10.0
+ESPESSURA_DESPREZIVEL = 1e-3  # fração da espessura do material sozinho
+
+# ============================================================
+# OTIMIZADOR DE CAMADAS
+# ============================================================
+
+class ResultadoCamadas(NamedTuple):
+    """Pilhas viáveis avaliadas e a fronteira de Pareto entre elas"""
+    materiais: tuple          # nomes na tabela de atenuação (colunas de `espessuras`)
+    espessuras: np.ndarray    # pilhas × materiais (cm; 0 = material ausente)
+    custo: np.ndarray         # R$/m²
+    massa: np.ndarray         # kg/m²
+    espessura_total: np.ndarray  # cm
+    fronteira: np.ndarray     # índices das pilhas não dominadas
+
+    def objetivo(self, nome):
+        return {"custo": self.custo, "massa": self.massa,
+                "espessura": self.espessura_total}[nome]
+
+    def tabela(self, indices=None):
+        """DataFrame das pilhas (por padrão, só a fronteira), por custo crescente"""
+        indices = self.fronteira if indices is None else np.asarray(indices)
+        espessuras = self.espessuras[indices]
+        df = pd.DataFrame({
+            "Pilha": [descrever_pilha(self.materiais, linha) for linha in espessuras],
+            "Camadas": (espessuras > 0).sum(axis=1),
+            OBJETIVOS["espessura"]: self.espessura_total[indices],
+            OBJETIVOS["massa"]: self.massa[indices],
+            OBJETIVOS["custo"]: self.custo[indices],
+        })
+        for j, nome in enumerate(self.materiais):
+            df[f"{nome} (cm)"] = espessuras[:, j]
+        return df.sort_values(OBJETIVOS["custo"], ignore_index=True)
+
+def descrever_pilha(materiais, espessuras):
+    """Ex.: "Pb 0.42 cm + Concreto comum 12.3 cm" (camadas mais densas primeiro)"""
+    camadas = [(atenuacao.material(nome).densidade, nome, x)
+               for nome, x in zip(materiais, espessuras) if x > 0]
+    return " + ".join(f"{nome} {x:.3g} cm" for _, nome, x in sorted(camadas, reverse=True))
+
+def fronteira_pareto(objetivos):
+    """Índices das linhas não dominadas de `objetivos` (até 3 colunas, minimização)
+
+    Varredura em ordem lexicográfica: um ponto só pode ser dominado
+    por pontos anteriores. Com dois objetivos basta o mínimo
+    acumulado do segundo; com três, uma escada (y crescente, z
+    decrescente) dos pontos já mantidos, consultada por busca
+    binária (algoritmo de Kung), em O(n log n).
+    """
+    objetivos = np.asarray(objetivos, dtype=float).reshape(len(objetivos), -1)
+    colunas = objetivos.shape[1]
+    if colunas > 3:
+        raise ValueError("A fronteira de Pareto aceita no máximo 3 objetivos")
+    ordem = np.lexsort(objetivos.T[::-1])
+    pontos = objetivos[ordem]
+
+    if colunas == 1:
+        return ordem[:1]
+    if colunas == 2:
+        melhor_antes = np.minimum.accumulate(np.concatenate([[math.inf], pontos[:-1, 1]]))
+        return np.sort(ordem[pontos[:, 1] < melhor_antes])
+
+    ys, zs, mantidos = [], [], []
+    for indice, (y, z) in zip(ordem.tolist(), pontos[:, 1:].tolist()):
+        i = bisect.bisect_right(ys, y)
+        if i and zs[i - 1] <= z:
+            continue
+        # O novo ponto tira da escada os que ele domina em (y, z)
+        inicio = fim = bisect.bisect_left(ys, y)
+        while fim < len(ys) and zs[fim] >= z:
+            fim += 1
+        ys[inicio:fim], zs[inicio:fim] = [y], [z]
+        mantidos.append(indice)
+    return np.sort(np.array(mantidos, dtype=int))
+
+def _resolver_ultima(parcial, mu, alvo, iteracoes=60):
+    """x da última camada com ln Σₖ Pₖ·e^(-μₖx) = alvo, para cada coluna de P
+
+    Newton vetorizado; ln T(x) é convexa e decrescente, e o ponto de
+    partida fica à esquerda da raiz, então nenhuma coluna passa dela.
+    """
+    x = (np.log(parcial.sum(axis=0)) - alvo) / mu.max()
+    for _ in range(iteracoes):
+        termos = parcial * np.exp(-np.multiply.outer(mu, x))
+        T = termos.sum(axis=0)
+        passo = (np.log(T) - alvo) / ((mu @ termos) / T)
+        x = x + passo
+        if np.all(passo < 1e-9 * np.maximum(x, 1.0)):
+            break
+    return x
+
+def otimizar_camadas(materiais, energias, pesos, transmissao_alvo, max_camadas=3,
+                     pontos_por_camada=40, objetivos=("custo", "espessura"),
+                     espessura_max=math.inf, massa_max=math.inf, custo_max=math.inf,
+                     custos_por_kg=None):
+    """Pilhas de até `max_camadas` materiais que atingem a transmissão alvo
+
+    `energias`/`pesos` descrevem o espectro de linhas da fonte. As
+    restrições (cm, kg/m², R$/m²) podam as pilhas já na grade das
+    camadas livres. Cada combinação tem no máximo pontos_por_camada²
+    pilhas na grade: com 4 camadas as 3 livres ficam com uma grade
+    mais grossa (~12 pontos para 40), o que mantém a busca abaixo de
+    1 s com 8 materiais. Retorna um ResultadoCamadas com todas as pilhas
+    viáveis e a fronteira de Pareto de `objetivos`.
+    """
+    materiais = tuple(materiais)
+    custos_por_kg = CUSTO_POR_KG if custos_por_kg is None else custos_por_kg
+    mats = [atenuacao.material(nome) for nome in materiais]
+    mus = np.array([atenuacao.mu(m, np.atleast_1d(energias)) for m in mats])  # materiais × linhas
+    pesos = np.atleast_1d(np.asarray(pesos, dtype=float))
+    pesos = pesos / pesos.sum()
+    alvo = math.log(transmissao_alvo)
+
+    # Por cm de cada material: kg/m² e R$/m²
+    massa_cm = np.array([m.densidade for m in mats]) * KG_M2_POR_G_CM2
+    custo_cm = massa_cm * np.array([custos_por_kg.get(nome, 0.0) for nome in materiais])
+    # Espessura de cada material sozinho: limite da grade das camadas livres
+    sozinho = np.array([atenuacao.espessura_para_transmissao(m, energias, pesos, transmissao_alvo)
+                        for m in mats])
+
+    blocos = []
+    for n in range(1, min(max_camadas, len(mats)) + 1):
+        for combinacao in itertools.combinations(range(len(mats)), n):
+            *livres, ultima = combinacao
+            pontos = min(pontos_por_camada, round(pontos_por_camada ** (2 / max(len(livres), 1))))
+            grades = [np.linspace(0, sozinho[i], pontos + 2)[1:-1] for i in livres]
+            X = np.stack([g.ravel() for g in np.meshgrid(*grades, indexing="ij")]) \
+                if livres else np.zeros((0, 1))
+
+            # Poda 1: restrições já violadas pelas camadas livres
+            viavel = ((X.sum(axis=0) < espessura_max)
+                      & (massa_cm[livres] @ X < massa_max)
+                      & (custo_cm[livres] @ X < custo_max))
+            X = X[:, viavel]
+
+            # Poda 2: pilhas que atingem o alvo sem a última camada
+            parcial = pesos[:, None] * np.exp(-(mus[livres].T @ X))  # linhas × pilhas
+            falta = parcial.sum(axis=0) > transmissao_alvo
+            X, parcial = X[:, falta], parcial[:, falta]
+            if not X.shape[1]:
+                continue
+
+            # Poda 3: última camada desprezível (a pilha menor já foi avaliada)
+            x_ultima = _resolver_ultima(parcial, mus[ultima], alvo)
+            relevante = x_ultima > ESPESSURA_DESPREZIVEL * sozinho[ultima]
+            espessuras = np.zeros((len(mats), int(relevante.sum())))
+            espessuras[livres] = X[:, relevante]
+            espessuras[ultima] = x_ultima[relevante]
+            blocos.append(espessuras)
+
+    espessuras = np.concatenate(blocos, axis=1).T if blocos else np.zeros((0, len(mats)))
+    total, massa, custo = espessuras.sum(axis=1), espessuras @ massa_cm, espessuras @ custo_cm
+    viavel = (total <= espessura_max) & (massa <= massa_max) & (custo <= custo_max)
+    espessuras, total, massa, custo = espessuras[viavel], total[viavel], massa[viavel], custo[viavel]
+
+    resultado = ResultadoCamadas(materiais, espessuras, custo, massa, total, np.zeros(0, dtype=int))
+    if len(espessuras):
+        colunas = np.column_stack([resultado.objetivo(nome) for nome in objetivos])
+        resultado = resultado._replace(fronteira=fronteira_pareto(colunas))
+    return resultado
+
+# ============================================================
+# BARREIRAS DE SALAS (NCRP)
+# ============================================================
+
+TIPOS_BARREIRA = ("primária", "espalhamento", "fuga")
+FRACAO_FUGA = 1e-3       # fuga do cabeçote: 0,1% do feixe primário a 1 m
+AREA_CAMPO_REFERENCIA = 400.0  # cm² (campo 20 × 20 das frações de espalhamento)
+
+# Fração de espalhamento a(θ) do paciente a 1 m, campo de 400 cm² (6 MV)
+ANGULOS_ESPALHAMENTO = np.array([10, 20, 30, 45, 60, 90, 135, 150], dtype=float)
+FRACOES_ESPALHAMENTO = np.array([1.04e-2, 6.73e-3, 2.77e-3, 1.39e-3,
+                                 8.24e-4, 4.26e-4, 3.00e-4, 2.87e-4])
+
+COLUNAS_BARREIRAS = {
+    "barreira": "string",
+    "tipo": pd.CategoricalDtype(list(TIPOS_BARREIRA)),
+    "material": "string",          # nome na tabela de atenuação (ou receita)
+    "energia_keV": "float64",      # energia efetiva do feixe primário
+    "carga_trabalho": "float64",   # W, Gy/semana a 1 m
+    "fator_uso": "float64",        # U (só barreiras primárias)
+    "fator_ocupacao": "float64",   # T
+    "distancia": "float64",        # m, da fonte (ou do paciente) ao ponto protegido
+    "limite": "float64",           # P, mSv/semana
+    "distancia_espalhador": "float64",  # m, alvo → paciente (espalhamento)
+    "angulo": "float64",           # graus, ângulo de espalhamento
+    "area_campo": "float64",       # cm², campo no paciente
+}
+
+# Colunas opcionais e seus valores padrão
+PADROES_BARREIRAS = {"fator_uso": 1.0, "distancia_espalhador": 1.0, "angulo": 90.0,
+                     "area_campo": AREA_CAMPO_REFERENCIA}
+
+def tipar_barreiras(tabela):
+    """Converte e valida a tabela de barreiras (um DataFrame)"""
+    faltando = set(COLUNAS_BARREIRAS) - set(PADROES_BARREIRAS) - set(tabela.columns)
+    if faltando:
+        raise ValueError(f"Colunas ausentes na tabela de barreiras: {', '.join(sorted(faltando))}")
+
+    tabela = tabela.assign(**{c: v for c, v in PADROES_BARREIRAS.items() if c not in tabela.columns})
+    tabela = tabela[list(COLUNAS_BARREIRAS)].astype(COLUNAS_BARREIRAS).reset_index(drop=True)
+    tabela = tabela.fillna({c: v for c, v in PADROES_BARREIRAS.items()})
+
+    if tabela["tipo"].isna().any():
+        linha = int(tabela.index[tabela["tipo"].isna()][0])
+        raise ValueError(f"Tipo de barreira desconhecido no registro {linha + 1} "
+                         f"(use {', '.join(TIPOS_BARREIRA)})")
+    for material in tabela["material"].unique():
+        atenuacao.material(material)  # KeyError com o nome, se desconhecido
+    numericas = [c for c, t in COLUNAS_BARREIRAS.items() if t == "float64"]
+    if (tabela[numericas].isna() | (tabela[numericas] <= 0)).any(axis=None):
+        raise ValueError("Valores numéricos ausentes ou não positivos na tabela de barreiras")
+    return tabela
+
+def ler_barreiras(arquivo):
+    """Tabela de barreiras de um CSV (caminho ou arquivo aberto)"""
+    return tipar_barreiras(pd.read_csv(arquivo))
+
+def calcular_barreiras(tabela):
+    """Transmissão exigida e espessura de todas as barreiras numa passada
+
+    Acrescenta: energia_efetiva_keV, transmissao (B), numero_tvl,
+    mu (cm⁻¹), tvl_cm e espessura_cm.
+    """
+    t = tipar_barreiras(tabela)
+    P = t["limite"].to_numpy() * 1e-3  # Sv ≈ Gy por semana
+    W, T = t["carga_trabalho"].to_numpy(), t["fator_ocupacao"].to_numpy()
+    d2 = t["distancia"].to_numpy() ** 2
+    tipo = t["tipo"].cat.codes.to_numpy()
+    angulo = t["angulo"].to_numpy()
+
+    a = np.exp(np.interp(angulo, ANGULOS_ESPALHAMENTO, np.log(FRACOES_ESPALHAMENTO)))
+    fator_campo = t["area_campo"].to_numpy() / AREA_CAMPO_REFERENCIA
+    transmissao = np.select(
+        [tipo == 0, tipo == 1, tipo == 2],
+        [P * d2 / (W * t["fator_uso"].to_numpy() * T),
+         P * d2 * t["distancia_espalhador"].to_numpy() ** 2 / (a * W * T * fator_campo),
+         P * d2 / (FRACAO_FUGA * W * T)],
+    )
+
+    # Fóton espalhado a θ perde energia (Compton); primária e fuga usam a do feixe
+    E = t["energia_keV"].to_numpy()
+    E_efetiva = np.where(tipo == 1, fisica.energia_compton(E, angulo), E)
+
+    # μ por material, vetorizado sobre todas as linhas de cada um
+    mu = np.empty(len(t))
+    codigos, materiais = pd.factorize(t["material"])
+    for i, nome in enumerate(materiais):
+        linhas = codigos == i
+        mu[linhas] = atenuacao.mu(atenuacao.material(nome), E_efetiva[linhas])
+
+    numero_tvl = np.maximum(-np.log10(transmissao), 0.0)
+    tvl = np.log(10) / mu
+    return t.assign(
+        energia_efetiva_keV=E_efetiva,
+        transmissao=transmissao,
+        numero_tvl=numero_tvl,
+        mu=mu,
+        tvl_cm=tvl,
+        espessura_cm=numero_tvl * tvl,
+    )
+
+def combinar_secundarias(resultado):
+    """Espessura final por barreira (espalhamento e fuga na mesma parede)
+
+    Regra da NCRP: vale a maior espessura; se a outra ficar a menos
+    de uma TVL dela, soma-se uma HVL.
+    """
+    ordenado = resultado.sort_values("espessura_cm", ascending=False)
+    grupos = ordenado.groupby("barreira", sort=False)
+    maior = grupos.nth(0).set_index("barreira").reindex(resultado["barreira"].unique())
+    segunda = grupos.nth(1).set_index("barreira")["espessura_cm"].reindex(maior.index)
+
+    soma_hvl = (maior["espessura_cm"] - segunda < maior["tvl_cm"]).to_numpy()
+    hvl = maior["tvl_cm"] * math.log10(2)
+    return pd.DataFrame({
+        "material": maior["material"],
+        "tipo_dominante": maior["tipo"],
+        "espessura_dominante_cm": maior["espessura_cm"],
+        "hvl_somada_cm": np.where(soma_hvl, hvl, 0.0),
+        "espessura_final_cm": maior["espessura_cm"] + np.where(soma_hvl, hvl, 0.0),
+    }).reset_index()
+
+def relatorio_barreiras(resultado, titulo="Projeto de barreiras"):
+    """Relatório em Markdown: dados de entrada, cálculo por linha e espessuras finais"""
+    final = combinar_secundarias(resultado)
+
+    def tabela_markdown(df):
+        linhas = ["| " + " | ".join(df.columns) + " |", "|" + "---|" * len(df.columns)]
+        for registro in df.itertuples(index=False):
+            linhas.append("| " + " | ".join(
+                f"{v:.4g}" if isinstance(v, float) else str(v) for v in registro) + " |")
+        return "\n".join(linhas)
+
+    calculo = resultado[["barreira", "tipo", "material", "distancia", "fator_ocupacao", "limite",
+                         "energia_efetiva_keV", "transmissao", "numero_tvl", "tvl_cm",
+                         "espessura_cm"]]
+    return "\n\n".join([
+        f"# {titulo}",
+        "Estimativa de feixe estreito (sem buildup) com os coeficientes de atenuação do jogo; "
+        "P em mSv/semana, W em Gy/semana a 1 m, distâncias em m, espessuras em cm.",
+        "## Cálculo por barreira e tipo de radiação",
+        tabela_markdown(calculo),
+        "## Espessuras finais",
+        tabela_markdown(final),
+    ]) + "\n"
+
+def barreiras_exemplo():
+    """Bunker de acelerador de 6 MV (W = 450 Gy/semana a 1 m)"""
+    return pd.DataFrame([
+        ("Primária - corredor", "primária", "Concreto comum", 2000.0, 450.0, 0.25, 0.2, 7.0, 0.02),
+        ("Secundária - corredor", "espalhamento", "Concreto comum", 2000.0, 450.0, 1.0, 0.2, 5.5, 0.02),
+        ("Secundária - corredor", "fuga", "Concreto comum", 2000.0, 450.0, 1.0, 0.2, 5.5, 0.02),
+        ("Sala de controle", "espalhamento", "Concreto comum", 2000.0, 450.0, 1.0, 1.0, 6.5, 0.1),
+        ("Sala de controle", "fuga", "Concreto comum", 2000.0, 450.0, 1.0, 1.0, 6.5, 0.1),
+        ("Teto", "primária", "Concreto baritado", 2000.0, 450.0, 0.25, 0.05, 5.0, 0.02),
+    ], columns=["barreira", "tipo", "material", "energia_keV", "carga_trabalho",
+                "fator_uso", "fator_ocupacao", "distancia", "limite"])
@@ -0,0 +1,160 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Cadeias de Decaimento (Bateman)
+=============================================================
+
+Solução das equações de Bateman para cadeias pai → filhas,
+sem nenhuma dependência do Streamlit.
+
+Uma cadeia é o sistema linear dN/dt = M·N, em que M tem -λᵢ na
+diagonal e b·λ_pai nas posições (filha, pai), b sendo a fração
+de ramificação. Com os membros em ordem (pais antes das filhas)
+M é triangular inferior, e seus autovetores saem por
+substituição direta. A decomposição M = V·diag(-λ)·V⁻¹ é
+calculada uma vez por cadeia e fica em cache; depois disso
+
+    N(t) = V · [ (V⁻¹·N₀) ⊙ e^(-λt) ]
+
+avalia todos os membros em toda a grade de tempos numa única
+operação matricial.
+
+Tempos em segundos; atividades na unidade de A₀.
+=============================================================
+"""
+
+import functools
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+import nuclideos
+
+# ============================================================
+# DEFINIÇÃO DAS CADEIAS
+# ============================================================
+
+class Cadeia(NamedTuple):
+    """Membros em ordem de decaimento e ramificações (pai, filha, fração)"""
+    nomes: tuple
+    meias_vidas: tuple   # s (ESTAVEL para nuclídeos estáveis)
+    ramificacoes: tuple  # ((índice do pai, índice da filha, fração), ...)
+
+def cadeia_ramificada(nomes, ramificacoes):
+    """Cadeia da tabela de nuclídeos com ramificações explícitas"""
+    meias_vidas = tuple(nuclideos.nuclideo(nome).meia_vida for nome in nomes)
+    return Cadeia(tuple(nomes), meias_vidas, tuple(ramificacoes))
+
+def cadeia_linear(*nomes):
+    """Cadeia A → B → C ... da tabela de nuclídeos"""
+    return cadeia_ramificada(nomes, ((i, i + 1, 1.0) for i in range(len(nomes) - 1)))
+
+def constantes_decaimento(cadeia):
+    """λ = ln2 / T de cada membro (s⁻¹, zero para estáveis)"""
+    return math.log(2) / np.asarray(cadeia.meias_vidas, dtype=float)
+
+# Geradores e cadeias clássicas: (cadeia, índice do membro eluível ou None)
+CADEIAS = {
+    "Mo-99 → Tc-99m (gerador de tecnécio)": (cadeia_ramificada(
+        ("Mo-99", "Tc-99m", "Tc-99"), ((0, 1, 0.876), (0, 2, 0.124), (1, 2, 1.0))
+    ), 1),
+    "Ge-68 → Ga-68 (gerador de gálio)": (cadeia_linear("Ge-68", "Ga-68", "Zn-68"), 1),
+    "Sr-90 → Y-90 (equilíbrio secular)": (cadeia_linear("Sr-90", "Y-90", "Zr-90"), 1),
+    "Cs-137 → Ba-137m (ramificação)": (cadeia_ramificada(
+        ("Cs-137", "Ba-137m", "Ba-137"), ((0, 1, 0.944), (0, 2, 0.056), (1, 2, 1.0))
+    ), None),
+    "Rn-222 → Po-214 (filhos do radônio)": (cadeia_linear(
+        "Rn-222", "Po-218", "Pb-214", "Bi-214", "Po-214", "Pb-210"
+    ), None),
+}
+
+# ============================================================
+# DECOMPOSIÇÃO ESPECTRAL (EM CACHE POR CADEIA)
+# ============================================================
+
+@functools.lru_cache(maxsize=64)
+def decomposicao(cadeia):
+    """(λ, V, V⁻¹) da matriz de Bateman da cadeia"""
+    lambdas = constantes_decaimento(cadeia)
+    n = len(lambdas)
+    if len(set(lambdas)) < n:
+        raise ValueError("Membros com a mesma meia-vida tornam a matriz de Bateman não diagonalizável")
+
+    M = np.diag(-lambdas)
+    for pai, filha, fracao in cadeia.ramificacoes:
+        if not pai < filha:
+            raise ValueError(f"Ramificação {cadeia.nomes[pai]} → {cadeia.nomes[filha]} "
+                             "fora de ordem (pais devem vir antes das filhas)")
+        M[filha, pai] += fracao * lambdas[pai]
+
+    # Autovetor do autovalor -λₖ: zero antes de k, 1 em k e, para i > k,
+    # vᵢ = Σⱼ Mᵢⱼ·vⱼ / (λᵢ - λₖ) (substituição direta na matriz triangular)
+    V = np.zeros((n, n))
+    for k in range(n):
+        V[k, k] = 1.0
+        for i in range(k + 1, n):
+            V[i, k] = M[i, k:i] @ V[k:i, k] / (lambdas[i] - lambdas[k])
+
+    return lambdas, V, np.linalg.inv(V)
+
+def evoluir(cadeia, N0, tempos):
+    """Números de átomos N (membros × tempos) a partir de N₀ em t = 0"""
+    lambdas, V, V_inv = decomposicao(cadeia)
+    coeficientes = V_inv @ np.asarray(N0, dtype=float)
+    tempos = np.atleast_1d(np.asarray(tempos, dtype=float))
+    return V @ (coeficientes[:, None] * np.exp(-np.outer(lambdas, tempos)))
+
+def atividades(cadeia, A0_pai, tempos):
+    """Atividade de cada membro (membros × tempos) partindo só do pai"""
+    lambdas = constantes_decaimento(cadeia)
+    N0 = np.zeros(len(lambdas))
+    N0[0] = A0_pai / lambdas[0]
+    return lambdas[:, None] * evoluir(cadeia, N0, tempos)
+
+def atividades_com_eluicao(cadeia, A0_pai, tempos, instantes, membro, eficiencia=1.0):
+    """Atividades com a filha `membro` extraída nos instantes dados
+
+    Retorna (atividades membros × tempos, atividade eluída em cada
+    instante). Entre duas eluições o estado evolui por `evoluir`,
+    num único passe sobre o trecho da grade.
+    """
+    lambdas = constantes_decaimento(cadeia)
+    tempos = np.asarray(tempos, dtype=float)
+    resultado = np.empty((len(lambdas), tempos.size))
+    eluido = []
+
+    N = np.zeros(len(lambdas))
+    N[0] = A0_pai / lambdas[0]
+    inicio = 0.0
+    for fim in [*sorted(instantes), math.inf]:
+        trecho = (tempos >= inicio) & (tempos < fim)
+        resultado[:, trecho] = lambdas[:, None] * evoluir(cadeia, N, tempos[trecho] - inicio)
+        if math.isinf(fim):
+            break
+        N = evoluir(cadeia, N, fim - inicio)[:, 0]
+        eluido.append(lambdas[membro] * N[membro] * eficiencia)
+        N[membro] *= 1 - eficiencia
+        inicio = fim
+
+    return resultado, np.array(eluido)
+
+# ============================================================
+# EQUILÍBRIO PAI-FILHA
+# ============================================================
+
+def tipo_equilibrio(T_pai, T_filha):
+    """'secular', 'transiente' ou 'sem equilíbrio' para um par pai-filha"""
+    if T_pai <= T_filha:
+        return "sem equilíbrio"
+    return "secular" if T_pai / T_filha > 100 else "transiente"
+
+def razao_equilibrio(T_pai, T_filha, fracao=1.0):
+    """A_filha / A_pai no equilíbrio: b·λ_f / (λ_f - λ_p)"""
+    if T_pai <= T_filha:
+        return math.nan
+    return fracao * T_pai / (T_pai - T_filha)
+
+def tempo_maximo_filha(T_pai, T_filha):
+    """Instante do máximo da atividade da filha: ln(λ_f/λ_p) / (λ_f - λ_p)"""
+    lp, lf = math.log(2) / T_pai, math.log(2) / T_filha
+    return math.log(lf / lp) / (lf - lp)
@@ -0,0 +1,338 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Campo de Taxa de Dose
+=============================================================
+
+Mapa da taxa de kerma no ar numa grade de células, para uma ou
+mais fontes pontuais, sem nenhuma dependência do Streamlit.
+
+Cada fonte contribui com a lei do inverso do quadrado mais a
+atenuação no ar e nos obstáculos (paredes, armários, bancadas)
+cruzados ao longo do raio, linha a linha do espectro:
+
+    K̇(d) = Γ·A / d² · Σ wₗ·e^(-μ_ar·d - Σₘ μₘ·Lₘ)
+
+com d medido do centro da fonte ao centro de cada célula e Lₘ o
+comprimento equivalente de cada material no caminho. O mapa
+inteiro sai de operações em broadcasting (linha × coluna) por
+fonte, é calculado uma vez por cenário e fica em cache no
+processo; depois disso cada medição é uma consulta O(1).
+
+Os obstáculos são retângulos de células de material uniforme.
+Os comprimentos Lₘ vêm do método de Siddon: o raio fonte → célula
+é parametrizado por α ∈ [0, 1] e os planos x e y das bordas de
+cada obstáculo dão o trecho [α_entrada, α_saída] dentro dele. Os
+α dos planos x dependem só da coluna e os dos planos y só da
+linha, de modo que a grade inteira sai de dois vetores e um
+broadcasting por obstáculo. Os comprimentos ficam em cache pelo
+leiaute e pela posição da fonte, e são reaproveitados quando só
+as atividades ou as outras fontes mudam.
+
+Posições em células, distâncias em metros, atividades em MBq e
+taxas em µGy/h.
+=============================================================
+"""
+
+import functools
+from typing import NamedTuple
+
+import numpy as np
+
+import atenuacao
+import nuclideos
+
+LADO_MAXIMO = 1000        # células por lado
+DISTANCIA_MINIMA = 0.25   # m: o detector nunca encosta na fonte
+MAPAS_EM_CACHE = 16
+
+# Detectores da missão (taxa de kerma no ar → leitura)
+CPS_POR_TAXA_GM = 100.0       # cps por µGy/h (Geiger-Müller de janela fina)
+SATURACAO_GM = 50_000.0       # cps
+VOLUME_CAMARA = 1.0           # L (câmara de ionização de levantamento)
+DENSIDADE_AR = 1.205e-3       # kg/L a 20 °C
+W_AR = 33.97                  # J/C (energia média por par de íons no ar)
+
+class Fonte(NamedTuple):
+    """Fonte pontual no centro de uma célula"""
+    x: int
+    y: int
+    atividade: float          # MBq
+    nuclideo: str = "Cs-137"
+
+class Obstaculo(NamedTuple):
+    """Retângulo de células (x0..x1, y0..y1, inclusivos) de um material
+
+    `espessura` é o material atravessado (cm) por um raio que cruza
+    o obstáculo perpendicularmente ao seu lado menor: uma parede de
+    15 cm desenhada com uma célula de 1 m de largura é 15% concreto.
+    """
+    nome: str
+    material: str
+    espessura: float  # cm
+    x0: int
+    y0: int
+    x1: int
+    y1: int
+
+    def cobre(self, x, y):
+        return self.x0 <= x <= self.x1 and self.y0 <= y <= self.y1
+
+class Cenario(NamedTuple):
+    """Grade largura × altura de células quadradas, as fontes e os obstáculos"""
+    largura: int
+    altura: int
+    fontes: tuple
+    tamanho_celula: float = 1.0  # m
+    obstaculos: tuple = ()
+
+    def validar(self):
+        if not (0 < self.largura <= LADO_MAXIMO and 0 < self.altura <= LADO_MAXIMO):
+            raise ValueError(f"Grade {self.largura}×{self.altura} fora do limite "
+                             f"de {LADO_MAXIMO}×{LADO_MAXIMO} células")
+        for fonte in self.fontes:
+            if not (0 <= fonte.x < self.largura and 0 <= fonte.y < self.altura):
+                raise ValueError(f"Fonte fora da grade: ({fonte.x}, {fonte.y})")
+        for obstaculo in self.obstaculos:
+            if not (0 <= obstaculo.x0 <= obstaculo.x1 < self.largura
+                    and 0 <= obstaculo.y0 <= obstaculo.y1 < self.altura):
+                raise ValueError(f"Obstáculo fora da grade: {obstaculo.nome}")
+        return self
+
+# ============================================================
+# MAPAS (UMA VEZ POR CENÁRIO)
+# ============================================================
+
+def _coordenadas(cenario):
+    """Colunas (1 × largura) e linhas (altura × 1) em metros"""
+    passo = cenario.tamanho_celula
+    return (np.arange(cenario.largura, dtype=float)[None, :] * passo,
+            np.arange(cenario.altura, dtype=float)[:, None] * passo)
+
+def _trecho(origem, destinos, inicio, fim):
+    """α de entrada e de saída do raio no intervalo [inicio, fim] de um eixo
+
+    `destinos` são as coordenadas das células nesse eixo; raios
+    paralelos ao eixo ficam inteiros dentro ou inteiros fora.
+    """
+    delta = destinos - origem
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a, b = (inicio - origem) / delta, (fim - origem) / delta
+    dentro = inicio <= origem <= fim
+    paralelo = delta == 0
+    entrada = np.where(paralelo, -np.inf if dentro else np.inf, np.minimum(a, b))
+    saida = np.where(paralelo, np.inf if dentro else -np.inf, np.maximum(a, b))
+    return entrada, saida
+
+def _alcance(origem, destinos, inicio, fim):
+    """Fatia das células cujo raio pode chegar ao intervalo [inicio, fim]
+
+    Vista de fora, a caixa só é cruzada por raios que terminam além
+    do seu plano mais próximo.
+    """
+    if origem < inicio:
+        return slice(int(np.searchsorted(destinos, inicio)), destinos.size)
+    if origem > fim:
+        return slice(0, int(np.searchsorted(destinos, fim, side="right")))
+    return slice(0, destinos.size)
+
+@functools.lru_cache(maxsize=MAPAS_EM_CACHE)
+def comprimentos(largura, altura, tamanho_celula, obstaculos, x_fonte, y_fonte):
+    """Material atravessado (m) do centro da fonte a cada célula, por material
+
+    Retorna (materiais, matriz materiais × altura × largura); os
+    obstáculos do mesmo material são somados.
+    """
+    x, y = _coordenadas(Cenario(largura, altura, (), tamanho_celula))
+    sx, sy = x_fonte * tamanho_celula, y_fonte * tamanho_celula
+
+    # Frações de α dentro de cada material; a distância multiplica no fim
+    materiais = tuple(dict.fromkeys(o.material for o in obstaculos))
+    caminhos = np.zeros((len(materiais), altura, largura), dtype=np.float32)
+    entrada = np.empty((altura, largura), dtype=np.float32)
+    saida = np.empty((altura, largura), dtype=np.float32)
+    meia = tamanho_celula / 2
+    for o in obstaculos:
+        x0, x1 = o.x0 * tamanho_celula - meia, o.x1 * tamanho_celula + meia
+        y0, y1 = o.y0 * tamanho_celula - meia, o.y1 * tamanho_celula + meia
+        colunas, linhas = _alcance(sx, x[0], x0, x1), _alcance(sy, y[:, 0], y0, y1)
+        entrada_x, saida_x = _trecho(sx, x[:, colunas], x0, x1)  # 1 × colunas
+        entrada_y, saida_y = _trecho(sy, y[linhas], y0, y1)      # linhas × 1
+        e, s = entrada[linhas, colunas], saida[linhas, colunas]
+        np.maximum(entrada_x.astype(np.float32), entrada_y.astype(np.float32), out=e)
+        np.maximum(e, 0.0, out=e)
+        np.minimum(saida_x.astype(np.float32), saida_y.astype(np.float32), out=s)
+        np.minimum(s, 1.0, out=s)
+        np.subtract(s, e, out=s)
+        np.maximum(s, 0.0, out=s)
+        s *= o.espessura / 100 / min(x1 - x0, y1 - y0)
+        caminhos[materiais.index(o.material), linhas, colunas] += s
+
+    caminhos *= np.hypot(x - sx, y - sy).astype(np.float32)
+    caminhos.flags.writeable = False
+    return materiais, caminhos
+
+@functools.lru_cache(maxsize=MAPAS_EM_CACHE)
+def contribuicoes(cenario):
+    """Taxa (µGy/h) de cada fonte em cada célula: fontes × altura × largura"""
+    cenario.validar()
+    x, y = _coordenadas(cenario)
+    passo = cenario.tamanho_celula
+    ar = atenuacao.material("Ar seco")
+
+    mapas = np.empty((len(cenario.fontes), cenario.altura, cenario.largura), dtype=np.float32)
+    for mapa, fonte in zip(mapas, cenario.fontes):
+        d = np.hypot(x - fonte.x * passo, y - fonte.y * passo)
+        materiais, caminhos = comprimentos(cenario.largura, cenario.altura, passo,
+                                           cenario.obstaculos, fonte.x, fonte.y)
+        np.maximum(d, DISTANCIA_MINIMA, out=d)
+
+        # Pesos das linhas pela energia emitida em cada uma; μ em m⁻¹
+        nuclideo = nuclideos.nuclideo(fonte.nuclideo)
+        pesos = nuclideo.rendimentos * nuclideo.energias
+        pesos = pesos / pesos.sum()
+        mu_ar = atenuacao.mu(ar, nuclideo.energias) * 100
+        mu_materiais = [atenuacao.mu(atenuacao.material(m), nuclideo.energias) * 100
+                        for m in materiais]
+
+        transmissao = np.zeros(d.shape)
+        for linha, peso in enumerate(pesos):
+            expoente = mu_ar[linha] * d
+            for mu, caminho in zip(mu_materiais, caminhos):
+                expoente = expoente + mu[linha] * caminho
+            transmissao += peso * np.exp(-expoente)
+
+        mapa[...] = nuclideo.gama * fonte.atividade / 1000 / d**2 * transmissao
+
+    mapas.flags.writeable = False
+    return mapas
+
+@functools.lru_cache(maxsize=MAPAS_EM_CACHE)
+def mapa_taxa_dose(cenario):
+    """Taxa de kerma no ar total (µGy/h) em cada célula: altura × largura"""
+    mapa = contribuicoes(cenario).sum(axis=0, dtype=np.float32)
+    mapa.flags.writeable = False
+    return mapa
+
+@functools.lru_cache(maxsize=MAPAS_EM_CACHE)
+def mapa_distancias(cenario):
+    """Distância (m) de cada célula à fonte mais próxima: altura × largura"""
+    cenario.validar()
+    x, y = _coordenadas(cenario)
+    passo = cenario.tamanho_celula
+
+    distancias = np.full((cenario.altura, cenario.largura), np.inf, dtype=np.float32)
+    for fonte in cenario.fontes:
+        np.minimum(distancias, np.hypot(x - fonte.x * passo, y - fonte.y * passo),
+                   out=distancias)
+    distancias.flags.writeable = False
+    return distancias
+
+# ============================================================
+# MEDIÇÕES (CONSULTAS O(1))
+# ============================================================
+
+def taxa_dose(cenario, x, y):
+    """Taxa de kerma no ar (µGy/h) na célula (x, y)"""
+    return float(mapa_taxa_dose(cenario)[y, x])
+
+def distancia_fonte(cenario, x, y):
+    """Distância (m) da célula (x, y) à fonte mais próxima"""
+    return float(mapa_distancias(cenario)[y, x])
+
+def fonte_na_celula(cenario, x, y):
+    """Índice da fonte na célula (x, y), ou None"""
+    for i, fonte in enumerate(cenario.fontes):
+        if (fonte.x, fonte.y) == (x, y):
+            return i
+    return None
+
+def fluencias(cenario, x, y):
+    """Linhas gama (keV) e fluências (fótons/cm²/s) de todas as fontes na célula (x, y)
+
+    A mesma atenuação de `contribuicoes`, linha a linha, com os
+    comprimentos em cache dos obstáculos.
+    """
+    passo = cenario.tamanho_celula
+    ar = atenuacao.material("Ar seco")
+    energias, fluxos = [np.empty(0)], [np.empty(0)]
+    for fonte in cenario.fontes:
+        d = max(float(np.hypot((x - fonte.x) * passo, (y - fonte.y) * passo)), DISTANCIA_MINIMA)
+        materiais, caminhos = comprimentos(cenario.largura, cenario.altura, passo,
+                                           cenario.obstaculos, fonte.x, fonte.y)
+        nuclideo = nuclideos.nuclideo(fonte.nuclideo)
+        expoente = atenuacao.mu(ar, nuclideo.energias) * 100 * d
+        for m, caminho in zip(materiais, caminhos):
+            mu = atenuacao.mu(atenuacao.material(m), nuclideo.energias) * 100
+            expoente = expoente + mu * caminho[y, x]
+        energias.append(nuclideo.energias)
+        fluxos.append(fonte.atividade * 1e6 * nuclideo.rendimentos / (4 * np.pi * (100 * d)**2)
+                      * np.exp(-expoente))
+    return np.concatenate(energias), np.concatenate(fluxos)
+
+def corrente_camara(taxa, volume=VOLUME_CAMARA):
+    """Corrente (A) de uma câmara de ionização aberta de `volume` litros"""
+    return np.asarray(taxa) * 1e-6 / 3600 * DENSIDADE_AR * volume / W_AR
+
+# ============================================================
+# LEIAUTES
+# ============================================================
+
+# Sala de 10×10 m
+LEIAUTE_LABORATORIO = (
+    Obstaculo("Parede de concreto", "Concreto comum", 15.0, 6, 0, 6, 6),
+    Obstaculo("Parede de concreto", "Concreto comum", 15.0, 0, 4, 3, 4),
+    Obstaculo("Armário de chumbo", "Pb", 1.0, 1, 1, 2, 2),
+    Obstaculo("Cofre de rejeitos", "Aço", 5.0, 8, 1, 9, 2),
+    Obstaculo("Bancada", "Aço", 2.0, 2, 7, 4, 8),
+    Obstaculo("Bancada", "Aço", 2.0, 8, 6, 9, 7),
+)
+
+# Galpão de 200×200 m
+LEIAUTE_GALPAO = (
+    Obstaculo("Parede de concreto", "Concreto comum", 20.0, 100, 0, 100, 139),
+    Obstaculo("Parede de concreto", "Concreto comum", 20.0, 0, 60, 69, 60),
+    Obstaculo("Bunker de irradiação", "Concreto comum", 120.0, 20, 110, 49, 149),
+    Obstaculo("Contêiner de aço", "Aço", 1.0, 130, 20, 141, 22),
+    Obstaculo("Contêiner de aço", "Aço", 1.0, 130, 30, 141, 32),
+    Obstaculo("Contêiner de aço", "Aço", 1.0, 150, 170, 152, 181),
+    Obstaculo("Estante de peças", "Aço", 2.0, 120, 80, 179, 81),
+    Obstaculo("Estante de peças", "Aço", 2.0, 120, 100, 179, 101),
+    Obstaculo("Estante de peças", "Aço", 2.0, 10, 20, 11, 49),
+    Obstaculo("Armário de chumbo", "Pb", 1.0, 80, 170, 81, 171),
+    Obstaculo("Tanque de água", "Água", 300.0, 170, 140, 172, 142),
+)
+
+def repetir_leiaute(obstaculos, lado_sala, copias):
+    """Leiaute de copias × copias salas iguais, lado a lado"""
+    return tuple(o._replace(x0=o.x0 + i * lado_sala, x1=o.x1 + i * lado_sala,
+                            y0=o.y0 + j * lado_sala, y1=o.y1 + j * lado_sala)
+                 for j in range(copias) for i in range(copias) for o in obstaculos)
+
+# ============================================================
+# CENÁRIOS SORTEADOS
+# ============================================================
+
+FONTES_EXTRAS = (("Co-60", 50.0, 400.0), ("Ir-192", 200.0, 2000.0), ("Cs-137", 100.0, 900.0))
+
+def sortear_cenario(lado, n_fontes=1, atividade=450.0, obstaculos=(), rng=None):
+    """Cenário lado × lado (1 m por célula) com fontes em células distintas
+
+    A primeira fonte é sempre o Cs-137 da missão, com `atividade`
+    MBq; as demais são sorteadas de FONTES_EXTRAS. Nenhuma fonte
+    cai dentro de um obstáculo.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    livres = np.ones((lado, lado), dtype=bool)
+    for o in obstaculos:
+        livres[o.y0:o.y1 + 1, o.x0:o.x1 + 1] = False
+    celulas = rng.choice(np.flatnonzero(livres), size=n_fontes, replace=False)
+    fontes = [Fonte(int(celulas[0] % lado), int(celulas[0] // lado), float(atividade))]
+    for celula in celulas[1:]:
+        nome, minima, maxima = FONTES_EXTRAS[rng.integers(len(FONTES_EXTRAS))]
+        fontes.append(Fonte(int(celula % lado), int(celula // lado),
+                            float(round(rng.uniform(minima, maxima))), nome))
+    return Cenario(lado, lado, tuple(fontes), obstaculos=tuple(obstaculos)).validar()
+
+def sem_fonte(cenario, indice):
+    """Cenário depois de recolhida a fonte `indice`"""
+    return cenario._replace(fontes=cenario.fontes[:indice] + cenario.fontes[indice + 1:])
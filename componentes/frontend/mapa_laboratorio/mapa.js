@@ -0,0 +1,264 @@
+// =============================================================
+// FÍSICO MÉDICO: A MISSÃO - Mapa do Laboratório (navegador)
+// =============================================================
+//
+// O desenho estático (grade e obstáculos) é montado uma vez por
+// cenário; cada renderização do Streamlit traz só as mudanças
+// desde a versão anterior (células medidas, célula selecionada,
+// marcadores). Se uma versão se perder, o mapa pede o estado
+// completo de volta ao Python.
+// =============================================================
+
+const LADO_TELA = 600;  // px
+const CORES_CALOR = [[0, 0, 4], [87, 16, 110], [188, 55, 84], [249, 142, 9], [252, 255, 164]];
+const FUNDO = "#f8f9fa";
+
+const tela = document.getElementById("tela");
+const ctx = tela.getContext("2d");
+const cursor = document.getElementById("cursor");
+const escala = document.getElementById("escala");
+
+let estado = null;
+let cliques = 0;
+let pedidos = 0;
+// Identifica esta montagem do iframe: os contadores recomeçam a cada montagem,
+// e o Python compara o par (montagem, n) com o último que já tratou
+const montagem = Date.now().toString(36) + Math.random().toString(36).slice(2);
+
+// ------------------------------------------------------------
+// Protocolo dos componentes do Streamlit
+// ------------------------------------------------------------
+
+function enviar(tipo, dados) {
+  window.parent.postMessage({isStreamlitMessage: true, type: tipo, ...dados}, "*");
+}
+
+function devolver(valor) {
+  enviar("streamlit:setComponentValue", {value: valor, dataType: "json"});
+}
+
+window.addEventListener("message", (evento) => {
+  if (evento.data.type === "streamlit:render") {
+    renderizar(evento.data.args);
+  }
+});
+
+enviar("streamlit:componentReady", {apiVersion: 1});
+
+// ------------------------------------------------------------
+// Estado
+// ------------------------------------------------------------
+
+function renderizar(args) {
+  if (args.completo) {
+    montar(args);
+  } else if (estado === null || estado.versao !== args.base) {
+    // Mudança sobre uma versão que este mapa não tem
+    if (estado === null || estado.versao !== args.versao) {
+      devolver({tipo: "sincronizar", montagem: montagem, n: ++pedidos});
+    }
+    return;
+  } else {
+    aplicar(args);
+  }
+  estado.versao = args.versao;
+}
+
+function montar(args) {
+  const px = Math.max(1, Math.floor(LADO_TELA / Math.max(args.largura, args.altura)));
+  estado = {
+    versao: args.versao,
+    largura: args.largura,
+    altura: args.altura,
+    px: px,
+    unidade: args.unidade,
+    obstaculos: args.obstaculos,
+    dono: new Int32Array(args.largura * args.altura).fill(-1),
+    celulas: new Map(),
+    selecionada: null,
+    marcadores: [],
+    min: Infinity,
+    max: -Infinity,
+  };
+  args.obstaculos.forEach((o, i) => {
+    for (let y = o.y0; y <= o.y1; y++) {
+      estado.dono.fill(i, y * args.largura + o.x0, y * args.largura + o.x1 + 1);
+    }
+  });
+
+  tela.width = args.largura * px;
+  tela.height = args.altura * px;
+  tela.style.width = Math.min(LADO_TELA, tela.width) + "px";
+
+  carregar(args);
+  desenharTudo();
+  enviar("streamlit:setFrameHeight", {height: document.body.scrollHeight + 16});
+}
+
+// Atualiza o estado e devolve as células a redesenhar
+function carregar(args) {
+  const redesenhar = new Set();
+  let escalaMudou = false;
+
+  for (const [x, y, v] of args.celulas || []) {
+    const chave = x + "," + y;
+    if (v === null) {
+      estado.celulas.delete(chave);
+    } else {
+      estado.celulas.set(chave, v);
+      if (v > 0 && (v < estado.min || v > estado.max)) {
+        estado.min = Math.min(estado.min, v);
+        estado.max = Math.max(estado.max, v);
+        escalaMudou = true;
+      }
+    }
+    redesenhar.add(chave);
+  }
+  if ("selecionada" in args) {
+    if (estado.selecionada) redesenhar.add(estado.selecionada.join(","));
+    estado.selecionada = args.selecionada;
+    if (estado.selecionada) redesenhar.add(estado.selecionada.join(","));
+  }
+  if ("marcadores" in args) {
+    for (const m of estado.marcadores) redesenhar.add(m.join(","));
+    estado.marcadores = args.marcadores;
+    for (const m of estado.marcadores) redesenhar.add(m.join(","));
+  }
+
+  // Uma nova faixa de valores muda a cor de todas as células medidas
+  if (escalaMudou) {
+    for (const chave of estado.celulas.keys()) redesenhar.add(chave);
+  }
+  escala.textContent = isFinite(estado.min)
+    ? `${formatar(estado.min)} – ${formatar(estado.max)} ${estado.unidade}` : "";
+  return redesenhar;
+}
+
+function aplicar(args) {
+  for (const chave of carregar(args)) {
+    const [x, y] = chave.split(",").map(Number);
+    desenharCelula(x, y);
+  }
+  // Em mapas grandes os marcadores passam da célula: redesenha por cima
+  for (const [x, y] of estado.marcadores) marcar(x, y, "#d62728");
+  if (estado.selecionada) marcar(estado.selecionada[0], estado.selecionada[1], "#2ca02c");
+}
+
+// ------------------------------------------------------------
+// Desenho
+// ------------------------------------------------------------
+
+function corCalor(v) {
+  if (!(v > 0)) return "rgb(0,0,4)";
+  const t = estado.max > estado.min
+    ? (Math.log(v) - Math.log(estado.min)) / (Math.log(estado.max) - Math.log(estado.min)) : 1;
+  const s = Math.min(Math.max(t, 0), 1) * (CORES_CALOR.length - 1);
+  const i = Math.min(Math.floor(s), CORES_CALOR.length - 2);
+  const f = s - i;
+  const [a, b] = [CORES_CALOR[i], CORES_CALOR[i + 1]];
+  return `rgb(${a.map((c, k) => Math.round(c + f * (b[k] - c))).join(",")})`;
+}
+
+function desenharCelula(x, y) {
+  const px = estado.px;
+  const chave = x + "," + y;
+  ctx.fillStyle = FUNDO;
+  ctx.fillRect(x * px, y * px, px, px);
+
+  const dono = estado.dono[y * estado.largura + x];
+  if (dono >= 0) {
+    ctx.fillStyle = estado.obstaculos[dono].cor + "99";
+    ctx.fillRect(x * px, y * px, px, px);
+  }
+  if (estado.celulas.has(chave)) {
+    ctx.fillStyle = corCalor(estado.celulas.get(chave));
+    ctx.fillRect(x * px, y * px, px, px);
+  }
+  if (px >= 8) {
+    ctx.strokeStyle = "#dddddd";
+    ctx.lineWidth = 1;
+    ctx.strokeRect(x * px + 0.5, y * px + 0.5, px - 1, px - 1);
+  }
+  for (const [mx, my] of estado.marcadores) {
+    if (mx === x && my === y) marcar(x, y, "#d62728");
+  }
+  if (estado.selecionada && estado.selecionada[0] === x && estado.selecionada[1] === y) {
+    marcar(x, y, "#2ca02c");
+  }
+}
+
+function marcar(x, y, cor) {
+  const px = estado.px;
+  const r = Math.max(px * 0.35, 3);
+  ctx.beginPath();
+  ctx.arc((x + 0.5) * px, (y + 0.5) * px, r, 0, 2 * Math.PI);
+  ctx.fillStyle = cor;
+  ctx.fill();
+  ctx.lineWidth = 1.5;
+  ctx.strokeStyle = "white";
+  ctx.stroke();
+}
+
+function desenharTudo() {
+  ctx.fillStyle = FUNDO;
+  ctx.fillRect(0, 0, tela.width, tela.height);
+  const px = estado.px;
+  for (const o of estado.obstaculos) {
+    ctx.fillStyle = o.cor + "99";
+    ctx.fillRect(o.x0 * px, o.y0 * px, (o.x1 - o.x0 + 1) * px, (o.y1 - o.y0 + 1) * px);
+  }
+  if (px >= 8) {
+    ctx.strokeStyle = "#dddddd";
+    ctx.lineWidth = 1;
+    for (let x = 0; x <= estado.largura; x++) {
+      ctx.beginPath();
+      ctx.moveTo(x * px + 0.5, 0);
+      ctx.lineTo(x * px + 0.5, tela.height);
+      ctx.stroke();
+    }
+    for (let y = 0; y <= estado.altura; y++) {
+      ctx.beginPath();
+      ctx.moveTo(0, y * px + 0.5);
+      ctx.lineTo(tela.width, y * px + 0.5);
+      ctx.stroke();
+    }
+  }
+  for (const chave of estado.celulas.keys()) {
+    const [x, y] = chave.split(",").map(Number);
+    desenharCelula(x, y);
+  }
+  for (const [x, y] of estado.marcadores) marcar(x, y, "#d62728");
+  if (estado.selecionada) marcar(estado.selecionada[0], estado.selecionada[1], "#2ca02c");
+}
+
+function formatar(v) {
+  return v >= 0.01 && v < 1e4 ? v.toPrecision(3) : v.toExponential(2);
+}
+
+// ------------------------------------------------------------
+// Interação
+// ------------------------------------------------------------
+
+function celulaDoEvento(evento) {
+  const caixa = tela.getBoundingClientRect();
+  const x = Math.floor((evento.clientX - caixa.left) / caixa.width * estado.largura);
+  const y = Math.floor((evento.clientY - caixa.top) / caixa.height * estado.altura);
+  return [Math.min(Math.max(x, 0), estado.largura - 1), Math.min(Math.max(y, 0), estado.altura - 1)];
+}
+
+tela.addEventListener("click", (evento) => {
+  if (estado === null) return;
+  const [x, y] = celulaDoEvento(evento);
+  devolver({tipo: "clique", x: x, y: y, montagem: montagem, n: ++cliques});
+});
+
+tela.addEventListener("mousemove", (evento) => {
+  if (estado === null) return;
+  const [x, y] = celulaDoEvento(evento);
+  const chave = x + "," + y;
+  const dono = estado.dono[y * estado.largura + x];
+  let texto = `(${x}, ${y})`;
+  if (estado.celulas.has(chave)) texto += `: ${formatar(estado.celulas.get(chave))} ${estado.unidade}`;
+  if (dono >= 0) texto += ` — ${estado.obstaculos[dono].nome}`;
+  cursor.textContent = texto;
+});
@@ -0,0 +1,101 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Componente do Mapa do Laboratório
+=============================================================
+
+Mapa clicável de células desenhado num canvas no navegador
+(frontend/mapa_laboratorio), sem recriar a página a cada
+interação.
+
+O HTML, o CSS e o JavaScript são arquivos estáticos, registrados
+uma vez por processo e guardados em cache pelo navegador. Ao
+mudar de cenário o mapa recebe o desenho completo (dimensões e
+obstáculos); depois disso cada execução envia só o que mudou
+desde a última versão enviada: células medidas, célula
+selecionada e marcadores. O clique numa célula volta ao Python
+como o valor do componente.
+
+Cliques e pedidos de sincronização chegam numerados por montagem
+do iframe: ao voltar à página o mapa novo recomeça a contagem, e
+o par (montagem, n) impede que ele seja confundido com o antigo.
+=============================================================
+"""
+
+from pathlib import Path
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+import graficos
+
+PASTA_FRONTEND = Path(__file__).resolve().parent / "frontend" / "mapa_laboratorio"
+
+_componente = components.declare_component("mapa_laboratorio", path=str(PASTA_FRONTEND))
+
+def _cores_obstaculos(obstaculos):
+    """Uma cor da paleta por tipo (nome) de obstáculo"""
+    cores = {}
+    for o in obstaculos:
+        cores.setdefault(o.nome, graficos.PALETA[(len(cores) + 4) % len(graficos.PALETA)])
+    return cores
+
+def clique_novo(key="mapa_laboratorio"):
+    """Célula (x, y) clicada desde a última consulta, ou None"""
+    valor = st.session_state.get(key)
+    if not valor or valor.get("tipo") != "clique":
+        return None
+    marca = (valor.get("montagem"), valor["n"])
+    if marca == st.session_state.get(f"{key}__clique"):
+        return None
+    st.session_state[f"{key}__clique"] = marca
+    return valor["x"], valor["y"]
+
+def mapa_laboratorio(cenario_id, largura, altura, obstaculos, celulas, selecionada=None,
+                     marcadores=(), unidade="µGy/h", key="mapa_laboratorio"):
+    """Desenha o mapa, enviando ao navegador só as mudanças
+
+    `cenario_id` identifica o desenho estático (trocá-lo reenvia o
+    mapa inteiro); `celulas` é {(x, y): valor} das células medidas;
+    `marcadores` são células (x, y) destacadas.
+    """
+    chave_enviado = f"{key}__enviado"
+    enviado = st.session_state.get(chave_enviado)
+    selecionada = list(selecionada) if selecionada is not None else None
+    marcadores = [list(m) for m in marcadores]
+
+    # O navegador pede o estado completo quando perde uma versão (ou quando o
+    # iframe é montado de novo e não tem nada): cada pedido é um par (montagem, n)
+    valor = st.session_state.get(key)
+    if valor and valor.get("tipo") == "sincronizar":
+        marca = (valor.get("montagem"), valor["n"])
+        if marca != st.session_state.get(f"{key}__pedido"):
+            st.session_state[f"{key}__pedido"] = marca
+            enviado = None
+
+    if enviado is None or enviado["id"] != cenario_id:
+        versao = enviado["versao"] + 1 if enviado else 1
+        cores = _cores_obstaculos(obstaculos)
+        args = {
+            "completo": True, "versao": versao,
+            "largura": largura, "altura": altura, "unidade": unidade,
+            "obstaculos": [{"nome": o.nome, "cor": cores[o.nome],
+                            "x0": o.x0, "y0": o.y0, "x1": o.x1, "y1": o.y1} for o in obstaculos],
+            "celulas": [[x, y, v] for (x, y), v in celulas.items()],
+            "selecionada": selecionada, "marcadores": marcadores,
+        }
+    else:
+        anteriores = enviado["celulas"]
+        mudancas = [[x, y, v] for (x, y), v in celulas.items() if anteriores.get((x, y)) != v]
+        mudancas += [[x, y, None] for (x, y) in anteriores.keys() - celulas.keys()]
+        args = {"completo": False, "base": enviado["versao"], "celulas": mudancas}
+        if selecionada != enviado["selecionada"]:
+            args["selecionada"] = selecionada
+        if marcadores != enviado["marcadores"]:
+            args["marcadores"] = marcadores
+        mudou = len(args) > 3 or mudancas
+        versao = enviado["versao"] + 1 if mudou else enviado["versao"]
+        args["versao"] = versao
+
+    st.session_state[chave_enviado] = {"id": cenario_id, "versao": versao, "celulas": dict(celulas),
+                                       "selecionada": selecionada, "marcadores": marcadores}
+    _componente(**args, key=key, default=None)
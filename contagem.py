@@ -0,0 +1,296 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Contagem de Pulsos e Tempo Morto
+=============================================================
+
+Taxa de contagem observada de detectores de pulso com tempo
+morto τ, sem nenhuma dependência do Streamlit.
+
+Dois modelos clássicos para a taxa observada m de eventos que
+chegam à taxa verdadeira n:
+- não paralisável: eventos durante o tempo morto se perdem e não
+  o prolongam, m = n / (1 + nτ), que tende a 1/τ
+- paralisável: cada evento reinicia o tempo morto, m = n·e^(-nτ),
+  que passa por um máximo 1/(eτ) em n = 1/τ e depois cai
+
+O detector é dado por saturado a partir de nτ = 1: metade das
+contagens perdidas no modelo não paralisável, topo da curva no
+paralisável (daí em diante a mesma leitura vale para duas taxas).
+
+A varredura avalia todos os detectores numa grade atividade ×
+distância numa única operação em broadcasting.
+
+O modo evento a evento gera o trem de pulsos de um contador
+(Geiger-Müller ou proporcional): chegadas de Poisson,
+discriminador de altura e tempo morto, tudo em arrays NumPy. O
+pulso que começa num evento empilha os que chegam dentro da sua
+largura (as alturas se somam); como a largura é menor que τ, o
+empilhamento só muda a altura do pulso, e a taxa registrada
+segue os modelos acima aplicados à taxa acima do limiar. As
+alturas não são sorteadas evento a evento: um pulso de k eventos
+empilhados tem altura N(k, σ²k), e o discriminador só sorteia os
+poucos candidatos a ficar abaixo do limiar. O trem é dividido em
+lotes de tempo com sementes derivadas de uma única SeedSequence,
+que rodam no pool de processos do transporte. No paralisável, o primeiro evento
+do lote sorteia a distância à chegada anterior; no não
+paralisável o lote começa com o detector livre (o erro é de no
+máximo um evento por lote).
+
+Atividades em MBq, distâncias em metros, tempos mortos em µs e
+taxas em cps.
+=============================================================
+"""
+
+import bisect
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+import transporte
+
+AREA_DETECTOR = 0.01  # m² de janela (aproximado)
+SATURACAO = 1.0       # nτ a partir do qual o detector está saturado
+
+EVENTOS_POR_LOTE = 2_000_000
+RAJADAS_EM_PARALELO = 32  # abaixo disso as rajadas do tempo morto seguem uma a uma
+JANELA_RAJADA = 65536     # pulsos convertidos para lista de cada vez
+CONTAGENS_POR_PORTA = 100
+CANAIS_INTERVALOS = 60
+
+# ============================================================
+# MODELOS DE TEMPO MORTO
+# ============================================================
+
+def observada_nao_paralisavel(n, tau):
+    """Taxa observada m = n / (1 + nτ)"""
+    return n / (1 + n * tau)
+
+def observada_paralisavel(n, tau):
+    """Taxa observada m = n·e^(-nτ)"""
+    return n * np.exp(-n * tau)
+
+MODELOS_TEMPO_MORTO = {
+    "Não paralisável": observada_nao_paralisavel,
+    "Paralisável": observada_paralisavel,
+}
+
+def taxa_verdadeira(atividade, distancia, eficiencia, area=AREA_DETECTOR):
+    """Eventos por segundo no detector: A·ε·área / (4πd²), em broadcasting"""
+    return np.asarray(atividade) * 1e6 * eficiencia * area / (4 * np.pi * np.asarray(distancia)**2)
+
+# ============================================================
+# VARREDURA ATIVIDADE × DISTÂNCIA
+# ============================================================
+
+def varredura(atividades, distancias, eficiencias, tempos_mortos, modelo="Não paralisável"):
+    """Taxas verdadeira e observada de cada detector em toda a grade
+
+    Retorna (verdadeira, observada, saturado), cada um detectores ×
+    atividades × distâncias.
+    """
+    n = taxa_verdadeira(np.asarray(atividades, dtype=float)[None, :, None],
+                        np.asarray(distancias, dtype=float)[None, None, :],
+                        np.asarray(eficiencias, dtype=float)[:, None, None])
+    tau = np.asarray(tempos_mortos, dtype=float)[:, None, None] * 1e-6
+    return n, MODELOS_TEMPO_MORTO[modelo](n, tau), n * tau >= SATURACAO
+
+# ============================================================
+# TREM DE PULSOS (EVENTO A EVENTO)
+# ============================================================
+
+class Contador(NamedTuple):
+    """Contador de pulsos no modo evento a evento"""
+    nome: str
+    tempo_morto: float     # µs
+    largura_pulso: float   # µs: eventos dentro dela se empilham no pulso (< τ)
+    dispersao: float       # σ da altura de pulso, relativa à altura média
+
+CONTADORES = {
+    "Geiger-Müller": Contador("Geiger-Müller", 200.0, 50.0, 0.05),
+    "Detector Proporcional": Contador("Detector Proporcional", 1.0, 0.5, 0.07),
+}
+
+class TremPulsos(NamedTuple):
+    """Contagens de um ou mais lotes do trem de pulsos (somáveis)"""
+    tempo: float              # s simulados
+    eventos: int              # chegadas ao detector
+    acima_limiar: int         # depois do discriminador
+    registrados: int          # depois do tempo morto
+    empilhados: int           # registros com eventos empilhados na altura
+    intervalos: np.ndarray    # histograma dos intervalos entre registros
+    bordas: np.ndarray        # bordas do histograma de intervalos (s)
+    portas: np.ndarray        # registros em cada porta de tempo, em ordem
+    porta: float              # duração de cada porta (s)
+
+    def somar(self, outro):
+        return TremPulsos(
+            self.tempo + outro.tempo,
+            self.eventos + outro.eventos,
+            self.acima_limiar + outro.acima_limiar,
+            self.registrados + outro.registrados,
+            self.empilhados + outro.empilhados,
+            self.intervalos + outro.intervalos,
+            self.bordas,
+            np.concatenate([self.portas, outro.portas]),
+            self.porta,
+        )
+
+    @property
+    def taxa_medida(self):
+        """Registros por segundo (cps)"""
+        return self.registrados / self.tempo
+
+    @property
+    def taxas_portas(self):
+        """Taxa medida em cada porta (cps)"""
+        return self.portas / self.porta
+
+def _registrados_paralisavel(t, tau):
+    """Máscara dos registros: cada pulso reinicia o tempo morto"""
+    registrado = np.ones(t.size, dtype=bool)
+    registrado[1:] = np.diff(t) > tau
+    return registrado
+
+def _registrados_nao_paralisavel(t, tau):
+    """Máscara dos registros: o primeiro pulso depois de τ do último registro
+
+    A regra é sequencial, mas todo pulso após τ de silêncio é
+    registrado com certeza e separa o trem em rajadas
+    independentes. As cadeias de registros das rajadas avançam em
+    paralelo; as poucas rajadas longas que sobram (taxas altas,
+    nτ ≳ 10) terminam uma a uma, com busca binária em janelas do
+    trem convertidas para lista.
+    """
+    registrado = _registrados_paralisavel(t, tau)
+    if t.size == 0:
+        return registrado
+    lideres = np.flatnonzero(registrado)
+    fins = np.append(lideres[1:], t.size)
+    # Numa rajada de dois pulsos o segundo cai no tempo morto do líder
+    longa = fins - lideres > 2
+    atual, fim = lideres[longa], fins[longa]
+    while atual.size > RAJADAS_EM_PARALELO:
+        atual = np.searchsorted(t, t[atual] + tau, side="right")
+        dentro = atual < fim
+        atual, fim = atual[dentro], fim[dentro]
+        registrado[atual] = True
+    for k, f in zip(atual.tolist(), fim.tolist()):
+        _seguir_rajada(t, tau, k, f, registrado)
+    return registrado
+
+def _seguir_rajada(t, tau, k, fim, registrado):
+    """Marca os registros de uma rajada a partir do registro k, um a um"""
+    tamanho = JANELA_RAJADA
+    inicio, lista = k, t[k:min(k + tamanho, fim)].tolist()
+    while True:
+        j = bisect.bisect_right(lista, lista[k - inicio] + tau, k - inicio)
+        if j < len(lista):
+            k = inicio + j
+            registrado[k] = True
+        elif inicio + j >= fim:
+            return
+        else:
+            if inicio == k:
+                tamanho *= 2  # τ cobre mais que a janela inteira
+            inicio, lista = k, t[k:min(k + tamanho, fim)].tolist()
+
+REGISTRADOS = {
+    "Não paralisável": _registrados_nao_paralisavel,
+    "Paralisável": _registrados_paralisavel,
+}
+
+def _abaixo_limiar(contador, k, limiar):
+    """Probabilidade de um pulso de k eventos empilhados ficar abaixo do limiar"""
+    sigma = contador.dispersao * math.sqrt(k)
+    return 0.5 * math.erfc((k - limiar) / (sigma * math.sqrt(2)))
+
+def simular_lote_pulsos(contador, taxa, limiar, modelo, portas, porta, bordas, semente):
+    """Trem de pulsos de `portas` portas de `porta` s, a partir de um lote novo"""
+    rng = np.random.default_rng(semente)
+    duracao = portas * porta
+
+    # Chegadas de Poisson: intervalos exponenciais acumulados, com folga
+    folga = int(taxa * duracao + 6 * np.sqrt(taxa * duracao) + 16)
+    espacamentos = rng.exponential(1 / taxa, folga)
+    while espacamentos.sum() < duracao:
+        espacamentos = np.concatenate([espacamentos, rng.exponential(1 / taxa, folga)])
+    t = np.cumsum(espacamentos)
+    eventos = int(np.searchsorted(t, duracao))
+    t, espacamentos = t[:eventos], espacamentos[:eventos]
+
+    # Discriminador: o pulso que começa num evento soma as alturas dos eventos
+    # que chegam dentro da sua largura; com k eventos ele tem altura N(k, σ²k)
+    # e fica abaixo do limiar com probabilidade q_k ≤ q_1. Sorteia candidatos
+    # com q_1 (quase nenhum para limiares baixos) e aceita cada um com q_k/q_1.
+    # Um pulso abaixo do limiar não dispara o tempo morto
+    q1 = _abaixo_limiar(contador, 1, limiar)
+    candidatos = rng.choice(eventos, rng.binomial(eventos, q1), replace=False)
+    indices = None
+    if candidatos.size:
+        tamanhos = np.searchsorted(t, t[candidatos] + contador.largura_pulso * 1e-6) - candidatos
+        q = np.array([_abaixo_limiar(contador, k, limiar) for k in range(1, tamanhos.max() + 1)])
+        perdidos = candidatos[rng.random(candidatos.size) * q1 < q[tamanhos - 1]]
+        if perdidos.size:
+            indices = np.delete(np.arange(eventos), perdidos)
+            t = t[indices]
+    acima_limiar = t.size
+
+    # Tempo morto sobre os eventos vivos: o empilhamento cai dentro dele
+    # (largura < τ) e só muda a altura do pulso registrado
+    tau = contador.tempo_morto * 1e-6
+    registrado = REGISTRADOS[modelo](t, tau)
+    if modelo == "Paralisável" and t.size:
+        # A chegada anterior ao lote também reinicia o tempo morto
+        registrado[0] = t[0] + rng.exponential(1 / taxa) > tau
+    registrados = np.flatnonzero(registrado)
+    t = t[registrados]
+    if indices is not None:
+        registrados = indices[registrados]
+    seguintes = registrados[registrados + 1 < eventos] + 1
+    empilhados = int(np.count_nonzero(espacamentos[seguintes] <= contador.largura_pulso * 1e-6))
+
+    # Histograma de intervalos: as bordas são uniformes a partir de 0
+    canal = (np.diff(t) / bordas[1]).astype(np.int64)
+    intervalos = np.bincount(canal[canal < bordas.size - 1], minlength=bordas.size - 1)
+    contagens = np.bincount((t / porta).astype(np.int64), minlength=portas)[:portas]
+    return TremPulsos(duracao, eventos, acima_limiar, t.size, empilhados, intervalos, bordas,
+                      contagens, porta)
+
+def simular_trem(contador, taxa, eventos, limiar=0.5, modelo="Não paralisável", semente=0,
+                 paralelo=True, eventos_por_lote=EVENTOS_POR_LOTE):
+    """Cerca de `eventos` chegadas à taxa verdadeira `taxa` (cps), em lotes reprodutíveis
+
+    As portas de tempo têm ~CONTAGENS_POR_PORTA registros esperados
+    e o histograma de intervalos vai até 5 intervalos médios
+    esperados; cada lote tem um número inteiro de portas. Quando
+    quase nada é registrado (paralisável muito acima de nτ = 1),
+    as escalas se limitam à duração do trem e ao tamanho do lote.
+    """
+    tau = contador.tempo_morto * 1e-6
+    esperada = MODELOS_TEMPO_MORTO[modelo](taxa, tau)
+    duracao = eventos / taxa
+    intervalo = min(1 / esperada, duracao) if esperada > 0 else duracao
+    porta = min(CONTAGENS_POR_PORTA * intervalo, duracao, eventos_por_lote / taxa)
+    bordas = np.linspace(0.0, 5 * intervalo, CANAIS_INTERVALOS + 1)
+
+    portas_total = max(int(round(duracao / porta)), 1)
+    portas_lote = max(int(eventos_por_lote / taxa / porta), 1)
+    tamanhos = [portas_lote] * (portas_total // portas_lote)
+    if portas_total % portas_lote:
+        tamanhos.append(portas_total % portas_lote)
+    sementes = np.random.SeedSequence(semente).spawn(len(tamanhos))
+    argumentos = [(contador, float(taxa), float(limiar), modelo, k, porta, bordas, s)
+                  for k, s in zip(tamanhos, sementes)]
+
+    if paralelo and len(argumentos) > 1 and transporte.processos_disponiveis() > 1:
+        futuros = [transporte.obter_executor().submit(simular_lote_pulsos, *args)
+                   for args in argumentos]
+        parciais = [f.result() for f in futuros]
+    else:
+        parciais = [simular_lote_pulsos(*args) for args in argumentos]
+
+    resultado = parciais[0]
+    for parcial in parciais[1:]:
+        resultado = resultado.somar(parcial)
+    return resultado
@@ -0,0 +1,231 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Gerador das Tabelas de Atenuação
+=============================================================
+
+Fonte editável dos coeficientes de atenuação mássica μ/ρ
+(cm²/g) de elementos e compostos, na grade de energias das
+tabelas do NIST (XCOM / Hubbell-Seltzer) de 10 keV a 10 MeV,
+com as bordas K dentro da faixa tabeladas dos dois lados.
+Gera os arquivos lidos (com memória mapeada) por atenuacao.py:
+
+- materiais.npy: um registro por material (nome, descrição,
+  densidade, Z/A, Z e massa atômica dos elementos e a faixa dos
+  seus pontos)
+- atenuacao.npy: todos os pontos (ln E, ln μ/ρ e a inclinação
+  log-log até o ponto seguinte), contíguos por material
+
+Valores de referência aproximados, para fins didáticos. P, S,
+Ca e Ba são estimados a partir de um elemento vizinho
+(escalar); os compostos, pela regra das misturas.
+
+EXECUTAR: python dados/gerar_atenuacao.py
+=============================================================
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+PASTA = Path(__file__).resolve().parent
+
+# Grade de energias das tabelas (keV)
+GRADE = [10, 15, 20, 30, 40, 50, 60, 80, 100, 150, 200, 300, 400, 500, 600, 800,
+         1000, 1250, 1500, 2000, 3000, 4000, 5000, 6000, 8000, 10000]
+
+# ============================================================
+# ELEMENTOS: μ/ρ (cm²/g) NA GRADE E BORDAS K (E, abaixo, acima)
+# ============================================================
+
+H = [0.3854, 0.3764, 0.3695, 0.3570, 0.3458, 0.3355, 0.3260, 0.3091, 0.2944, 0.2651,
+     0.2429, 0.2112, 0.1893, 0.1729, 0.1599, 0.1405, 0.1263, 0.1129, 0.1027, 0.08769,
+     0.06921, 0.05806, 0.05049, 0.04498, 0.03746, 0.03254]
+B = [1.391, 0.5563, 0.3334, 0.2162, 0.1845, 0.1701, 0.1610, 0.1485, 0.1398, 0.1244,
+     0.1135, 0.09852, 0.08826, 0.08058, 0.07451, 0.06544, 0.05883, 0.05262, 0.04790,
+     0.04108, 0.03289, 0.02808, 0.02490, 0.02263, 0.01964, 0.01776]
+C = [2.373, 0.8071, 0.4420, 0.2562, 0.2076, 0.1871, 0.1753, 0.1610, 0.1514, 0.1347,
+     0.1229, 0.1066, 0.09546, 0.08715, 0.08058, 0.07076, 0.06361, 0.05690, 0.05179,
+     0.04442, 0.03562, 0.03047, 0.02708, 0.02469, 0.02154, 0.01959]
+N = [3.831, 1.219, 0.6095, 0.3071, 0.2325, 0.1981, 0.1823, 0.1660, 0.1543, 0.1356,
+     0.1233, 0.1068, 0.09557, 0.08719, 0.08063, 0.07081, 0.06364, 0.05693, 0.05180,
+     0.04450, 0.03579, 0.03073, 0.02742, 0.02511, 0.02209, 0.02025]
+O = [5.952, 1.836, 0.8651, 0.3779, 0.2585, 0.2132, 0.1907, 0.1678, 0.1551, 0.1361,
+     0.1237, 0.1070, 0.09566, 0.08729, 0.08070, 0.07087, 0.06372, 0.05697, 0.05185,
+     0.04459, 0.03597, 0.03100, 0.02777, 0.02552, 0.02263, 0.02089]
+NA = [15.57, 4.694, 2.057, 0.7197, 0.3969, 0.2804, 0.2268, 0.1796, 0.1585, 0.1335,
+      0.1200, 0.1029, 0.09182, 0.08372, 0.07734, 0.06784, 0.06097, 0.05448, 0.04960,
+      0.04276, 0.03486, 0.03036, 0.02752, 0.02558, 0.02317, 0.02183]
+MG = [21.05, 6.358, 2.763, 0.9306, 0.4881, 0.3292, 0.2570, 0.1951, 0.1686, 0.1408,
+      0.1260, 0.1068, 0.09505, 0.08654, 0.07995, 0.07010, 0.06298, 0.05632, 0.05130,
+      0.04431, 0.03628, 0.03183, 0.02906, 0.02721, 0.02497, 0.02375]
+AL = [26.23, 7.955, 3.441, 1.128, 0.5685, 0.3681, 0.2778, 0.2018, 0.1704, 0.1378,
+      0.1223, 0.1042, 0.09276, 0.08445, 0.07802, 0.06841, 0.06146, 0.05496, 0.05006,
+      0.04324, 0.03541, 0.03106, 0.02836, 0.02655, 0.02437, 0.02318]
+SI = [33.89, 10.34, 4.464, 1.436, 0.7012, 0.4385, 0.3207, 0.2228, 0.1835, 0.1448,
+      0.1275, 0.1082, 0.09614, 0.08748, 0.08077, 0.07082, 0.06361, 0.05688, 0.05183,
+      0.04480, 0.03678, 0.03240, 0.02967, 0.02788, 0.02574, 0.02462]
+FE = [170.6, 57.08, 25.68, 8.176, 3.629, 1.958, 1.205, 0.5952, 0.3717, 0.1964,
+      0.1460, 0.1099, 0.09400, 0.08414, 0.07704, 0.06699, 0.05995, 0.05350, 0.04883,
+      0.04265, 0.03621, 0.03312, 0.03146, 0.03057, 0.02991, 0.02994]
+CU = [215.9, 74.05, 33.79, 10.92, 4.862, 2.613, 1.593, 0.7630, 0.4584, 0.2217,
+      0.1559, 0.1119, 0.09413, 0.08362, 0.07625, 0.06605, 0.05901, 0.05261, 0.04803,
+      0.04205, 0.03599, 0.03318, 0.03177, 0.03108, 0.03074, 0.03103]
+I = [155.0, 49.30, 22.10, 7.100, 22.10, 12.32, 7.583, 3.505, 1.942, 0.6978,
+     0.3663, 0.1771, 0.1190, 0.09312, 0.07930, 0.06460, 0.05643, 0.04975, 0.04559,
+     0.04083, 0.03717, 0.03632, 0.03650, 0.03724, 0.03924, 0.04136]
+W = [96.91, 138.9, 65.73, 22.73, 10.67, 5.949, 3.713, 7.810, 4.438, 1.581,
+     0.7844, 0.3238, 0.1925, 0.1378, 0.1093, 0.08066, 0.06618, 0.05577, 0.05000,
+     0.04433, 0.04075, 0.04038, 0.04103, 0.04210, 0.04472, 0.04747]
+PB = [130.6, 111.6, 86.36, 30.32, 14.36, 8.041, 5.021, 2.419, 5.549, 2.014,
+      0.9985, 0.4031, 0.2323, 0.1614, 0.1248, 0.08870, 0.07102, 0.05876, 0.05222,
+      0.04606, 0.04234, 0.04197, 0.04272, 0.04391, 0.04675, 0.04972]
+
+# Espalhamento por elétron (cm²/g por mol de elétrons/g): o hidrogênio
+# praticamente só espalha, então H / (Z/A do H) serve de referência
+ESPALHAMENTO_POR_ELETRON = np.array(H) / (1 / 1.008)
+
+def escalar(referencia, z_ref, a_ref, z, a):
+    """μ/ρ estimado a partir de um elemento vizinho sem borda K no meio
+
+    Separa o espalhamento (proporcional a Z/A) do resto, que é
+    escalado por Z⁴/A até 1 MeV (fotoelétrico) e por Z²/A acima
+    (produção de pares).
+    """
+    grade = np.array(GRADE, dtype=float)
+    espalhamento_ref = z_ref / a_ref * ESPALHAMENTO_POR_ELETRON
+    resto = np.maximum(np.array(referencia) - espalhamento_ref, 0.0)
+    expoente = np.where(grade <= 1000, 4, 2)
+    fator = (z / z_ref) ** expoente * a_ref / a
+    return list(z / a * ESPALHAMENTO_POR_ELETRON + resto * fator)
+
+# (símbolo, descrição, Z, A, densidade g/cm³, μ/ρ na GRADE, bordas K)
+ELEMENTOS = [
+    ("H", "Hidrogênio", 1, 1.008, 8.375e-5, H, []),
+    ("B", "Boro", 5, 10.81, 2.37, B, []),
+    ("C", "Carbono (grafite)", 6, 12.011, 2.0, C, []),
+    ("N", "Nitrogênio", 7, 14.007, 1.165e-3, N, []),
+    ("O", "Oxigênio", 8, 15.999, 1.332e-3, O, []),
+    ("Na", "Sódio", 11, 22.990, 0.971, NA, []),
+    ("Mg", "Magnésio", 12, 24.305, 1.74, MG, []),
+    ("Al", "Alumínio", 13, 26.982, 2.699, AL, []),
+    ("Si", "Silício", 14, 28.086, 2.33, SI, []),
+    ("P", "Fósforo", 15, 30.974, 2.2, escalar(SI, 14, 28.086, 15, 30.974), []),
+    ("S", "Enxofre", 16, 32.06, 2.0, escalar(SI, 14, 28.086, 16, 32.06), []),
+    ("Ca", "Cálcio", 20, 40.078, 1.55, escalar(FE, 26, 55.845, 20, 40.078), []),
+    ("Fe", "Ferro", 26, 55.845, 7.874, FE, []),
+    ("Cu", "Cobre", 29, 63.546, 8.96, CU, []),
+    ("I", "Iodo", 53, 126.904, 4.93, I, [(33.169, 5.50, 35.0)]),
+    ("Ba", "Bário", 56, 137.327, 3.5, escalar(I, 53, 126.904, 56, 137.327),
+     [(37.441, 4.64, 30.1)]),
+    ("W", "Tungstênio", 74, 183.84, 19.3, W, [(69.525, 2.552, 11.23)]),
+    ("Pb", "Chumbo", 82, 207.2, 11.35, PB, [(88.0045, 1.910, 7.683)]),
+]
+
+# ============================================================
+# COMPOSTOS: FRAÇÕES EM MASSA (REGRA DAS MISTURAS)
+# ============================================================
+
+# (nome, descrição, densidade g/cm³, {símbolo: fração em massa})
+COMPOSTOS = [
+    ("Água", "Água líquida", 1.0, {"H": 0.111894, "O": 0.888106}),
+    ("Ar seco", "Ar seco ao nível do mar (Ar somado ao N)", 0.001205,
+     {"C": 0.000124, "N": 0.768095, "O": 0.231781}),
+    ("Tecido mole (ICRU)", "Tecido mole, 4 componentes", 1.0,
+     {"H": 0.101, "C": 0.111, "N": 0.026, "O": 0.762}),
+    ("Osso cortical (ICRU)", "Osso cortical", 1.92,
+     {"H": 0.034, "C": 0.155, "N": 0.042, "O": 0.435, "Na": 0.001, "Mg": 0.002,
+      "P": 0.103, "S": 0.003, "Ca": 0.225}),
+    ("Concreto comum", "Concreto comum (NIST, K somado ao Ca)", 2.30,
+     {"H": 0.010, "C": 0.001, "O": 0.529107, "Na": 0.016, "Mg": 0.002, "Al": 0.033872,
+      "Si": 0.337021, "Ca": 0.057, "Fe": 0.014}),
+    ("Aço", "Aço carbono", 7.85, {"Fe": 0.99, "C": 0.005, "Si": 0.005}),
+    ("Polietileno", "Polietileno (CH₂)ₙ", 0.94, {"H": 0.143711, "C": 0.856289}),
+    ("PMMA (acrílico)", "Polimetilmetacrilato", 1.19,
+     {"H": 0.080538, "C": 0.599848, "O": 0.319614}),
+    ("Iodeto de sódio (NaI)", "Cristal cintilador de NaI", 3.667,
+     {"Na": 0.153373, "I": 0.846627}),
+]
+
+# ============================================================
+# MONTAGEM DOS PONTOS
+# ============================================================
+
+TIPO_MATERIAL = np.dtype([
+    ("nome", "U24"),
+    ("descricao", "U48"),
+    ("densidade", "f8"),
+    ("z_sobre_a", "f8"),
+    ("z", "i4"),                # 0 para compostos
+    ("massa_atomica", "f8"),    # 0 para compostos
+    ("primeiro_ponto", "i4"),
+    ("n_pontos", "i4"),
+])
+
+TIPO_PONTO = np.dtype([("ln_energia", "f8"), ("ln_mu_rho", "f8"), ("inclinacao", "f8")])
+
+def pontos_elemento(valores, bordas):
+    """(E, μ/ρ) em ordem de energia; cada borda entra duas vezes"""
+    pontos = list(zip(GRADE, valores))
+    for energia, abaixo, acima in bordas:
+        pontos += [(energia, abaixo), (energia, acima)]
+    # sort estável: em cada borda o valor de baixo fica antes do de cima
+    return sorted(pontos, key=lambda ponto: ponto[0])
+
+def avaliar(pontos, energia, lado):
+    """μ/ρ por log-log; lado "abaixo"/"acima" escolhe o limite numa borda"""
+    E = np.log([p[0] for p in pontos])
+    mu = np.log([p[1] for p in pontos])
+    x = np.log(energia)
+    i = np.searchsorted(E, x, side="left" if lado == "abaixo" else "right") - 1
+    i = min(max(i, 0), len(E) - 2)
+    if E[i + 1] == E[i]:
+        return float(np.exp(mu[i + 1] if lado == "acima" else mu[i]))
+    return float(np.exp(mu[i] + (mu[i + 1] - mu[i]) * (x - E[i]) / (E[i + 1] - E[i])))
+
+def pontos_composto(fracoes, por_simbolo):
+    """Regra das misturas na união das energias (e bordas) dos elementos"""
+    bordas = sorted({e for s in fracoes for e, _, _ in por_simbolo[s][1]})
+    pontos = []
+    for energia in sorted(set(GRADE) | set(bordas)):
+        lados = ("abaixo", "acima") if energia in bordas else ("acima",)
+        for lado in lados:
+            pontos.append((energia, sum(w * avaliar(por_simbolo[s][0], energia, lado)
+                                        for s, w in fracoes.items())))
+    return pontos
+
+def registros_pontos(pontos):
+    """ln E, ln μ/ρ e inclinação até o ponto seguinte (0 numa borda e no fim)"""
+    ln_E = np.log([p[0] for p in pontos])
+    ln_mu = np.log([p[1] for p in pontos])
+    inclinacao = np.zeros(len(pontos))
+    passo = np.diff(ln_E)
+    np.divide(np.diff(ln_mu), passo, out=inclinacao[:-1], where=passo > 0)
+    return list(zip(ln_E, ln_mu, inclinacao))
+
+def main():
+    por_simbolo = {}
+    materiais = []
+    for simbolo, descricao, z, a, densidade, valores, bordas in ELEMENTOS:
+        assert len(valores) == len(GRADE), simbolo
+        pontos = pontos_elemento(valores, bordas)
+        por_simbolo[simbolo] = (pontos, bordas, z / a)
+        materiais.append((simbolo, descricao, densidade, z / a, z, a, pontos))
+
+    for nome, descricao, densidade, fracoes in COMPOSTOS:
+        assert abs(sum(fracoes.values()) - 1) < 1e-4, nome
+        z_sobre_a = sum(w * por_simbolo[s][2] for s, w in fracoes.items())
+        materiais.append((nome, descricao, densidade, z_sobre_a, 0, 0.0,
+                          pontos_composto(fracoes, por_simbolo)))
+
+    tabela = np.zeros(len(materiais), dtype=TIPO_MATERIAL)
+    pontos_todos = []
+    for i, (nome, descricao, densidade, z_sobre_a, z, a, pontos) in enumerate(materiais):
+        tabela[i] = (nome, descricao, densidade, z_sobre_a, z, a, len(pontos_todos), len(pontos))
+        pontos_todos.extend(registros_pontos(pontos))
+
+    np.save(PASTA / "materiais.npy", tabela)
+    np.save(PASTA / "atenuacao.npy", np.array(pontos_todos, dtype=TIPO_PONTO))
+    print(f"{len(ELEMENTOS)} elementos, {len(COMPOSTOS)} compostos, {len(pontos_todos)} pontos")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Gerador da Tabela de Nuclídeos
+=============================================================
+
+Fonte editável da tabela de nuclídeos do jogo. Gera os arquivos
+compactos lidos (com memória mapeada) por nuclideos.py:
+
+- nuclideos.npy: um registro por nuclídeo (nome, meia-vida em
+  segundos, constante de taxa de kerma no ar, uso e a faixa das
+  suas linhas de fótons)
+- linhas_gama.npy: todas as linhas de fótons (energia em keV,
+  rendimento por decaimento), contíguas por nuclídeo
+
+Γ em µGy·m²/(h·GBq), valores de referência aproximados.
+
+EXECUTAR: python dados/gerar_nuclideos.py
+=============================================================
+"""
+
+import math
+from pathlib import Path
+
+import numpy as np
+
+PASTA = Path(__file__).resolve().parent
+
+MINUTO = 60.0
+HORA = 60 * MINUTO
+DIA = 24 * HORA
+ANO = 365.25 * DIA
+ESTAVEL = math.inf
+
+# (nome, meia-vida (s), Γ, uso, [(energia keV, rendimento), ...])
+NUCLIDEOS = [
+    # Medicina nuclear
+    ("Tc-99m", 6.0067 * HORA, 14.1, "Cintilografia", [(140.5, 0.885)]),
+    ("I-131", 8.0252 * DIA, 53.0, "Terapia tireoide",
+     [(364.5, 0.815), (637.0, 0.072), (284.3, 0.061), (80.2, 0.026), (722.9, 0.018)]),
+    ("I-125", 59.49 * DIA, 34.0, "Braquiterapia (sementes)", [(27.4, 1.13), (35.5, 0.067)]),
+    ("F-18", 109.77 * MINUTO, 134.0, "PET", [(511.0, 1.935)]),
+    ("Ga-68", 67.71 * MINUTO, 129.0, "PET", [(511.0, 1.78), (1077.3, 0.032)]),
+    ("In-111", 2.8047 * DIA, 75.0, "Cintilografia", [(171.3, 0.906), (245.4, 0.941)]),
+    ("Lu-177", 6.647 * DIA, 5.2, "Terapia com radioligantes", [(208.4, 0.104), (112.9, 0.062)]),
+    ("Ra-223", 11.43 * DIA, 5.0, "Terapia de metástases ósseas",
+     [(269.5, 0.139), (154.2, 0.057), (323.9, 0.040)]),
+    ("Y-90", 64.0 * HORA, 0.0, "Radioembolização", []),
+    # Geradores
+    ("Mo-99", 65.94 * HORA, 21.0, "Gerador de Tc-99m",
+     [(739.5, 0.121), (181.1, 0.060), (777.9, 0.043)]),
+    ("Tc-99", 2.111e5 * ANO, 0.0, "Produto do Tc-99m", []),
+    ("Ge-68", 270.95 * DIA, 0.0, "Gerador de Ga-68", []),
+    ("Zn-68", ESTAVEL, 0.0, "Estável", []),
+    ("Sr-90", 28.79 * ANO, 0.0, "Gerador de Y-90", []),
+    ("Zr-90", ESTAVEL, 0.0, "Estável", []),
+    # Fontes seladas e calibração
+    ("Co-60", 5.2714 * ANO, 306.0, "Radioterapia", [(1173.2, 0.9985), (1332.5, 0.9998)]),
+    ("Cs-137", 30.08 * ANO, 77.9, "Calibração", [(661.7, 0.851)]),
+    ("Ba-137m", 2.552 * MINUTO, 93.5, "Filha do Cs-137", [(661.7, 0.899)]),
+    ("Ba-137", ESTAVEL, 0.0, "Estável", []),
+    ("Am-241", 432.6 * ANO, 3.1, "Fonte de calibração", [(59.5, 0.359), (26.3, 0.024)]),
+    ("Ir-192", 73.83 * DIA, 111.0, "Braquiterapia HDR",
+     [(316.5, 0.829), (468.1, 0.478), (308.5, 0.300), (296.0, 0.287), (604.4, 0.082), (612.5, 0.053)]),
+    # Série do radônio
+    ("Rn-222", 3.8235 * DIA, 0.0, "Radônio ambiental", []),
+    ("Po-218", 3.098 * MINUTO, 0.0, "Filho do radônio", []),
+    ("Pb-214", 26.8 * MINUTO, 35.0, "Filho do radônio",
+     [(351.9, 0.356), (295.2, 0.184), (242.0, 0.073)]),
+    ("Bi-214", 19.9 * MINUTO, 220.0, "Filho do radônio",
+     [(609.3, 0.455), (1764.5, 0.153), (1120.3, 0.149)]),
+    ("Po-214", 164.3e-6, 0.0, "Filho do radônio", []),
+    ("Pb-210", 22.2 * ANO, 0.5, "Filho do radônio", [(46.5, 0.0425)]),
+]
+
+TIPO_NUCLIDEO = np.dtype([
+    ("nome", "U8"),
+    ("meia_vida", "f8"),
+    ("gama", "f8"),
+    ("uso", "U32"),
+    ("primeira_linha", "i4"),
+    ("n_linhas", "i4"),
+])
+
+TIPO_LINHA = np.dtype([("energia", "f8"), ("rendimento", "f8")])
+
+def main():
+    tabela = np.zeros(len(NUCLIDEOS), dtype=TIPO_NUCLIDEO)
+    linhas = []
+    for i, (nome, meia_vida, gama, uso, fotons) in enumerate(NUCLIDEOS):
+        # Linhas em ordem decrescente de rendimento: a primeira é a principal
+        fotons = sorted(fotons, key=lambda linha: -linha[1])
+        tabela[i] = (nome, meia_vida, gama, uso, len(linhas), len(fotons))
+        linhas.extend(fotons)
+
+    np.save(PASTA / "nuclideos.npy", tabela)
+    np.save(PASTA / "linhas_gama.npy", np.array(linhas, dtype=TIPO_LINHA))
+    print(f"{len(tabela)} nuclídeos, {len(linhas)} linhas de fótons")
+
+if __name__ == "__main__":
+    main()
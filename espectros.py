@@ -0,0 +1,265 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Espectros de Cintiladores NaI(Tl)
+=============================================================
+
+Espectro de altura de pulso de um cristal de NaI(Tl) para
+qualquer mistura de linhas gama, sem nenhuma dependência do
+Streamlit.
+
+A resposta do detector é uma matriz canais × energias de
+entrada, montada uma vez por cristal e guardada em cache. Cada
+coluna é o espectro medido por fóton/cm² que incide na face do
+cristal com aquela energia:
+
+    R(E) = A·ε(E) · G ⊛ [ (1 - f_ret)·(P/T·δ(E) + (1 - P/T)·C(E)) + f_ret·δ(E_ret) ]
+
+    ε(E)     eficiência intrínseca, 1 - e^(-μ_NaI·h)
+    P/T      razão pico/total, maior nos cristais maiores
+    C(E)     contínuo Compton de Klein-Nishina até a borda,
+             mais um vale de espalhamentos múltiplos até E
+    E_ret    pico de retroespalhamento (fóton espalhado a 180°
+             no entorno e absorvido no cristal)
+    G        resolução gaussiana, FWHM/E ∝ 1/√E
+
+Com a matriz pronta, o espectro de qualquer mistura de fontes
+num tempo de contagem é um produto matriz-vetor seguido de
+amostragem de Poisson em cada canal.
+
+Uma aquisição ao vivo é um gerador de incrementos de Poisson, um
+por fatia de tempo: somados, têm a mesma distribuição do espectro
+inteiro amostrado de uma vez. Cada fatia custa o mesmo (um sorteio
+por canal), qualquer que seja o tempo já acumulado.
+
+Energias em keV, fluências em fótons/cm²/s e distâncias em
+metros.
+=============================================================
+"""
+
+import functools
+from typing import NamedTuple
+
+import numpy as np
+
+import atenuacao
+import fisica
+import nuclideos
+
+CANAIS = 1024
+LARGURA_CANAL = 3.0  # keV (0 a 3072 keV)
+ENERGIAS = (np.arange(CANAIS) + 0.5) * LARGURA_CANAL  # centro de cada canal
+ENERGIAS.flags.writeable = False
+
+FRACAO_RETROESPALHAMENTO = 0.03  # das interações no cristal
+FRACAO_VALE = 0.15               # do contínuo: espalhamentos múltiplos
+EXPOENTE_PICO_TOTAL = 1.5
+LIMIAR_SIGNIFICANCIA = 5.0       # σ da área líquida do pico para parar a aquisição
+E_RESOLUCAO = 661.7              # keV de referência da resolução
+
+class Cristal(NamedTuple):
+    """Cristal cilíndrico de NaI(Tl) visto de frente"""
+    nome: str
+    diametro: float        # cm
+    altura: float          # cm
+    resolucao: float       # FWHM/E em 662 keV
+    e_pico_total: float    # keV em que a razão pico/total vale 1/2
+
+    @property
+    def area(self):
+        """Área da face (cm²)"""
+        return np.pi * self.diametro**2 / 4
+
+CRISTAIS = {
+    '1,5"×1,5"': Cristal('1,5"×1,5"', 3.81, 3.81, 0.072, 350.0),
+    '2"×2"': Cristal('2"×2"', 5.08, 5.08, 0.070, 490.0),
+    '3"×3"': Cristal('3"×3"', 7.62, 7.62, 0.075, 700.0),
+}
+
+# Radiação natural no campo (fótons/cm²/s): linhas do K-40 e das
+# séries do U e do Th, mais o contínuo espalhado no solo
+LINHAS_FUNDO = (
+    (351.9, 0.08),   # Pb-214
+    (583.2, 0.05),   # Tl-208
+    (609.3, 0.10),   # Bi-214
+    (911.2, 0.04),   # Ac-228
+    (1460.8, 0.25),  # K-40
+    (1764.5, 0.04),  # Bi-214
+    (2614.5, 0.06),  # Tl-208
+)
+CONTINUO_FUNDO = 2.0  # fótons/cm²/s espalhados, e^(-E/200 keV)
+
+# ============================================================
+# MATRIZ DE RESPOSTA (UMA VEZ POR CRISTAL)
+# ============================================================
+
+def _canal(E):
+    """Índice (contínuo) do canal da energia E: o centro do canal i é i"""
+    return np.asarray(E, dtype=float) / LARGURA_CANAL - 0.5
+
+def _distribuir(E, pesos=1.0):
+    """Vetor nos canais com cada energia repartida entre os dois canais vizinhos"""
+    posicao = np.clip(_canal(E), 0, CANAIS - 1.000001)
+    inferior = np.floor(posicao).astype(int)
+    fracao = posicao - inferior
+    pesos = np.broadcast_to(np.asarray(pesos, dtype=float), posicao.shape)
+    vetor = np.zeros(CANAIS)
+    np.add.at(vetor, inferior, pesos * (1 - fracao))
+    np.add.at(vetor, inferior + 1, pesos * fracao)
+    return vetor
+
+def pico_total(cristal, E):
+    """Fração das interações que deposita toda a energia (pico/total)"""
+    return 1 / (1 + (np.asarray(E, dtype=float) / cristal.e_pico_total)**EXPOENTE_PICO_TOTAL)
+
+def eficiencia_intrinseca(cristal, E):
+    """Fração dos fótons na face do cristal que interage nele"""
+    mu = atenuacao.mu(atenuacao.material("Iodeto de sódio (NaI)"), E)
+    return 1 - np.exp(-mu * cristal.altura)
+
+def fwhm(cristal, E):
+    """Largura à meia altura (keV) do pico de energia E"""
+    return cristal.resolucao * np.sqrt(E_RESOLUCAO * np.asarray(E, dtype=float))
+
+def _depositos():
+    """Energia depositada por interação, sem resolução: canais × entradas"""
+    E = ENERGIAS[None, :]
+    T = ENERGIAS[:, None]
+    alfa = E / fisica.ENERGIA_REPOUSO_ELETRON
+    borda = E - fisica.energia_compton(E, 180.0)
+
+    # dσ/dT de Klein-Nishina para o elétron de recuo, T de 0 à borda
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = T / E
+        klein_nishina = 2 + s**2 / (alfa**2 * (1 - s)**2) + s / (1 - s) * (s - 2 / alfa)
+    klein_nishina = np.where(T < borda, klein_nishina, 0.0)
+    vale = ((T >= borda) & (T < E)).astype(float)
+    for parte in (klein_nishina, vale):
+        soma = parte.sum(axis=0, keepdims=True)
+        np.divide(parte, soma, out=parte, where=soma > 0)
+    return klein_nishina, vale
+
+def _resolucao(cristal):
+    """Alargamento gaussiano: canal medido × energia depositada"""
+    sigma = np.maximum(fwhm(cristal, ENERGIAS) / 2.355, LARGURA_CANAL / 2)[None, :]
+    G = np.exp(-0.5 * ((ENERGIAS[:, None] - ENERGIAS[None, :]) / sigma)**2)
+    return G / G.sum(axis=0, keepdims=True)
+
+@functools.lru_cache(maxsize=None)
+def matriz_resposta(nome):
+    """Contagens por canal por fóton/cm² na face: canais × energias de entrada
+
+    As entradas são os centros dos canais (ENERGIAS); linhas fora
+    deles se repartem entre os vizinhos (ver `vetor_linhas`).
+    """
+    cristal = CRISTAIS[nome]
+    pt = pico_total(cristal, ENERGIAS)
+    klein_nishina, vale = _depositos()
+    retroespalhamento = np.stack([_distribuir(E) for E in fisica.energia_compton(ENERGIAS, 180.0)],
+                                 axis=1)
+
+    depositos = (1 - FRACAO_RETROESPALHAMENTO) * (
+        np.diag(pt) + (1 - pt) * ((1 - FRACAO_VALE) * klein_nishina + FRACAO_VALE * vale))
+    depositos += FRACAO_RETROESPALHAMENTO * retroespalhamento
+
+    matriz = _resolucao(cristal) @ depositos
+    matriz *= cristal.area * eficiencia_intrinseca(cristal, ENERGIAS)
+    matriz.flags.writeable = False
+    return matriz
+
+# ============================================================
+# ESPECTROS
+# ============================================================
+
+def vetor_linhas(energias, fluencias):
+    """Fluência (fótons/cm²/s) das linhas nas energias de entrada da matriz"""
+    return _distribuir(energias, fluencias)
+
+def linhas_fonte(nome, atividade, distancia):
+    """(energias, fluências) de uma fonte pontual de `atividade` MBq no vácuo"""
+    n = nuclideos.nuclideo(nome)
+    fluencia = atividade * 1e6 / (4 * np.pi * (100 * distancia)**2)
+    return n.energias, fluencia * n.rendimentos
+
+@functools.lru_cache(maxsize=1)
+def fundo_natural():
+    """Fluência da radiação natural nas energias de entrada da matriz"""
+    energias, fluencias = zip(*LINHAS_FUNDO)
+    continuo = np.exp(-ENERGIAS / 200.0)
+    vetor = vetor_linhas(energias, fluencias) + CONTINUO_FUNDO * continuo / continuo.sum()
+    vetor.flags.writeable = False
+    return vetor
+
+def espectro_esperado(nome, energias, fluencias, tempo, fundo=True):
+    """Contagens médias por canal em `tempo` segundos"""
+    entrada = vetor_linhas(energias, fluencias)
+    if fundo:
+        entrada = entrada + fundo_natural()
+    return matriz_resposta(nome) @ entrada * tempo
+
+def amostrar(esperado, rng):
+    """Espectro medido: Poisson em cada canal"""
+    return rng.poisson(esperado)
+
+def janela(nome, E):
+    """Canais da janela do fotopico de energia E (±1 FWHM)"""
+    largura = fwhm(CRISTAIS[nome], E)
+    inicio = int(np.clip(np.ceil(_canal(E - largura)), 0, CANAIS))
+    fim = int(np.clip(np.floor(_canal(E + largura)) + 1, 0, CANAIS))
+    return slice(inicio, fim)
+
+def contagens_janela(espectro, nome, E):
+    """Contagens do espectro na janela do fotopico de energia E"""
+    return float(np.sum(espectro[janela(nome, E)]))
+
+def cps_janela_por_taxa(nome, nuclideo="Cs-137"):
+    """cps na janela do fotopico principal por µGy/h de kerma no ar da fonte
+
+    Fluência por taxa de kerma: Φ/K̇ = 10⁵·y / (4π·Γ), com Γ em
+    µGy·m²/(h·GBq).
+    """
+    n = nuclideos.nuclideo(nuclideo)
+    energias, fluencias = n.energias, n.rendimentos * 1e5 / (4 * np.pi * n.gama)
+    return espectro_cps_janela(nome, energias, fluencias, n.energia_principal)
+
+def espectro_cps_janela(nome, energias, fluencias, E, fundo=False):
+    """cps médias na janela do fotopico de energia E"""
+    esperado = espectro_esperado(nome, energias, fluencias, 1.0, fundo=fundo)
+    return contagens_janela(esperado, nome, E)
+
+# ============================================================
+# AQUISIÇÃO AO VIVO
+# ============================================================
+
+def aquisicao(esperado_por_segundo, fatia, tempo_maximo, rng):
+    """Gera (tempo acumulado, incremento) a cada `fatia` s até `tempo_maximo`
+
+    Cada incremento é Poisson(taxa·fatia) canal a canal; a última
+    fatia é encurtada para fechar o tempo máximo.
+    """
+    anterior, i = 0.0, 0
+    while anterior < tempo_maximo:
+        i += 1
+        tempo = min(i * fatia, tempo_maximo)
+        yield tempo, rng.poisson(esperado_por_segundo * (tempo - anterior))
+        anterior = tempo
+
+def significancia_pico(espectro, nome, E):
+    """Área líquida do pico de energia E dividida pela sua incerteza
+
+    O fundo sob o pico vem de duas bandas laterais com metade da
+    largura da janela cada: custa O(janela), não O(espectro).
+    """
+    j = janela(nome, E)
+    meia = max((j.stop - j.start) // 2, 1)
+    esquerda = slice(max(j.start - meia, 0), j.start)
+    direita = slice(j.stop, min(j.stop + meia, CANAIS))
+    largura_bandas = (esquerda.stop - esquerda.start) + (direita.stop - direita.start)
+    if largura_bandas == 0:
+        return 0.0
+
+    bruto = float(np.sum(espectro[j]))
+    bandas = float(np.sum(espectro[esquerda]) + np.sum(espectro[direita]))
+    k = (j.stop - j.start) / largura_bandas
+    liquido = bruto - k * bandas
+    variancia = bruto + k**2 * bandas
+    return liquido / np.sqrt(variancia) if variancia > 0 else 0.0
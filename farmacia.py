@@ -0,0 +1,138 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Agenda da Farmácia Radioativa
+=============================================================
+
+Correção em lote de uma agenda de doses, sem nenhuma
+dependência do Streamlit.
+
+Uma agenda tem uma linha por dose:
+- paciente: identificação do paciente
+- horas: horas entre o preparo e a administração
+- atividade_prescrita: atividade prescrita (MBq)
+- nuclideo: radionuclídeo (um dos NUCLIDEOS)
+- atividade_inicial (opcional): atividade no preparo (MBq)
+
+As agendas são lidas em blocos (CSV ou JSON Lines) e cada bloco
+é corrigido com uma única operação NumPy sobre todas as linhas.
+=============================================================
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import fisica
+import nuclideos
+
+# Radiofármacos da farmácia e suas meias-vidas (horas), na mesma ordem
+NUCLIDEOS = ("I-131", "Tc-99m", "F-18", "Ga-68", "Lu-177", "Ra-223")
+MEIAS_VIDAS_HORAS = nuclideos.meias_vidas(NUCLIDEOS) / nuclideos.HORA
+
+ATIVIDADE_INICIAL = 3000.0  # MBq, preparo padrão da missão
+LIMITE_ACEITAVEL = 5.0  # ±%
+LINHAS_POR_BLOCO = 50_000
+
+TIPOS_ENTRADA = {
+    "paciente": "string",
+    "horas": "float64",
+    "atividade_prescrita": "float64",
+    "nuclideo": pd.CategoricalDtype(list(NUCLIDEOS)),
+    "atividade_inicial": "float64",
+}
+
+SITUACOES = pd.CategoricalDtype(["aceitável", "excessiva", "insuficiente"])
+
+# ============================================================
+# LEITURA EM BLOCOS
+# ============================================================
+
+def ler_agenda(arquivo, formato=None, linhas_por_bloco=LINHAS_POR_BLOCO):
+    """Gera a agenda em DataFrames tipados de até linhas_por_bloco linhas
+
+    `arquivo` pode ser um caminho ou um arquivo aberto; `formato`
+    ("csv" ou "jsonl") é deduzido da extensão quando omitido. Um
+    .json com uma lista de objetos é lido inteiro, pois não há como
+    dividi-lo sem um parser incremental; use JSON Lines para agendas
+    grandes.
+    """
+    if formato is None:
+        formato = Path(getattr(arquivo, "name", str(arquivo))).suffix.lstrip(".").lower()
+
+    if formato == "csv":
+        blocos = pd.read_csv(arquivo, chunksize=linhas_por_bloco,
+                             dtype={c: t for c, t in TIPOS_ENTRADA.items() if c != "nuclideo"})
+    elif formato in ("jsonl", "ndjson"):
+        blocos = pd.read_json(arquivo, lines=True, chunksize=linhas_por_bloco, dtype=False)
+    elif formato == "json":
+        blocos = [pd.read_json(arquivo, dtype=False)]
+    else:
+        raise ValueError(f"Formato de agenda desconhecido: {formato!r} (use csv, jsonl ou json)")
+
+    for bloco in blocos:
+        yield tipar_agenda(bloco)
+
+def tipar_agenda(bloco):
+    """Converte as colunas da agenda para os tipos esperados"""
+    faltando = {"paciente", "horas", "atividade_prescrita", "nuclideo"} - set(bloco.columns)
+    if faltando:
+        raise ValueError(f"Colunas ausentes na agenda: {', '.join(sorted(faltando))}")
+
+    if "atividade_inicial" not in bloco.columns:
+        bloco = bloco.assign(atividade_inicial=ATIVIDADE_INICIAL)
+    bloco = bloco[list(TIPOS_ENTRADA)].astype(TIPOS_ENTRADA)
+
+    desconhecidos = bloco["nuclideo"].isna()
+    if desconhecidos.any():
+        linha = bloco.index[desconhecidos][0]
+        raise ValueError(f"Radionuclídeo desconhecido no registro {linha + 1} "
+                         f"(conhecidos: {', '.join(NUCLIDEOS)})")
+    return bloco
+
+# ============================================================
+# CORREÇÃO VETORIZADA
+# ============================================================
+
+def corrigir_bloco(agenda, limite=LIMITE_ACEITAVEL):
+    """Atividade decaída, desvio e situação de todas as doses de uma vez"""
+    meias_vidas = MEIAS_VIDAS_HORAS[agenda["nuclideo"].cat.codes.to_numpy()]
+
+    atividade = fisica.atividade_decaida(agenda["atividade_inicial"].to_numpy(),
+                                         agenda["horas"].to_numpy(), meias_vidas)
+    desvio = fisica.desvio_percentual(atividade, agenda["atividade_prescrita"].to_numpy())
+    aceitavel = np.abs(desvio) <= limite
+    situacao = np.where(aceitavel, 0, np.where(desvio > 0, 1, 2))
+
+    return agenda.assign(
+        atividade=atividade,
+        desvio_percentual=desvio,
+        aceitavel=aceitavel,
+        situacao=pd.Categorical.from_codes(situacao, dtype=SITUACOES),
+    )
+
+def corrigir_agenda(arquivo, formato=None, limite=LIMITE_ACEITAVEL,
+                    linhas_por_bloco=LINHAS_POR_BLOCO):
+    """Lê e corrige a agenda bloco a bloco, devolvendo um único DataFrame"""
+    blocos = [corrigir_bloco(bloco, limite)
+              for bloco in ler_agenda(arquivo, formato, linhas_por_bloco)]
+    if not blocos:
+        return corrigir_bloco(tipar_agenda(pd.DataFrame(columns=list(TIPOS_ENTRADA))), limite)
+    return pd.concat(blocos, ignore_index=True)
+
+def agenda_exemplo(linhas, semente=0):
+    """Agenda sintética de um dia de treinamento (doses preparadas às 06:00)"""
+    rng = np.random.default_rng(semente)
+    codigos = rng.integers(len(NUCLIDEOS), size=linhas)
+    horas = np.round(rng.uniform(0.5, 12.0, linhas) * 2) / 2
+
+    # Prescrições em torno da atividade correta, algumas fora da tolerância
+    correta = fisica.atividade_decaida(ATIVIDADE_INICIAL, horas, MEIAS_VIDAS_HORAS[codigos])
+    prescrita = np.round(correta * rng.normal(1.0, 0.05, linhas))
+
+    return pd.DataFrame({
+        "paciente": [f"Paciente {i + 1:04d}" for i in range(linhas)],
+        "horas": horas,
+        "atividade_prescrita": prescrita,
+        "nuclideo": np.array(NUCLIDEOS)[codigos],
+    })
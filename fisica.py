@@ -0,0 +1,95 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Núcleo de Física
+=============================================================
+
+Fórmulas do jogo sem nenhuma dependência do Streamlit.
+
+Todas as funções aceitam escalares ou arrays NumPy e seguem as
+regras de broadcasting: passar arrays de entradas devolve arrays
+de resultados, o que permite corrigir e pré-calcular milhares de
+casos numa única chamada.
+=============================================================
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+# ============================================================
+# CONSTANTES FÍSICAS
+# ============================================================
+
+CARGA_ELETRON = 1.6e-19  # C (e também J/eV)
+ENERGIA_REPOUSO_ELETRON = 511.0  # keV
+
+# ============================================================
+# DECAIMENTO RADIOATIVO
+# ============================================================
+
+def fracao_remanescente(t, T_meia):
+    """Fração (½)^(t/T) que resta após o tempo t (mesma unidade de T)"""
+    t = np.asarray(t, dtype=float)
+    T_meia = np.asarray(T_meia, dtype=float)
+    return 0.5 ** (t / T_meia)
+
+def atividade_decaida(A0, t, T_meia):
+    """Atividade A(t) = A₀ × (½)^(t/T)"""
+    return np.asarray(A0, dtype=float) * fracao_remanescente(t, T_meia)
+
+def desvio_percentual(valor, referencia):
+    """Diferença percentual de valor em relação à referência"""
+    valor = np.asarray(valor, dtype=float)
+    referencia = np.asarray(referencia, dtype=float)
+    return (valor - referencia) / referencia * 100
+
+# ============================================================
+# INTERAÇÃO DA RADIAÇÃO COM A MATÉRIA
+# ============================================================
+
+def energia_compton(E, theta_graus):
+    """Energia E' (keV) do fóton espalhado: E / [1 + (E/511)(1 - cosθ)]"""
+    E = np.asarray(E, dtype=float)
+    theta = np.radians(theta_graus)
+    return E / (1 + (E / ENERGIA_REPOUSO_ELETRON) * (1 - np.cos(theta)))
+
+def transmissao(mu, x):
+    """Fração transmitida I/I₀ = e^(-μx) (μ em cm⁻¹, x em cm)"""
+    return np.exp(-np.asarray(mu, dtype=float) * np.asarray(x, dtype=float))
+
+def espessura_para_reducao(mu, R):
+    """Espessura x = -ln(1/R) / μ que reduz a intensidade R vezes"""
+    return -np.log(1 / np.asarray(R, dtype=float)) / np.asarray(mu, dtype=float)
+
+# ============================================================
+# DOSIMETRIA COM CÂMARA DE IONIZAÇÃO
+# ============================================================
+
+class ResultadoCamara(NamedTuple):
+    """Grandezas intermediárias da cadeia corrente → taxa de dose"""
+    Q: np.ndarray         # carga coletada (C)
+    N: np.ndarray         # pares íon-elétron
+    E_eV: np.ndarray      # energia absorvida (eV)
+    E_J: np.ndarray       # energia absorvida (J)
+    volume_m3: np.ndarray # volume da câmara (m³)
+    m: np.ndarray         # massa de ar (kg)
+    D_ar: np.ndarray      # dose no ar (Gy)
+    D_agua: np.ndarray    # dose em água (Gy)
+    taxa: np.ndarray      # taxa de dose em água (Gy/s)
+
+def dose_camara_ionizacao(corrente, tempo, volume_cm3, W, densidade_ar, fator_agua):
+    """Cadeia de sete passos da câmara de ionização, de I (A) até Ḋ (Gy/s)"""
+    corrente = np.asarray(corrente, dtype=float)
+    tempo = np.asarray(tempo, dtype=float)
+
+    Q = corrente * tempo
+    N = Q / CARGA_ELETRON
+    E_eV = N * np.asarray(W, dtype=float)
+    E_J = E_eV * CARGA_ELETRON
+    volume_m3 = np.asarray(volume_cm3, dtype=float) * 1e-6
+    m = np.asarray(densidade_ar, dtype=float) * volume_m3
+    D_ar = E_J / m
+    D_agua = D_ar * np.asarray(fator_agua, dtype=float)
+    taxa = D_agua / tempo
+
+    return ResultadoCamara(Q, N, E_eV, E_J, volume_m3, m, D_ar, D_agua, taxa)
@@ -0,0 +1,518 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Renderização de Gráficos
+=============================================================
+
+Cache de figuras endereçado por conteúdo: cada gráfico é
+identificado pela página que o desenha e pelas suas entradas
+normalizadas, e o PNG já codificado é reaproveitado enquanto
+as entradas não mudarem.
+
+As figuras são criadas pela API orientada a objetos do
+Matplotlib (Figure + canvas Agg), sem passar pelo registro
+global do pyplot: cada sessão desenha na sua própria figura,
+emprestada de um pool com limite de figuras abertas por processo.
+
+Os gráficos das páginas são descritos de forma declarativa
+(classe Grafico) e exibidos pelo backend escolhido na implantação
+pela variável de ambiente FMGAME_GRAFICOS:
+- "matplotlib" (padrão): PNG renderizado no servidor
+- "vega": apenas os dados vão ao navegador, que desenha com Vega-Lite
+=============================================================
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+import streamlit as st
+
+# Limites do pool de figuras por processo
+MAX_FIGURAS_ABERTAS = 8
+MAX_FIGURAS_OCIOSAS = 4
+
+# Backend de exibição escolhido por implantação
+BACKEND_GRAFICOS = os.environ.get("FMGAME_GRAFICOS", "matplotlib").lower()
+
+# Paleta tab10 (mesmas cores nos dois backends)
+PALETA = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+          "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
+
+# ============================================================
+# CACHE DE FIGURAS (LRU)
+# ============================================================
+
+class CacheFiguras:
+    """Cache LRU de PNGs limitado pelo total de bytes armazenados"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes_usados = 0
+        self.acertos = 0
+        self.falhas = 0
+        self._itens = OrderedDict()
+        self._trava = threading.Lock()
+
+    def obter(self, chave):
+        """Retorna o PNG da chave (ou None) e atualiza os contadores"""
+        with self._trava:
+            png = self._itens.get(chave)
+            if png is None:
+                self.falhas += 1
+                return None
+            self._itens.move_to_end(chave)
+            self.acertos += 1
+            return png
+
+    def guardar(self, chave, png):
+        """Armazena o PNG, descartando os itens menos usados se preciso"""
+        if len(png) > self.max_bytes:
+            return
+        with self._trava:
+            antigo = self._itens.pop(chave, None)
+            if antigo is not None:
+                self.bytes_usados -= len(antigo)
+            self._itens[chave] = png
+            self.bytes_usados += len(png)
+            while self.bytes_usados > self.max_bytes:
+                _, removido = self._itens.popitem(last=False)
+                self.bytes_usados -= len(removido)
+
+    def limpar(self):
+        """Esvazia o cache e zera os contadores"""
+        with self._trava:
+            self._itens.clear()
+            self.bytes_usados = 0
+            self.acertos = 0
+            self.falhas = 0
+
+    def estatisticas(self):
+        """Contadores de acertos/falhas e ocupação atual"""
+        with self._trava:
+            total = self.acertos + self.falhas
+            return {
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "taxa_acerto": self.acertos / total if total else 0.0,
+                "itens": len(self._itens),
+                "bytes": self.bytes_usados,
+            }
+
+# Cache compartilhado por todas as sessões do processo
+cache_figuras = CacheFiguras()
+
+# ============================================================
+# POOL DE FIGURAS
+# ============================================================
+
+class PoolFiguras:
+    """Empresta figuras Agg reutilizáveis, com teto de figuras abertas"""
+
+    def __init__(self, max_abertas=MAX_FIGURAS_ABERTAS, max_ociosas=MAX_FIGURAS_OCIOSAS):
+        self.max_abertas = max_abertas
+        self.max_ociosas = max_ociosas
+        self.criadas = 0
+        self.em_uso = 0
+        self._ociosas = []
+        self._vagas = threading.BoundedSemaphore(max_abertas)
+        self._trava = threading.Lock()
+
+    @contextmanager
+    def emprestar(self, figsize=(10, 5)):
+        """Fornece uma figura limpa; bloqueia se o teto estiver atingido"""
+        self._vagas.acquire()
+        try:
+            with self._trava:
+                if self._ociosas:
+                    fig = self._ociosas.pop()
+                else:
+                    # Importação tardia: o backend Vega nunca carrega o Matplotlib
+                    from matplotlib.backends.backend_agg import FigureCanvasAgg
+                    from matplotlib.figure import Figure
+                    fig = Figure()
+                    FigureCanvasAgg(fig)
+                    self.criadas += 1
+                self.em_uso += 1
+            fig.set_size_inches(figsize)
+            try:
+                yield fig
+            finally:
+                fig.clear()
+                with self._trava:
+                    self.em_uso -= 1
+                    if len(self._ociosas) < self.max_ociosas:
+                        self._ociosas.append(fig)
+        finally:
+            self._vagas.release()
+
+    def estatisticas(self):
+        """Figuras criadas, em uso e ociosas no pool"""
+        with self._trava:
+            return {
+                "criadas": self.criadas,
+                "em_uso": self.em_uso,
+                "ociosas": len(self._ociosas),
+            }
+
+pool_figuras = PoolFiguras()
+
+# ============================================================
+# CHAVES DE CACHE
+# ============================================================
+
+def _normalizar(valor):
+    """Converte entradas em estruturas JSON estáveis"""
+    if isinstance(valor, dict):
+        return {str(k): _normalizar(v) for k, v in sorted(valor.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(valor, (list, tuple)):
+        return [_normalizar(v) for v in valor]
+    if isinstance(valor, np.ndarray):
+        return _normalizar(valor.tolist())
+    if isinstance(valor, (bool, np.bool_)):
+        return bool(valor)
+    if isinstance(valor, (int, np.integer)):
+        return int(valor)
+    if isinstance(valor, (float, np.floating)):
+        # 12 algarismos significativos: 0.1 + 0.2 e 0.3 geram a mesma chave
+        return float(f"{float(valor):.12g}")
+    return str(valor)
+
+def chave_figura(pagina, entradas):
+    """Chave de conteúdo (SHA-256) para a página e suas entradas"""
+    texto = json.dumps([pagina, _normalizar(entradas)], sort_keys=True,
+                       ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+# ============================================================
+# RENDERIZAÇÃO
+# ============================================================
+
+def renderizar_png(desenhar, figsize=(10, 5)):
+    """Desenha a figura com a função `desenhar(ax)` e devolve o PNG"""
+    with pool_figuras.emprestar(figsize) as fig:
+        ax = fig.subplots()
+        desenhar(ax)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+        return buffer.getvalue()
+
+def figura_png(pagina, entradas, desenhar, figsize=(10, 5)):
+    """PNG da figura, reaproveitado do cache quando as entradas se repetem"""
+    chave = chave_figura(pagina, {"entradas": entradas, "figsize": figsize})
+    png = cache_figuras.obter(chave)
+    if png is None:
+        png = renderizar_png(desenhar, figsize)
+        cache_figuras.guardar(chave, png)
+    return png
+
+# ============================================================
+# DESCRIÇÃO DECLARATIVA DOS GRÁFICOS
+# ============================================================
+
+class Grafico:
+    """Descrição de um gráfico simples, independente do backend"""
+
+    def __init__(self, titulo="", eixo_x="", eixo_y="", escala_y="linear",
+                 y_min=None, grade="both", escala_x="linear"):
+        self.titulo = titulo
+        self.eixo_x = eixo_x
+        self.eixo_y = eixo_y
+        self.escala_x = escala_x
+        self.escala_y = escala_y
+        self.y_min = y_min
+        self.grade = grade
+        self.camadas = []
+
+    def _camada(self, tipo, **campos):
+        self.camadas.append({"tipo": tipo, **campos})
+        return self
+
+    def linha(self, x, y, cor=PALETA[0], rotulo=None, espessura=2, estilo="-"):
+        return self._camada("linha", x=np.asarray(x, dtype=float), y=np.asarray(y, dtype=float),
+                            cor=cor, rotulo=rotulo, espessura=espessura, estilo=estilo)
+
+    def area(self, x, y, cor=PALETA[0], opacidade=0.3):
+        return self._camada("area", x=np.asarray(x, dtype=float), y=np.asarray(y, dtype=float),
+                            cor=cor, opacidade=opacidade)
+
+    def pontos(self, x, y, cor="red", rotulo=None, tamanho=100):
+        return self._camada("pontos", x=np.atleast_1d(np.asarray(x, dtype=float)),
+                            y=np.atleast_1d(np.asarray(y, dtype=float)),
+                            cor=cor, rotulo=rotulo, tamanho=tamanho)
+
+    def vertical(self, x, cor="gray", estilo="--", rotulo=None, opacidade=0.7):
+        return self._camada("vertical", valor=float(x), cor=cor, estilo=estilo,
+                            rotulo=rotulo, opacidade=opacidade)
+
+    def horizontal(self, y, cor="gray", estilo="--", rotulo=None, opacidade=0.7):
+        return self._camada("horizontal", valor=float(y), cor=cor, estilo=estilo,
+                            rotulo=rotulo, opacidade=opacidade)
+
+    def barras(self, categorias, valores, cores):
+        return self._camada("barras", categorias=list(categorias),
+                            valores=np.asarray(valores, dtype=float), cores=list(cores))
+
+    def texto(self, x, y, textos, cor="black", deslocamento=(0, 5), tamanho=9):
+        return self._camada("texto", x=list(x), y=np.asarray(y, dtype=float),
+                            textos=list(textos), cor=cor, deslocamento=deslocamento,
+                            tamanho=tamanho)
+
+    def calor(self, matriz, rotulo="", escala="linear", mapa_cores="inferno"):
+        """Mapa de calor de uma matriz linhas × colunas (NaN fica em branco)
+
+        A célula (i, j) é desenhada centrada em x = j, y = i, com o
+        eixo y para baixo, como nas linhas de uma matriz.
+        """
+        return self._camada("calor", matriz=np.asarray(matriz, dtype=float), rotulo_cor=rotulo,
+                            escala=escala, mapa_cores=mapa_cores)
+
+    def conteudo(self):
+        """Todos os atributos do gráfico, usados como chave de cache"""
+        return {
+            "titulo": self.titulo, "eixo_x": self.eixo_x, "eixo_y": self.eixo_y,
+            "escala_x": self.escala_x, "escala_y": self.escala_y, "y_min": self.y_min, "grade": self.grade,
+            "camadas": self.camadas,
+        }
+
+# ============================================================
+# BACKEND MATPLOTLIB (PNG NO SERVIDOR)
+# ============================================================
+
+_ESTILOS_MPL = {"-": "-", "--": "--", ":": ":"}
+
+def desenhar_matplotlib(ax, grafico):
+    """Desenha a descrição do gráfico num Axes do Matplotlib"""
+    for c in grafico.camadas:
+        tipo = c["tipo"]
+        if tipo == "linha":
+            ax.plot(c["x"], c["y"], color=c["cor"], linewidth=c["espessura"],
+                    linestyle=_ESTILOS_MPL[c["estilo"]], label=c["rotulo"])
+        elif tipo == "area":
+            ax.fill_between(c["x"], 0, c["y"], color=c["cor"], alpha=c["opacidade"])
+        elif tipo == "pontos":
+            ax.scatter(c["x"], c["y"], color=c["cor"], s=c["tamanho"], zorder=5,
+                       label=c["rotulo"])
+        elif tipo == "vertical":
+            ax.axvline(x=c["valor"], color=c["cor"], linestyle=c["estilo"],
+                       alpha=c["opacidade"], label=c["rotulo"])
+        elif tipo == "horizontal":
+            ax.axhline(y=c["valor"], color=c["cor"], linestyle=c["estilo"],
+                       alpha=c["opacidade"], label=c["rotulo"])
+        elif tipo == "barras":
+            ax.bar(c["categorias"], c["valores"], color=c["cores"])
+        elif tipo == "calor":
+            matriz = np.ma.masked_invalid(c["matriz"])
+            normalizacao = None
+            positivos = matriz.compressed()
+            positivos = positivos[positivos > 0]
+            # Sem nenhum valor positivo (mapa todo blindado) a escala log não existe: fica linear
+            if c["escala"] == "log" and positivos.size:
+                from matplotlib.colors import LogNorm
+                normalizacao = LogNorm(vmin=positivos.min(), vmax=positivos.max())
+            imagem = ax.imshow(matriz, cmap=c["mapa_cores"], norm=normalizacao,
+                               interpolation="nearest", origin="upper", zorder=0)
+            ax.figure.colorbar(imagem, ax=ax, label=c["rotulo_cor"])
+        elif tipo == "texto":
+            for x, y, texto in zip(c["x"], c["y"], c["textos"]):
+                ax.annotate(texto, xy=(x, y), xytext=c["deslocamento"],
+                            textcoords="offset points", color=c["cor"],
+                            fontsize=c["tamanho"], ha="center", va="bottom")
+
+    ax.set_xlabel(grafico.eixo_x)
+    ax.set_ylabel(grafico.eixo_y)
+    ax.set_title(grafico.titulo)
+    if grafico.escala_x == "log":
+        ax.set_xscale("log")
+    if grafico.escala_y == "log":
+        ax.set_yscale("log")
+    if grafico.y_min is not None:
+        ax.set_ylim(bottom=grafico.y_min)
+    if any(c.get("rotulo") for c in grafico.camadas):
+        ax.legend()
+    if any(c["tipo"] == "calor" for c in grafico.camadas):
+        ax.grid(False)
+    elif grafico.grade == "y":
+        ax.grid(True, axis="y", alpha=0.3)
+    else:
+        ax.grid(True, alpha=0.3, which="both")
+
+# ============================================================
+# BACKEND VEGA-LITE (DESENHO NO NAVEGADOR)
+# ============================================================
+
+_ESTILOS_VEGA = {"-": None, "--": [6, 4], ":": [2, 3]}
+MAX_CELULAS_VEGA = 20_000
+
+def _enxuto(valores):
+    """Arredonda para 5 algarismos significativos para encolher o JSON"""
+    return [float(f"{v:.5g}") for v in np.asarray(valores, dtype=float).tolist()]
+
+def _eixos_vega(grafico):
+    """Codificações x e y (campos "x" e "y") comuns a todas as camadas"""
+    eixo_y = {"title": grafico.eixo_y, "grid": True}
+    escala_y = {"type": "log"} if grafico.escala_y == "log" else {}
+    if grafico.y_min is not None:
+        escala_y["domainMin"] = grafico.y_min
+    if any(c["tipo"] == "calor" for c in grafico.camadas):
+        # Linhas de matriz: y cresce para baixo
+        escala_y["reverse"] = True
+    x = {"field": "x", "type": "quantitative", "title": grafico.eixo_x,
+         "axis": {"grid": grafico.grade != "y"}}
+    if grafico.escala_x == "log":
+        x["scale"] = {"type": "log"}
+    y = {"field": "y", "type": "quantitative", "axis": eixo_y, "scale": escala_y}
+    return x, y
+
+def especificacao_vega(grafico):
+    """Especificação Vega-Lite (dict) equivalente à descrição do gráfico"""
+    # Escala de cor compartilhada: uma entrada de legenda por rótulo
+    rotulos = [c for c in grafico.camadas if c.get("rotulo")]
+    escala_cor = {"domain": [c["rotulo"] for c in rotulos],
+                  "range": [c["cor"] for c in rotulos]}
+
+    def cor(c):
+        if c.get("rotulo"):
+            return {"color": {"field": "serie", "type": "nominal", "scale": escala_cor,
+                              "legend": {"title": None}}}
+        return {}
+
+    def serie(c, colunas=False):
+        # O rótulo entra por transformação, sem repetir o texto em cada ponto
+        transformacoes = [{"flatten": ["x", "y"]}] if colunas else []
+        if c.get("rotulo"):
+            transformacoes.append({"calculate": json.dumps(c["rotulo"]), "as": "serie"})
+        return {"transform": transformacoes} if transformacoes else {}
+
+    x, y = _eixos_vega(grafico)
+
+    camadas = []
+    for c in grafico.camadas:
+        tipo = c["tipo"]
+        if tipo in ("linha", "area", "pontos"):
+            # Dados em colunas, expandidos no navegador: as chaves não se repetem
+            dados = [{"x": _enxuto(c["x"]), "y": _enxuto(c["y"])}]
+            if tipo == "linha":
+                marca = {"type": "line", "strokeWidth": c["espessura"], "color": c["cor"]}
+                if _ESTILOS_VEGA[c["estilo"]]:
+                    marca["strokeDash"] = _ESTILOS_VEGA[c["estilo"]]
+            elif tipo == "area":
+                marca = {"type": "area", "opacity": c["opacidade"], "color": c["cor"]}
+            else:
+                marca = {"type": "point", "filled": True, "size": c["tamanho"], "color": c["cor"]}
+            camadas.append({"data": {"values": dados}, "mark": marca, **serie(c, colunas=True),
+                            "encoding": {"x": x, "y": y, **cor(c)}})
+        elif tipo in ("vertical", "horizontal"):
+            eixo = "x" if tipo == "vertical" else "y"
+            marca = {"type": "rule", "color": c["cor"], "opacity": c["opacidade"]}
+            if _ESTILOS_VEGA[c["estilo"]]:
+                marca["strokeDash"] = _ESTILOS_VEGA[c["estilo"]]
+            camadas.append({"data": {"values": [{eixo: float(f"{c['valor']:.5g}")}]},
+                            "mark": marca, **serie(c),
+                            "encoding": {eixo: x if eixo == "x" else y, **cor(c)}})
+        elif tipo == "barras":
+            dados = [{"x": n, "y": v, "cor": k}
+                     for n, v, k in zip(c["categorias"], _enxuto(c["valores"]), c["cores"])]
+            camadas.append({"data": {"values": dados}, "mark": {"type": "bar"},
+                            "encoding": {"x": {"field": "x", "type": "nominal", "title": grafico.eixo_x,
+                                               "sort": None, "axis": {"labelAngle": 0}},
+                                         "y": y,
+                                         "color": {"field": "cor", "type": "nominal",
+                                                   "scale": None, "legend": None}}})
+        elif tipo == "calor":
+            # Só as células definidas; matrizes grandes vão amostradas
+            matriz = c["matriz"]
+            passo = max(1, int(np.ceil(np.sqrt(np.isfinite(matriz).sum() / MAX_CELULAS_VEGA))))
+            linhas, colunas = np.nonzero(np.isfinite(matriz[::passo, ::passo]))
+            valores = matriz[::passo, ::passo][linhas, colunas]
+            dados = [{"x": (colunas * passo).tolist(), "y": (linhas * passo).tolist(),
+                      "v": _enxuto(valores)}]
+            meio = passo / 2
+            escala_cor = {"scheme": c["mapa_cores"]}
+            if c["escala"] == "log" and np.any(valores > 0):
+                escala_cor["type"] = "log"
+            camadas.append({"data": {"values": dados},
+                            "transform": [{"flatten": ["x", "y", "v"]},
+                                          {"calculate": f"datum.x - {meio}", "as": "x0"},
+                                          {"calculate": f"datum.x + {meio}", "as": "x1"},
+                                          {"calculate": f"datum.y - {meio}", "as": "y0"},
+                                          {"calculate": f"datum.y + {meio}", "as": "y1"}],
+                            "mark": {"type": "rect"},
+                            "encoding": {"x": {**x, "field": "x0"}, "x2": {"field": "x1"},
+                                         "y": {**y, "field": "y0"}, "y2": {"field": "y1"},
+                                         "color": {"field": "v", "type": "quantitative",
+                                                   "scale": escala_cor,
+                                                   "legend": {"title": c["rotulo_cor"]}}}})
+        elif tipo == "texto":
+            dados = [{"x": a, "y": b, "texto": t}
+                     for a, b, t in zip(c["x"], _enxuto(c["y"]), c["textos"])]
+            tipo_x = "nominal" if any(isinstance(a, str) for a in c["x"]) else "quantitative"
+            camadas.append({"data": {"values": dados},
+                            "mark": {"type": "text", "color": c["cor"], "fontSize": c["tamanho"] + 2,
+                                     "dx": c["deslocamento"][0], "dy": -c["deslocamento"][1],
+                                     "baseline": "bottom"},
+                            "encoding": {"x": {**x, "type": tipo_x, "sort": None}, "y": y,
+                                         "text": {"field": "texto"}}})
+
+    especificacao = {"layer": camadas}
+    if any(c["tipo"] in ("barras", "calor") for c in grafico.camadas):
+        # Cores fixas das barras e a escala do mapa de calor não entram na
+        # legenda das demais camadas
+        especificacao["resolve"] = {"scale": {"color": "independent"}}
+    if grafico.titulo:
+        especificacao["title"] = grafico.titulo.split("\n")
+    return especificacao
+
+# ============================================================
+# EXIBIÇÃO
+# ============================================================
+
+def backend_cliente():
+    """True quando a implantação desenha os gráficos no navegador"""
+    return BACKEND_GRAFICOS == "vega"
+
+def exibir(grafico, pagina, figsize=(10, 5), cache=True):
+    """Exibe o gráfico na página com o backend configurado
+
+    Figuras que mudam a cada execução (ruído sorteado sem semente)
+    passam `cache=False`: o PNG não entraria em cache de novo e só
+    expulsaria as figuras determinísticas do LRU.
+    """
+    if backend_cliente():
+        st.vega_lite_chart(especificacao_vega(grafico), width="stretch")
+        return
+    if cache:
+        png = figura_png(pagina, grafico.conteudo(),
+                         lambda ax: desenhar_matplotlib(ax, grafico), figsize)
+    else:
+        png = renderizar_png(lambda ax: desenhar_matplotlib(ax, grafico), figsize)
+    st.image(png, width="stretch")
+
+class GraficoAoVivo:
+    """Série y(x) redesenhada no mesmo lugar, quadro a quadro
+
+    Desenhado sempre no navegador, qualquer que seja o backend: a
+    especificação Vega-Lite (título, eixos e as camadas fixas de
+    `grafico`) não muda entre quadros e cada quadro envia só a
+    série, de tamanho fixo. O navegador troca os dados da vista já
+    montada, sem recriar o gráfico.
+    """
+
+    def __init__(self, grafico, cor=PALETA[0]):
+        x, y = _eixos_vega(grafico)
+        self.especificacao = especificacao_vega(grafico)
+        # Camadas sem "data" próprio leem os dados de cada quadro
+        self.especificacao["layer"][:0] = [
+            {"mark": {"type": "area", "opacity": 0.3, "color": cor}, "encoding": {"x": x, "y": y}},
+            {"mark": {"type": "line", "strokeWidth": 1.5, "color": cor}, "encoding": {"x": x, "y": y}},
+        ]
+        self.area = st.empty()
+
+    def quadro(self, x, y):
+        """Substitui a série exibida"""
+        self.area.vega_lite_chart({"x": np.asarray(x), "y": np.asarray(y)}, self.especificacao,
+                                  width="stretch")
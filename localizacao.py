@@ -0,0 +1,162 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Localização Bayesiana de Fontes
+=============================================================
+
+Modelos de ruído dos detectores da missão da fonte perdida e a
+distribuição posterior da posição da fonte, sem nenhuma
+dependência do Streamlit.
+
+A posterior é uma grade atividades × altura × largura de
+log-probabilidades. Cada leitura soma à grade a log-verossimilhança
+de todas as hipóteses (posição, atividade) de uma vez, em O(grade),
+sem revisitar as leituras anteriores.
+
+A leitura esperada na célula m com a fonte em s vem do campo de
+uma fonte unitária posta em m (reciprocidade: o raio s → m cruza
+os mesmos obstáculos que m → s), de modo que cada medição custa
+um único mapa de campo.py, que fica em cache.
+=============================================================
+"""
+
+from typing import NamedTuple
+
+import functools
+
+import numpy as np
+
+import campo
+import espectros
+
+# Atividades candidatas (MBq), em escala logarítmica
+ATIVIDADES = np.geomspace(10.0, 10_000.0, 10)
+FUNDO_NATURAL = 0.1  # µGy/h
+CRISTAL_NAI = '2"×2"'
+E_JANELA_NAI = 661.7  # keV: janela do fotopico do Cs-137
+
+class ModeloDetector(NamedTuple):
+    """Leitura = escala·taxa + fundo, com ruído de Poisson ou gaussiano"""
+    nome: str
+    unidade: str
+    escala: float               # unidade por µGy/h
+    fundo: float                # leitura sem fonte (unidade)
+    ruido: str                  # "poisson" ou "gaussiano"
+    tempo: float = 1.0          # s de contagem (ruído de Poisson)
+    ruido_relativo: float = 0.0 # σ/leitura (ruído gaussiano)
+    ruido_minimo: float = 0.0   # σ mínimo (ruído gaussiano)
+    saturacao: float = np.inf
+
+MODELOS = {
+    "Geiger-Müller": ModeloDetector(
+        "Geiger-Müller", "cps", campo.CPS_POR_TAXA_GM, campo.CPS_POR_TAXA_GM * FUNDO_NATURAL,
+        "poisson", tempo=10.0, saturacao=campo.SATURACAO_GM),
+    "Câmara de Ionização": ModeloDetector(
+        "Câmara de Ionização", "A", float(campo.corrente_camara(1.0)),
+        float(campo.corrente_camara(FUNDO_NATURAL)),
+        "gaussiano", ruido_relativo=0.05, ruido_minimo=5e-17),
+}
+
+@functools.lru_cache(maxsize=None)
+def modelo_nai(cristal=CRISTAL_NAI):
+    """Janela do fotopico de 662 keV, com escala e fundo da matriz de resposta"""
+    escala = espectros.cps_janela_por_taxa(cristal, "Cs-137")
+    fundo = espectros.espectro_cps_janela(cristal, [], [], E_JANELA_NAI, fundo=True)
+    return ModeloDetector("Detector NaI(Tl)", "cps no fotopico", escala, fundo, "poisson", tempo=30.0)
+
+def modelo(nome):
+    """Modelo de ruído do detector da missão (o do NaI é montado na primeira vez)"""
+    return modelo_nai() if nome == "Detector NaI(Tl)" else MODELOS[nome]
+
+# ============================================================
+# MODELOS DE RUÍDO
+# ============================================================
+
+def leitura_esperada(modelo, taxa):
+    """Leitura média (sem ruído) para a taxa de kerma no ar (µGy/h)"""
+    return modelo.escala * np.asarray(taxa) + modelo.fundo
+
+def taxa_equivalente(modelo, leitura):
+    """Taxa de kerma no ar (µGy/h) que a leitura indica, descontado o fundo"""
+    return max(leitura - modelo.fundo, 0.0) / modelo.escala
+
+def amostrar_leitura(modelo, taxa, rng):
+    """Leitura com ruído; o Geiger satura em modelo.saturacao"""
+    esperada = leitura_esperada(modelo, taxa)
+    if modelo.ruido == "poisson":
+        leitura = rng.poisson(esperada * modelo.tempo) / modelo.tempo
+    else:
+        sigma = np.hypot(modelo.ruido_relativo * esperada, modelo.ruido_minimo)
+        leitura = np.maximum(rng.normal(esperada, sigma), 0.0)
+    return float(min(leitura, modelo.saturacao))
+
+def log_verossimilhanca(modelo, leitura, esperada):
+    """ln P(leitura | esperada), a menos de uma constante, em broadcasting
+
+    Poisson sobre as contagens no tempo de contagem; uma leitura
+    saturada só diz que a taxa esperada passa da saturação.
+    """
+    esperada = np.asarray(esperada)
+    if modelo.ruido == "poisson":
+        contagens = leitura * modelo.tempo
+        media = esperada * modelo.tempo
+        if leitura >= modelo.saturacao:
+            return np.where(media >= contagens, 0.0, contagens * np.log(media) - media
+                            - (contagens * np.log(contagens) - contagens))
+        return contagens * np.log(media) - media
+    sigma = np.hypot(modelo.ruido_relativo * esperada, modelo.ruido_minimo)
+    return -0.5 * ((leitura - esperada) / sigma)**2 - np.log(sigma)
+
+# ============================================================
+# POSTERIOR DA POSIÇÃO DA FONTE
+# ============================================================
+
+class Posterior:
+    """Probabilidade de cada (atividade, célula) abrigar a fonte procurada"""
+
+    def __init__(self, cenario, nuclideo="Cs-137", atividades=ATIVIDADES):
+        self.geometria = campo.Cenario(cenario.largura, cenario.altura, (),
+                                       cenario.tamanho_celula, cenario.obstaculos)
+        self.nuclideo = nuclideo
+        self.atividades = np.asarray(atividades, dtype=np.float32)
+        self.medicoes = 0
+
+        # Priori uniforme nas células livres (as fontes não ficam em obstáculos);
+        # float32 basta e reduz à metade a memória e o custo de cada leitura
+        self.log_p = np.zeros((self.atividades.size, cenario.altura, cenario.largura),
+                              dtype=np.float32)
+        for o in cenario.obstaculos:
+            self.log_p[:, o.y0:o.y1 + 1, o.x0:o.x1 + 1] = -np.inf
+
+    def atualizar(self, modelo, x, y, leitura):
+        """Incorpora uma leitura feita na célula (x, y)"""
+        unitario = campo.contribuicoes(self.geometria._replace(
+            fontes=(campo.Fonte(x, y, 1.0, self.nuclideo),)))[0]
+        esperada = leitura_esperada(modelo, self.atividades[:, None, None] * unitario)
+        self.log_p += log_verossimilhanca(modelo, leitura, esperada)
+
+        # Quem mediu sobre a célula teria achado a fonte ali
+        self.log_p[:, y, x] = -np.inf
+        self.log_p -= self.log_p.max()
+        self.medicoes += 1
+
+    def descartar(self, x, y):
+        """Remove a célula (x, y) das hipóteses"""
+        self.log_p[:, y, x] = -np.inf
+
+    def probabilidades(self):
+        """P(fonte na célula), somada sobre as atividades: altura × largura"""
+        p = np.exp(self.log_p).sum(axis=0)
+        return p / p.sum()
+
+    def atividade_provavel(self):
+        """Atividade (MBq) mais provável, somada sobre as posições"""
+        return float(self.atividades[np.exp(self.log_p).sum(axis=(1, 2)).argmax()])
+
+    def mais_provaveis(self, n=5):
+        """As n células mais prováveis: [(x, y, probabilidade), ...]"""
+        p = self.probabilidades()
+        n = min(n, p.size)
+        melhores = np.argpartition(p.ravel(), -n)[-n:]
+        melhores = melhores[np.argsort(p.ravel()[melhores])[::-1]]
+        linhas, colunas = np.unravel_index(melhores, p.shape)
+        return [(int(c), int(l), float(p[l, c])) for l, c in zip(linhas, colunas)]
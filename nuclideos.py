@@ -0,0 +1,98 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Tabela de Nuclídeos
+=============================================================
+
+Fonte única dos dados de nuclídeos do jogo: meia-vida (s),
+linhas de fótons com rendimentos e constante Γ de taxa de
+kerma no ar (µGy·m²/(h·GBq)).
+
+Os dados ficam em dados/*.npy (gerados por
+dados/gerar_nuclideos.py) e são mapeados em memória uma única
+vez por processo, compartilhados por todas as sessões. Cada
+nuclídeo vira um registro imutável indexado pelo nome: a busca
+é um acesso a dicionário, sem alocar nada.
+=============================================================
+"""
+
+import math
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+PASTA_DADOS = Path(__file__).resolve().parent / "dados"
+
+MINUTO = 60.0
+HORA = 60 * MINUTO
+DIA = 24 * HORA
+ANO = 365.25 * DIA
+ESTAVEL = math.inf
+
+UNIDADES_TEMPO = {"segundos": 1.0, "minutos": MINUTO, "horas": HORA, "dias": DIA, "anos": ANO}
+
+class Nuclideo(NamedTuple):
+    """Registro de um nuclídeo (linhas em ordem decrescente de rendimento)"""
+    indice: int
+    nome: str
+    meia_vida: float          # s (ESTAVEL para estáveis)
+    gama: float               # Γ, µGy·m²/(h·GBq)
+    uso: str
+    energias: np.ndarray      # keV
+    rendimentos: np.ndarray   # fótons por decaimento
+
+    @property
+    def energia_principal(self):
+        """Linha de fótons mais intensa (keV), ou None se não houver"""
+        return float(self.energias[0]) if len(self.energias) else None
+
+# ============================================================
+# CARGA (UMA VEZ POR PROCESSO)
+# ============================================================
+
+TABELA = np.load(PASTA_DADOS / "nuclideos.npy", mmap_mode="r")
+LINHAS = np.load(PASTA_DADOS / "linhas_gama.npy", mmap_mode="r")
+
+# Colunas contíguas para consultas vetorizadas por índice
+MEIAS_VIDAS = np.ascontiguousarray(TABELA["meia_vida"])
+CONSTANTES_GAMA = np.ascontiguousarray(TABELA["gama"])
+
+_POR_NOME = {}
+for _i, _registro in enumerate(TABELA):
+    _faixa = slice(int(_registro["primeira_linha"]),
+                   int(_registro["primeira_linha"] + _registro["n_linhas"]))
+    _POR_NOME[str(_registro["nome"])] = Nuclideo(
+        _i, str(_registro["nome"]), float(_registro["meia_vida"]), float(_registro["gama"]),
+        str(_registro["uso"]), LINHAS["energia"][_faixa], LINHAS["rendimento"][_faixa]
+    )
+
+NOMES = tuple(_POR_NOME)
+
+# ============================================================
+# CONSULTAS
+# ============================================================
+
+def nuclideo(nome):
+    """Registro do nuclídeo pelo nome (ex.: "Cs-137")"""
+    try:
+        return _POR_NOME[nome]
+    except KeyError:
+        raise KeyError(f"Nuclídeo desconhecido: {nome!r}") from None
+
+def indices(nomes):
+    """Índices de vários nuclídeos, para indexar MEIAS_VIDAS etc."""
+    return np.array([nuclideo(nome).indice for nome in nomes], dtype=np.intp)
+
+def meias_vidas(nomes):
+    """Meias-vidas (s) de vários nuclídeos, na ordem dada"""
+    return MEIAS_VIDAS[indices(nomes)]
+
+def formatar_meia_vida(segundos):
+    """Meia-vida na unidade mais legível (ex.: "6.01 horas")"""
+    if math.isinf(segundos):
+        return "estável"
+    for unidade in ("anos", "dias", "horas", "minutos"):
+        valor = segundos / UNIDADES_TEMPO[unidade]
+        if valor >= 1:
+            return f"{valor:.4g} {unidade}"
+    return f"{segundos:.4g} segundos"
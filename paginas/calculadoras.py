@@ -0,0 +1,308 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Calculadoras
+=============================================================
+
+Calculadoras interativas de decaimento, efeitos fotoelétrico e
+Compton e dose com câmara de ionização.
+=============================================================
+"""
+
+import numpy as np
+import streamlit as st
+
+import fisica
+import graficos
+
+# ============================================================
+# MÓDULO 3: CALCULADORAS INTERATIVAS
+# ============================================================
+
+def mostrar_calculadoras():
+    """Módulo com calculadoras interativas"""
+    
+    st.title("🧮 CALCULADORAS RADIOLÓGICAS")
+    
+    calculadora = st.selectbox(
+        "Selecione a calculadora:",
+        ["📉 Decaimento Radioativo", "⚡ Efeito Fotoelétrico", 
+         "🔄 Efeito Compton", "📊 Dose com Câmara de Ionização"]
+    )
+    
+    if calculadora == "📉 Decaimento Radioativo":
+        calculadora_decaimento()
+    elif calculadora == "⚡ Efeito Fotoelétrico":
+        calculadora_fotoeletrico()
+    elif calculadora == "🔄 Efeito Compton":
+        calculadora_compton()
+    elif calculadora == "📊 Dose com Câmara de Ionização":
+        calculadora_dose()
+
+@st.fragment
+def calculadora_decaimento():
+    """Calculadora de decaimento radioativo"""
+    
+    st.subheader("📉 Calculadora de Decaimento Radioativo")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        A0 = st.number_input("Atividade Inicial (MBq)", 
+                           min_value=0.0, value=1000.0, step=100.0)
+    
+    with col2:
+        T_half = st.number_input("Meia-vida", 
+                               min_value=0.0, value=6.01, step=0.1)
+        T_unit = st.selectbox("Unidade tempo", ["horas", "dias", "anos"])
+    
+    with col3:
+        t = st.number_input("Tempo decorrido", 
+                          min_value=0.0, value=4.0, step=0.5)
+        t_unit = st.selectbox("Unidade", ["horas", "dias", "anos"])
+    
+    # Converter para mesma unidade (simplificado)
+    if T_unit != t_unit:
+        st.warning("⚠️ Converta para a mesma unidade antes de calcular!")
+    
+    if st.button("Calcular Atividade Atual", type="primary"):
+        A_t = float(fisica.atividade_decaida(A0, t, T_half))
+        
+        st.success(f"**Atividade atual:** {A_t:.2f} MBq")
+        
+        # Gráfico
+        tempos = np.linspace(0, T_half * 3, 100)
+        atividades = fisica.atividade_decaida(A0, tempos, T_half)
+        
+        grafico = graficos.Grafico('Curva de Decaimento Radioativo',
+                                   f'Tempo ({t_unit})', 'Atividade (MBq)')
+        grafico.linha(tempos, atividades, cor='blue', rotulo='Decaimento')
+        grafico.vertical(t, cor='red', rotulo=f'Tempo atual ({t} {t_unit})')
+        grafico.horizontal(A_t, cor='green', rotulo=f'Atividade: {A_t:.1f} MBq')
+        
+        graficos.exibir(grafico, "calculadora_decaimento")
+        
+        # Explicação
+        with st.expander("📚 Explicação Detalhada"):
+            st.markdown(f"""
+            **Fórmula:** A(t) = A₀ × (½)^(t/T₁/₂)
+            
+            **Cálculo passo a passo:**
+            1. A₀ = {A0} MBq
+            2. t/T₁/₂ = {t} / {T_half} = {t/T_half:.4f}
+            3. (½)^({t/T_half:.4f}) = {0.5**(t/T_half):.4f}
+            4. A(t) = {A0} × {0.5**(t/T_half):.4f} = **{A_t:.2f} MBq**
+            
+            **Interpretação:**
+            - Após {t} {t_unit}, a atividade caiu para {A_t/A0*100:.1f}% do valor inicial
+            - Em {T_half} {T_unit} (1 meia-vida), será {A0/2:.1f} MBq
+            - Em {T_half*2} {T_unit} (2 meias-vidas), será {A0/4:.1f} MBq
+            """)
+
+@st.fragment
+def calculadora_fotoeletrico():
+    """Calculadora do efeito fotoelétrico"""
+    
+    st.subheader("⚡ Calculadora do Efeito Fotoelétrico")
+    
+    st.markdown("""
+    **Fórmula:** E_cinética = E_fóton - E_ligação
+    
+    Onde:
+    - E_cinética: energia do elétron ejetado
+    - E_fóton: energia do fóton incidente  
+    - E_ligação: energia necessária para remover o elétron
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        E_foton = st.number_input("Energia do fóton (keV)", 
+                                min_value=1.0, value=80.0, step=1.0)
+    
+    with col2:
+        E_ligacao = st.number_input("Energia de ligação (keV)", 
+                                  min_value=0.0, value=69.5, step=0.1)
+    
+    if st.button("Calcular Energia Cinética"):
+        if E_foton < E_ligacao:
+            st.error("❌ **Energia insuficiente!**")
+            st.warning(f"O fóton precisa de pelo menos {E_ligacao} keV para ejetar o elétron")
+        else:
+            E_cinetica = E_foton - E_ligacao
+            st.success(f"**Energia cinética do elétron:** {E_cinetica:.2f} keV")
+            
+            # Informações adicionais
+            with st.expander("📚 Informações Adicionais"):
+                st.markdown(f"""
+                **Processo físico:**
+                1. Fóton de {E_foton} keV é absorvido pelo átomo
+                2. {E_ligacao} keV são usados para vencer a força de ligação
+                3. Os {E_cinetica:.2f} keV restantes são transformados em energia cinética
+                
+                **Aplicações práticas:**
+                - **Radiografia:** Contraste entre ossos e tecidos moles
+                - **Blindagem:** Chumbo é eficaz devido ao alto Z (Z=82)
+                - **Detectores:** Base para detectores de raios-X
+                
+                **Fato importante:** 
+                Probabilidade do efeito fotoelétrico ∝ Z⁴/E³
+                Ou seja: aumenta muito com Z alto e energia baixa
+                """)
+
+@st.fragment
+def calculadora_compton():
+    """Calculadora do efeito Compton"""
+    
+    st.subheader("🔄 Calculadora do Efeito Compton")
+    
+    st.markdown("""
+    **Fórmula:** E' = E / [1 + (E/511)(1 - cosθ)]
+    
+    Onde:
+    - E: energia do fóton incidente (keV)
+    - E': energia do fóton espalhado (keV)
+    - θ: ângulo de espalhamento (graus)
+    - 511 keV: energia de repouso do elétron
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        E = st.number_input("Energia incidente E (keV)", 
+                          min_value=10.0, value=150.0, step=10.0)
+    
+    with col2:
+        theta = st.slider("Ângulo de espalhamento θ (graus)", 
+                         min_value=0, max_value=180, value=90)
+    
+    if st.button("Calcular Energia Espalhada"):
+        theta_rad = np.radians(theta)
+        
+        # Fórmula do Compton
+        E_linha = float(fisica.energia_compton(E, theta))
+        
+        # Energia do elétron de recuo
+        E_eletron = E - E_linha
+        
+        st.success(f"**Energia do fóton espalhado:** {E_linha:.2f} keV")
+        st.info(f"**Energia do elétron de recuo:** {E_eletron:.2f} keV")
+        
+        # Gráfico da variação com o ângulo
+        angulos = np.linspace(0, 180, 181)
+        energias = fisica.energia_compton(E, angulos)
+        
+        grafico = graficos.Grafico(f'Variação de E\' com θ para E={E} keV',
+                                   'Ângulo de Espalhamento θ (graus)',
+                                   'Energia do Fóton Espalhado E\' (keV)')
+        grafico.linha(angulos, energias, cor='blue')
+        grafico.pontos(theta, E_linha, cor='red', rotulo=f'θ={theta}°, E\'={E_linha:.1f} keV')
+        
+        graficos.exibir(grafico, "calculadora_compton")
+        
+        # Explicação
+        with st.expander("📚 Explicação Detalhada"):
+            st.markdown(f"""
+            **Cálculo para θ = {theta}°:**
+            1. E = {E} keV
+            2. cos({theta}°) = {np.cos(theta_rad):.4f}
+            3. (E/511) = {E}/511 = {E/511:.4f}
+            4. 1 - cosθ = 1 - {np.cos(theta_rad):.4f} = {1-np.cos(theta_rad):.4f}
+            5. (E/511)(1-cosθ) = {E/511:.4f} × {1-np.cos(theta_rad):.4f} = {(E/511)*(1-np.cos(theta_rad)):.4f}
+            6. E' = {E} / [1 + {(E/511)*(1-np.cos(theta_rad)):.4f}] = **{E_linha:.2f} keV**
+            
+            **Características do efeito Compton:**
+            - Domina na faixa de **30 keV a 1 MeV**
+            - Independente do número atômico Z
+            - Principal fonte de **radiação espalhada** em diagnóstico
+            - Reduz o contraste na imagem radiográfica
+            
+            **Aplicações:**
+            - **Tomografia:** Requer correção do espalhamento
+            - **Proteção:** Principal fonte de dose ocupacional
+            - **Espalhamento Compton:** Técnica de imageamento
+            """)
+
+@st.fragment
+def calculadora_dose():
+    """Calculadora de dose com câmara de ionização"""
+    
+    st.subheader("📊 Calculadora de Dose com Câmara de Ionização")
+    
+    st.markdown("""
+    **Fórmulas:**
+    1. Q = I × t
+    2. N = Q / e
+    3. E = N × W
+    4. Dose = E / m
+    """)
+    
+    # Entrada de parâmetros
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📈 Parâmetros de Medição")
+        I = st.number_input("Corrente (A)", value=4.2e-9, format="%.2e")
+        t = st.number_input("Tempo (s)", value=1.0, step=0.1)
+        volume = st.number_input("Volume da câmara (cm³)", value=0.6, step=0.1)
+    
+    with col2:
+        st.markdown("### ⚙️ Constantes Físicas")
+        W = st.number_input("W (eV/par)", value=34.0, step=0.1)
+        densidade = st.number_input("Densidade do ar (kg/m³)", value=1.2, step=0.1)
+        fator = st.number_input("Fator ar→água", value=1.11, step=0.01)
+    
+    if st.button("Calcular Dose", type="primary"):
+        # Cálculos passo a passo
+        st.markdown("---")
+        st.subheader("🧮 Cálculos Passo a Passo")
+        
+        calculos = []
+        
+        r = fisica.dose_camara_ionizacao(I, t, volume, W, densidade, fator)
+        
+        # 1. Carga
+        Q = float(r.Q)
+        calculos.append(f"**1. Carga coletada:** Q = I × t = {I:.2e} × {t} = {Q:.2e} C")
+        
+        # 2. Pares
+        N = float(r.N)
+        calculos.append(f"**2. Pares íon-elétron:** N = Q/e = {Q:.2e} / 1,6×10⁻¹⁹ = {N:.2e}")
+        
+        # 3. Energia
+        E_eV, E_J = float(r.E_eV), float(r.E_J)
+        calculos.append(f"**3. Energia absorvida:** E = N × W = {N:.2e} × {W} = {E_eV:.2e} eV = {E_J:.2e} J")
+        
+        # 4. Massa
+        volume_m3, m = float(r.volume_m3), float(r.m)
+        calculos.append(f"**4. Massa de ar:** m = ρ × V = {densidade} × {volume_m3:.2e} = {m:.2e} kg")
+        
+        # 5. Dose no ar
+        D_ar = float(r.D_ar)
+        calculos.append(f"**5. Dose no ar:** D_ar = E/m = {E_J:.2e} / {m:.2e} = {D_ar:.4f} Gy")
+        
+        # 6. Dose em água
+        D_agua = float(r.D_agua)
+        calculos.append(f"**6. Dose em água:** D_água = D_ar × fator = {D_ar:.4f} × {fator} = {D_agua:.4f} Gy")
+        
+        # 7. Taxa de dose
+        taxa = float(r.taxa)
+        calculos.append(f"**7. Taxa de dose:** Ṋ = D_água/t = {D_agua:.4f} / {t} = {taxa:.4f} Gy/s = {taxa*60:.2f} Gy/min")
+        
+        # Mostrar todos os cálculos
+        for calc in calculos:
+            st.markdown(calc)
+        
+        # Resumo
+        st.markdown("---")
+        st.subheader("📋 Resumo dos Resultados")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Dose no ar", f"{D_ar:.4f} Gy")
+        
+        with col2:
+            st.metric("Dose em água", f"{D_agua:.4f} Gy")
+        
+        with col3:
+            st.metric("Taxa de dose", f"{taxa*60:.2f} Gy/min")
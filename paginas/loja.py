@@ -0,0 +1,120 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Loja
+=============================================================
+
+Compra de equipamentos e upgrades.
+=============================================================
+"""
+
+import streamlit as st
+
+# ============================================================
+# MÓDULO 6: LOJA E RANKING
+# ============================================================
+
+def mostrar_loja():
+    """Loja para compra de equipamentos e upgrades"""
+    
+    st.title("🛒 LOJA DE EQUIPAMENTOS")
+    
+    st.info(f"💰 **Seu saldo:** R$ {st.session_state.dinheiro}")
+    
+    # Itens disponíveis para compra
+    itens = [
+        {
+            "nome": "Geiger-Müller Avançado",
+            "descricao": "Compensação de energia, alarme sonoro",
+            "preco": 800,
+            "tipo": "detector",
+            "chave": "geiger_avancado",
+            "icone": "📡"
+        },
+        {
+            "nome": "Câmara de Ionização Farmer",
+            "descricao": "0,6 cm³, padrão ouro para dosimetria",
+            "preco": 2500,
+            "tipo": "detector",
+            "chave": "camera_farmer",
+            "icone": "⚡"
+        },
+        {
+            "nome": "Detector NaI 2×2",
+            "descricao": "Cristal 2×2 polegadas, para espectrometria",
+            "preco": 6000,
+            "tipo": "detector",
+            "chave": "nai_2x2",
+            "icone": "💎"
+        },
+        {
+            "nome": "Manual Avançado",
+            "descricao": "+10% XP em missões de cálculo",
+            "preco": 1500,
+            "tipo": "ferramenta",
+            "chave": "manual_avancado",
+            "icone": "📚"
+        },
+        {
+            "nome": "Curso de Especialização",
+            "descricao": "Aumenta todas as habilidades em 1 nível",
+            "preco": 5000,
+            "tipo": "upgrade",
+            "chave": "curso_especializacao",
+            "icone": "🎓"
+        }
+    ]
+    
+    # Exibir itens
+    for i, item in enumerate(itens):
+        col1, col2, col3 = st.columns([1, 3, 1])
+        
+        with col1:
+            st.markdown(f"### {item['icone']}")
+        
+        with col2:
+            st.markdown(f"**{item['nome']}**")
+            st.markdown(f"*{item['descricao']}*")
+        
+        with col3:
+            st.markdown(f"##### R$ {item['preco']}")
+            
+            # Verificar se já possui
+            if item['tipo'] == 'detector':
+                possui = st.session_state.inventario['detectores'].get(
+                    item['chave'], {'quantidade': 0}
+                )['quantidade'] > 0
+            elif item['tipo'] == 'ferramenta':
+                possui = st.session_state.inventario['ferramentas'].get(
+                    item['chave'], False
+                )
+            else:
+                possui = False
+            
+            if possui:
+                st.success("✅ Adquirido")
+            else:
+                if st.button(f"Comprar", key=f"comprar_{i}"):
+                    if st.session_state.dinheiro >= item['preco']:
+                        st.session_state.dinheiro -= item['preco']
+                        
+                        # Adicionar ao inventário
+                        if item['tipo'] == 'detector':
+                            if item['chave'] not in st.session_state.inventario['detectores']:
+                                st.session_state.inventario['detectores'][item['chave']] = {
+                                    'quantidade': 0, 'condicao': 100
+                                }
+                            st.session_state.inventario['detectores'][item['chave']]['quantidade'] += 1
+                        
+                        elif item['tipo'] == 'ferramenta':
+                            st.session_state.inventario['ferramentas'][item['chave']] = True
+                        
+                        elif item['tipo'] == 'upgrade':
+                            # Aumentar todas as habilidades
+                            for habilidade in st.session_state.habilidades.values():
+                                if habilidade['nivel'] > 0:
+                                    habilidade['nivel'] += 1
+                        
+                        st.success(f"✅ {item['nome']} adquirido com sucesso!")
+                        st.rerun()
+                    else:
+                        st.error("💰 Saldo insuficiente!")
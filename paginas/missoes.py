@@ -0,0 +1,903 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Missões
+=============================================================
+
+Farmácia radioativa, calibração do acelerador e fonte perdida.
+=============================================================
+"""
+
+import random
+import time
+
+import numpy as np
+import streamlit as st
+
+import campo
+import espectros
+import fisica
+import graficos
+import localizacao
+import nuclideos
+import persistencia
+from componentes import mapa_laboratorio
+
+# ============================================================
+# MÓDULO 2: SISTEMA DE MISSÕES
+# ============================================================
+
+# ------------------------------------------------------------
+# MISSÃO 1: FARMÁCIA RADIOATIVA
+# ------------------------------------------------------------
+
+# Meia-vida do I-131 em dias, da tabela de nuclídeos
+T_IODO_DIAS = nuclideos.nuclideo("I-131").meia_vida / nuclideos.DIA
+
+@st.fragment
+def calculo_paciente(i, paciente):
+    """Entradas e cálculo de um paciente (reexecuta só este bloco)"""
+    
+    st.markdown(f"#### 👤 {paciente['nome']}")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        horas = st.number_input(
+            f"Horas após preparo (06:00 → {paciente['hora']})",
+            min_value=0.0,
+            max_value=24.0,
+            value=float(paciente['hora'].split(':')[0]) - 6,
+            step=0.5,
+            key=f"horas_{i}"
+        )
+        
+        dose_prescrita = st.number_input(
+            "Dose prescrita (MBq)",
+            value=paciente['dose_prescrita'],
+            key=f"dose_{i}"
+        )
+    
+    # Descartar resultado calculado com entradas antigas
+    calculo = st.session_state.farmacia_resultados.get(i)
+    if calculo is not None and calculo["entradas"] != (horas, dose_prescrita):
+        del st.session_state.farmacia_resultados[i]
+    
+    with col2:
+        if st.button(f"📊 Calcular Dose Real", key=f"calc_{i}"):
+            # Cálculo do decaimento
+            dias = horas / 24
+            A_t = float(fisica.atividade_decaida(3000, dias, T_IODO_DIAS))
+            
+            # Percentual de diferença
+            diferenca = float(fisica.desvio_percentual(A_t, dose_prescrita))
+            
+            # Exibir resultados
+            st.metric("Atividade no horário", f"{A_t:.1f} MBq")
+            st.metric("Diferença", f"{diferenca:.1f}%")
+            
+            # Verificar se está dentro dos limites
+            limite_aceitavel = 5  # ±5%
+            
+            if abs(diferenca) <= limite_aceitavel:
+                st.success("✅ **DOSE ACEITÁVEL**")
+                st.info("Pode administrar com segurança")
+                resultado = True
+            elif diferenca > 0:
+                st.error("❌ **DOSE EXCESSIVA**")
+                st.warning(f"**{diferenca:.1f}% acima** - Risco de hipotireoidismo!")
+                resultado = False
+            else:
+                st.error("❌ **DOSE INSUFICIENTE**")
+                st.warning(f"**{abs(diferenca):.1f}% abaixo** - Tratamento ineficaz!")
+                resultado = False
+            
+            st.session_state.farmacia_resultados[i] = {
+                "entradas": (horas, dose_prescrita),
+                "correta": resultado
+            }
+            
+            # Explicação teórica
+            with st.expander("📚 Explicação Teórica"):
+                st.markdown(f"""
+                **Fórmula usada:** A(t) = A₀ × (½)^(t/T)
+                
+                **Cálculo:**
+                ```
+                A₀ = 3000 MBq
+                t = {horas} horas = {dias:.3f} dias
+                T = {T_IODO_DIAS:.2f} dias
+                
+                t/T = {dias:.3f} / {T_IODO_DIAS:.2f} = {dias/T_IODO_DIAS:.4f}
+                (½)^({dias/T_IODO_DIAS:.4f}) = {(0.5)**(dias/T_IODO_DIAS):.4f}
+                
+                A(t) = 3000 × {(0.5)**(dias/T_IODO_DIAS):.4f} = {A_t:.1f} MBq
+                ```
+                
+                **Limite clínico:** ±{limite_aceitavel}%
+                """)
+
+@st.fragment
+def farmacia_em_lote():
+    """Correção de uma agenda inteira de doses (CSV ou JSON Lines)"""
+    
+    # pandas só é carregado quando o modo em lote é usado
+    import farmacia
+    
+    st.subheader("📋 Agenda do Dia")
+    st.markdown(f"""
+    Envie a agenda de doses com uma linha por paciente. Colunas:
+    `paciente`, `horas` (após o preparo), `atividade_prescrita` (MBq),
+    `nuclideo` ({', '.join(farmacia.NUCLIDEOS)}) e, opcionalmente,
+    `atividade_inicial` (MBq, padrão {farmacia.ATIVIDADE_INICIAL:.0f}).
+    """)
+    
+    arquivo = st.file_uploader("Agenda de doses", type=["csv", "jsonl", "ndjson", "json"])
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        limite = st.slider("Tolerância (±%)", 1.0, 20.0, farmacia.LIMITE_ACEITAVEL, 0.5)
+    with col2:
+        linhas_exemplo = st.number_input("Linhas da agenda de exemplo (sem arquivo)",
+                                         min_value=10, max_value=1_000_000, value=500, step=100)
+    
+    try:
+        if arquivo is not None:
+            agenda = farmacia.corrigir_agenda(arquivo, limite=limite)
+        else:
+            exemplo = farmacia.tipar_agenda(farmacia.agenda_exemplo(int(linhas_exemplo)))
+            agenda = farmacia.corrigir_bloco(exemplo, limite)
+    except ValueError as erro:
+        st.error(f"❌ **Agenda inválida:** {erro}")
+        return
+    
+    contagem = agenda["situacao"].value_counts()
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Doses", f"{len(agenda):,}")
+    with col2:
+        st.metric("✅ Aceitáveis", f"{contagem['aceitável']:,}")
+    with col3:
+        st.metric("⬆️ Excessivas", f"{contagem['excessiva']:,}")
+    with col4:
+        st.metric("⬇️ Insuficientes", f"{contagem['insuficiente']:,}")
+    
+    # Só as doses reprovadas vão para a tela; a agenda completa é baixada
+    reprovadas = agenda[~agenda["aceitavel"]]
+    if len(reprovadas):
+        st.markdown(f"#### ❌ Doses fora de ±{limite:g}%")
+        st.dataframe(reprovadas.head(1000), width="stretch", hide_index=True)
+        if len(reprovadas) > 1000:
+            st.caption(f"Mostrando 1.000 de {len(reprovadas):,} doses reprovadas")
+    else:
+        st.success("✅ **Todas as doses da agenda estão dentro da tolerância!**")
+    
+    st.download_button(
+        "⬇️ Baixar agenda corrigida (CSV)",
+        agenda.to_csv(index=False).encode("utf-8"),
+        file_name="agenda_corrigida.csv",
+        mime="text/csv"
+    )
+
+def missao_farmacia_radioativa():
+    """Missão: Calcular doses na farmácia de medicina nuclear"""
+    
+    st.title("🔬 MISSÃO: EMERGÊNCIA NA FARMÁCIA RADIOATIVA")
+    
+    # Contexto da missão
+    st.markdown(f"""
+    ### 📋 Contexto:
+    **Hora:** 07:30 AM  
+    **Local:** Farmácia Radioativa - Setor de Medicina Nuclear  
+    
+    A farmacêutica preparou doses de **Iodo-131** para pacientes com hipertireoidismo,
+    mas calculou mal os tempos de decaimento. Agora os pacientes correm risco de
+    receber doses incorretas!
+    
+    ### 🎯 Sua Missão:
+    Calcular a atividade real de cada dose no horário marcado e decidir se pode
+    ou não administrar.
+    
+    ### 📊 Dados do I-131:
+    - Meia-vida: **{T_IODO_DIAS:.2f} dias**
+    - Preparo inicial: todas às 06:00 AM
+    - Atividade inicial: **3000 MBq** por dose
+    """)
+    
+    st.markdown("---")
+    
+    modo = st.radio("Modo", ["👥 Pacientes da missão", "📋 Agenda do dia (lote)"], horizontal=True)
+    if modo == "📋 Agenda do dia (lote)":
+        farmacia_em_lote()
+        return
+    
+    # Pacientes para cálculo
+    pacientes = [
+        {"nome": "Paciente A - Dona Maria", "hora": "10:00", "dose_prescrita": 1850},
+        {"nome": "Paciente B - Sr. João", "hora": "14:00", "dose_prescrita": 2400},
+        {"nome": "Paciente C - Sra. Ana", "hora": "16:00", "dose_prescrita": 1500}
+    ]
+    
+    st.subheader("📝 Cálculos Necessários")
+    
+    # Resultados ficam na sessão: cada paciente é um fragmento independente
+    if 'farmacia_resultados' not in st.session_state:
+        st.session_state.farmacia_resultados = {}
+    
+    for i, paciente in enumerate(pacientes):
+        calculo_paciente(i, paciente)
+    
+    # Finalização da missão
+    st.markdown("---")
+    
+    if st.button("🎯 Finalizar Missão", type="primary"):
+        resultados = [c["correta"] for c in st.session_state.farmacia_resultados.values()]
+        
+        if len(resultados) == 3:
+            acertos = sum(resultados)
+            
+            if all(resultados):
+                st.balloons()
+                st.success("🎉 **MISSÃO COMPLETA COM ÊXITO!**")
+                
+                # Recompensas
+                recompensa_xp = 150
+                recompensa_dinheiro = 1000
+                
+                st.session_state.xp_total += recompensa_xp
+                st.session_state.xp += recompensa_xp
+                st.session_state.dinheiro += recompensa_dinheiro
+                st.session_state.reputacao += 10
+                st.session_state.missoes_completas += 1
+                
+                st.markdown(f"""
+                ### 🏆 Recompensas:
+                - ⭐ **+{recompensa_xp} XP**
+                - 💰 **+R$ {recompensa_dinheiro}**
+                - 🏥 **+10 Reputação**
+                
+                ### 📈 Progresso:
+                - XP Total: **{st.session_state.xp_total}**
+                - Reputação: **{st.session_state.reputacao}/100**
+                """)
+                
+                # Verificar subida de nível
+                if st.session_state.xp >= st.session_state.nivel * 100:
+                    st.session_state.nivel += 1
+                    st.session_state.xp = 0
+                    st.success(f"🎊 **PARABÉNS! Você subiu para o nível {st.session_state.nivel}!**")
+                
+                # Marcar conquista
+                if not st.session_state.conquistas['primeiro_calculo']:
+                    st.session_state.conquistas['primeiro_calculo'] = True
+                    st.info("🏅 **Conquista desbloqueada: Primeiro Cálculo!**")
+                
+                # Nova rodada exige novos cálculos
+                st.session_state.farmacia_resultados = {}
+                    
+            else:
+                st.error(f"⚠️ **MISSÃO INCOMPLETA** - {3 - acertos} cálculos incorretos")
+                st.warning("Revise os cálculos e tente novamente!")
+                st.session_state.erros_cometidos += 1
+        else:
+            st.warning("⏳ Complete todos os cálculos antes de finalizar!")
+
+# ------------------------------------------------------------
+# MISSÃO 2: CALIBRAÇÃO DE ACELERADOR
+# ------------------------------------------------------------
+
+@st.fragment
+def medicao_calibracao():
+    """Parâmetros e cálculo da calibração (reexecuta só este bloco)"""
+    
+    # Simulação da medição
+    st.subheader("🔬 Medição com Câmara de Ionização")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📊 Parâmetros da Medição")
+        
+        corrente = st.number_input(
+            "Corrente medida (A)",
+            min_value=0.0,
+            max_value=1e-6,
+            value=4.2e-9,
+            format="%.2e",
+            help="Corrente elétrica gerada na câmara"
+        )
+        
+        tempo = st.number_input(
+            "Tempo de exposição (s)",
+            min_value=0.1,
+            max_value=10.0,
+            value=1.0,
+            step=0.1
+        )
+        
+        volume = st.number_input(
+            "Volume da câmara (cm³)",
+            min_value=0.01,
+            max_value=10.0,
+            value=0.6,
+            step=0.1
+        )
+    
+    with col2:
+        st.markdown("### ⚙️ Constantes Físicas")
+        
+        W = st.number_input(
+            "Energia por par íon-elétron (eV)",
+            min_value=20.0,
+            max_value=50.0,
+            value=34.0,
+            step=0.1,
+            help="Valor para ar seco: 34 eV"
+        )
+        
+        densidade_ar = st.number_input(
+            "Densidade do ar (kg/m³)",
+            min_value=1.0,
+            max_value=1.5,
+            value=1.2,
+            step=0.1
+        )
+        
+        fator_agua = st.number_input(
+            "Fator ar→água",
+            min_value=1.0,
+            max_value=1.2,
+            value=1.11,
+            step=0.01,
+            help="Para fótons de 6 MV: ~1,11"
+        )
+    
+    # Cálculo da dose
+    if st.button("📈 Calcular Dose"):
+        st.markdown("---")
+        st.subheader("🧮 Cálculos Passo a Passo")
+        
+        r = fisica.dose_camara_ionizacao(corrente, tempo, volume, W, densidade_ar, fator_agua)
+        
+        # Passo 1: Carga coletada
+        Q = float(r.Q)
+        st.markdown(f"**1. Carga coletada:** Q = I × t = {corrente:.2e} × {tempo} = {Q:.2e} C")
+        
+        # Passo 2: Número de pares
+        N = float(r.N)
+        st.markdown(f"**2. Pares íon-elétron:** N = Q/e = {Q:.2e} / 1,6×10⁻¹⁹ = {N:.2e}")
+        
+        # Passo 3: Energia absorvida
+        E_eV, E_J = float(r.E_eV), float(r.E_J)
+        st.markdown(f"**3. Energia absorvida:** E = N × W = {N:.2e} × {W} = {E_eV:.2e} eV = {E_J:.2e} J")
+        
+        # Passo 4: Massa de ar
+        volume_m3, m = float(r.volume_m3), float(r.m)
+        st.markdown(f"**4. Massa de ar:** m = ρ × V = {densidade_ar} × {volume_m3:.2e} = {m:.2e} kg")
+        
+        # Passo 5: Dose no ar
+        D_ar = float(r.D_ar)
+        st.markdown(f"**5. Dose no ar:** D = E/m = {E_J:.2e} / {m:.2e} = {D_ar:.4f} Gy")
+        
+        # Passo 6: Dose em água
+        D_agua = float(r.D_agua)
+        st.markdown(f"**6. Dose em água:** D_água = D_ar × fator = {D_ar:.4f} × {fator_agua} = {D_agua:.4f} Gy")
+        
+        # Passo 7: Taxa de dose
+        taxa = float(r.taxa) * 60  # Gy/min
+        st.markdown(f"**7. Taxa de dose:** Ṋ = D/t × 60 = {D_agua:.4f}/{tempo} × 60 = {taxa:.2f} Gy/min")
+        
+        # Verificação do objetivo
+        st.markdown("---")
+        st.subheader("🎯 Verificação da Calibração")
+        
+        objetivo = 2.0  # Gy/min
+        diferenca = float(fisica.desvio_percentual(taxa, objetivo))
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.metric("Taxa medida", f"{taxa:.3f} Gy/min")
+        
+        with col2:
+            st.metric("Objetivo", f"{objetivo} Gy/min")
+        
+        if abs(diferenca) <= 1.0:  # ±1% é excelente
+            st.success(f"✅ **CALIBRAÇÃO PERFEITA!** Erro: {diferenca:.2f}%")
+            st.balloons()
+            
+            # Recompensas
+            recompensa_xp = 200
+            recompensa_dinheiro = 1500
+            
+            st.session_state.xp_total += recompensa_xp
+            st.session_state.xp += recompensa_xp
+            st.session_state.dinheiro += recompensa_dinheiro
+            st.session_state.reputacao += 15
+            st.session_state.missoes_completas += 1
+            
+            st.markdown(f"""
+            ### 🏆 Recompensas por calibração precisa:
+            - ⭐ **+{recompensa_xp} XP**
+            - 💰 **+R$ {recompensa_dinheiro}**
+            - 🏥 **+15 Reputação**
+            """)
+            
+        elif abs(diferenca) <= 3.0:  # ±3% é aceitável
+            st.warning(f"⚠️ **CALIBRAÇÃO ACEITÁVEL** Erro: {diferenca:.2f}%")
+            st.info("Na prática, seria aceito mas requer atenção")
+            
+            # Recompensas menores
+            recompensa_xp = 100
+            recompensa_dinheiro = 800
+            
+            st.session_state.xp_total += recompensa_xp
+            st.session_state.xp += recompensa_xp
+            st.session_state.dinheiro += recompensa_dinheiro
+            st.session_state.reputacao += 5
+            st.session_state.missoes_completas += 1
+            
+        else:
+            st.error(f"❌ **CALIBRAÇÃO INACEITÁVEL!** Erro: {diferenca:.2f}%")
+            st.warning("Ajuste os parâmetros e tente novamente!")
+            st.session_state.erros_cometidos += 1
+        
+        # O rerun do fragmento não chega ao fim do main(): salvar aqui
+        persistencia.salvar_sessao(st.session_state)
+
+def missao_calibracao_acelerador():
+    """Missão: Calibrar acelerador linear para radioterapia"""
+    
+    st.title("🏥 MISSÃO: CALIBRAÇÃO DE ACELERADOR LINEAR")
+    
+    # Verificar nível mínimo
+    if st.session_state.nivel < 2:
+        st.error("🚫 **NÍVEL INSUFICIENTE**")
+        st.warning("Você precisa estar no nível 2 para esta missão!")
+        if st.button("Voltar ao Painel"):
+            st.session_state.missao_atual = None
+            st.rerun()
+        return
+    
+    # Contexto da missão
+    st.markdown("""
+    ### 📋 Contexto:
+    **Hora:** 08:00 AM  
+    **Local:** Bunker de Radioterapia - Acelerador Linear Varian TrueBeam  
+    
+    O acelerador acabou de passar por manutenção e precisa ser recalibrado
+    antes do primeiro paciente. Você é responsável pela dosimetria de referência.
+    
+    ### 🎯 Sua Missão:
+    Usar a câmara de ionização para medir a taxa de dose e ajustar o acelerador
+    para fornecer exatamente 2 Gy/min no isocentro.
+    
+    ### 🧪 Equipamento:
+    - Câmara de Ionização Farmer 0,6 cm³
+    - Eletrômetro de precisão
+    - Fantoma de água
+    """)
+    
+    st.markdown("---")
+    
+    medicao_calibracao()
+
+# ------------------------------------------------------------
+# MISSÃO 3: FONTE PERDIDA
+# ------------------------------------------------------------
+
+# Locais da busca: rótulo → (lado em metros, número de fontes perdidas, obstáculos)
+LABORATORIOS = {
+    "🧪 Laboratório de Física Médica (10×10 m, 1 fonte)": (10, 1, campo.LEIAUTE_LABORATORIO),
+    "📦 Depósito de rejeitos (50×50 m, 2 fontes)":
+        (50, 2, campo.repetir_leiaute(campo.LEIAUTE_LABORATORIO, 10, 5)),
+    "🏭 Galpão de radiografia industrial (200×200 m, 3 fontes)": (200, 3, campo.LEIAUTE_GALPAO),
+}
+
+def sortear_busca(laboratorio):
+    """Novo cenário da missão (fontes sorteadas e medições zeradas)"""
+    lado, n_fontes, obstaculos = LABORATORIOS[laboratorio]
+    st.session_state.cenario_fonte = campo.sortear_cenario(lado, n_fontes, obstaculos=obstaculos)
+    st.session_state.posterior_fonte = localizacao.Posterior(st.session_state.cenario_fonte)
+    st.session_state.laboratorio_fonte = laboratorio
+    st.session_state.medicoes_fonte = {}
+    st.session_state.fontes_recolhidas = []
+    st.session_state.tentativas = 0
+    st.session_state.dicas_usadas = 0
+    st.session_state.detector_atual = "geiger"
+    st.session_state.pop('pos_selecionada', None)
+    st.session_state.id_busca = st.session_state.get('id_busca', 0) + 1
+    st.session_state.pos_x_fonte = st.session_state.pos_y_fonte = lado // 2
+
+def mapa_busca(cenario):
+    """Mapa clicável das medições feitas, com a posição atual e as fontes recolhidas"""
+    mapa_laboratorio.mapa_laboratorio(
+        st.session_state.id_busca, cenario.largura, cenario.altura, cenario.obstaculos,
+        st.session_state.medicoes_fonte,
+        selecionada=st.session_state.get('pos_selecionada'),
+        marcadores=[(f.x, f.y) for f in st.session_state.fontes_recolhidas],
+        unidade="µGy/h", key="mapa_fonte")
+    st.caption(f"Medições realizadas: {len(st.session_state.medicoes_fonte)} · "
+               "🟢 você · 🔴 fontes recolhidas · áreas coloridas: obstáculos "
+               "(passe o mouse para ver)")
+
+def assistente_busca(cenario):
+    """Posterior da posição da fonte e as células mais prováveis"""
+    posterior = st.session_state.posterior_fonte
+    st.subheader("🧭 Assistente de Localização")
+
+    if not posterior.medicoes:
+        st.info("Faça uma medição para o assistente começar a estimar a posição da fonte.")
+        return
+
+    melhores = posterior.mais_provaveis(5)
+    grafico = graficos.Grafico(f"Probabilidade da posição da fonte ({posterior.medicoes} leituras)",
+                               'X (m)', 'Y (m)')
+    grafico.calor(posterior.probabilidades(), rotulo='Probabilidade', escala='log',
+                  mapa_cores='viridis')
+    grafico.pontos([x for x, _, _ in melhores], [y for _, y, _ in melhores],
+                   cor=graficos.PALETA[3], rotulo='Mais prováveis', tamanho=60)
+    graficos.exibir(grafico, "missao_fonte_perdida/posterior", figsize=(7, 6))
+
+    col1, col2 = st.columns(2)
+    with col1:
+        for x, y, p in melhores:
+            st.markdown(f"- **({x}, {y})**: {100 * p:.3g}%")
+    with col2:
+        st.metric("Atividade mais provável", f"{posterior.atividade_provavel():.0f} MBq")
+    st.caption("O assistente supõe uma única fonte de Cs-137 e combina todas as leituras "
+               "pelo modelo de ruído de cada detector; com várias fontes ele aponta a "
+               "que domina as leituras.")
+
+QUADROS_POR_SEGUNDO = 10  # da aquisição ao vivo
+FATIA_MCA = 1.0           # s de contagem por quadro
+
+def espectro_nai(cenario, x, y, tempo, rng):
+    """Espectro NaI(Tl) medido na célula em `tempo` s, com a radiação natural"""
+    energias, fluencias = campo.fluencias(cenario, x, y)
+    esperado = espectros.espectro_esperado(localizacao.CRISTAL_NAI, energias, fluencias, tempo)
+    return espectros.amostrar(esperado, rng)
+
+def grafico_espectro_nai(cenario):
+    """Eixos e linhas das fontes do espectro, e os canais exibidos"""
+    # Até um pouco além da linha mais energética das fontes
+    E_max = max(max(nuclideos.nuclideo(f.nuclideo).energias) for f in cenario.fontes)
+    canais = slice(0, int(1.25 * E_max / espectros.LARGURA_CANAL))
+
+    grafico = graficos.Grafico(f'Espectro Medido - NaI(Tl) {localizacao.CRISTAL_NAI}',
+                               'Energia (keV)', 'Contagens por canal')
+    for nuclideo in dict.fromkeys(f.nuclideo for f in cenario.fontes):
+        E = nuclideos.nuclideo(nuclideo).energia_principal
+        grafico.vertical(E, cor='red', rotulo=f'{E:.0f} keV ({nuclideo})')
+    return grafico, canais
+
+def adquirir_nai(cenario, x, y, tempo_maximo, rng):
+    """Aquisição ao vivo: o espectro cresce na tela até o fotopico ficar significativo
+
+    Um quadro por fatia de contagem, a QUADROS_POR_SEGUNDO; cada
+    quadro custa o mesmo (um incremento de Poisson e os canais
+    exibidos). Retorna (espectro, tempo de contagem).
+    """
+    energias, fluencias = campo.fluencias(cenario, x, y)
+    taxas = espectros.espectro_esperado(localizacao.CRISTAL_NAI, energias, fluencias, 1.0)
+    grafico, canais = grafico_espectro_nai(cenario)
+    ao_vivo = graficos.GraficoAoVivo(grafico, cor='blue')
+    progresso = st.empty()
+
+    espectro = np.zeros(espectros.CANAIS, dtype=np.int64)
+    proximo = time.perf_counter()
+    for tempo, incremento in espectros.aquisicao(taxas, FATIA_MCA, tempo_maximo, rng):
+        espectro += incremento
+        significancia = espectros.significancia_pico(espectro, localizacao.CRISTAL_NAI,
+                                                     localizacao.E_JANELA_NAI)
+        ao_vivo.quadro(espectros.ENERGIAS[canais], espectro[canais])
+        progresso.caption(f"⏱️ {tempo:.0f} s de {tempo_maximo:.0f} s · "
+                          f"fotopico de 662 keV a {significancia:.1f}σ")
+        if significancia >= espectros.LIMIAR_SIGNIFICANCIA:
+            break
+        proximo += 1 / QUADROS_POR_SEGUNDO
+        time.sleep(max(proximo - time.perf_counter(), 0.0))
+    return espectro, tempo
+
+@st.fragment
+def controles_busca():
+    """Posição, detector, medição e mapa (reexecuta só este bloco)"""
+
+    # Todas as fontes podem ter sido recolhidas numa execução anterior do
+    # fragmento: recomeça a página inteira para sortear um novo cenário
+    if 'cenario_fonte' not in st.session_state:
+        st.rerun()
+
+    cenario = st.session_state.cenario_fonte
+    escala = cenario.largura / 10  # limiares das dicas acompanham o tamanho do local
+
+    # O mapa vem antes dos controles, mas é desenhado depois da medição
+    area_mapa = st.container()
+
+    # Controles de interação
+    st.markdown("---")
+    st.subheader("🔧 Controles de Busca")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### 📍 Escolher Posição")
+        # Clique no mapa: move os controles e vai até a célula
+        clique = mapa_laboratorio.clique_novo("mapa_fonte")
+        if clique is not None:
+            st.session_state.pos_x_fonte, st.session_state.pos_y_fonte = clique
+            st.session_state.pos_selecionada = clique
+            st.session_state.tentativas += 1
+
+        pos_x = st.slider("Coordenada X", 0, cenario.largura - 1, key="pos_x_fonte")
+        pos_y = st.slider("Coordenada Y", 0, cenario.altura - 1, key="pos_y_fonte")
+
+        if st.button("🎯 Ir para esta posição"):
+            st.session_state.pos_selecionada = (pos_x, pos_y)
+            st.session_state.tentativas += 1
+
+    with col2:
+        st.markdown("### 🔍 Escolher Detector")
+
+        detector = st.radio(
+            "Selecione o detector:",
+            ["Geiger-Müller", "Câmara de Ionização", "Detector NaI(Tl)"],
+            key="detector_radio"
+        )
+
+        st.session_state.detector_atual = detector
+        ao_vivo = st.toggle("⏱️ Aquisição ao vivo (MCA)", key="aquisicao_ao_vivo",
+                            disabled=detector != "Detector NaI(Tl)",
+                            help="O espectro se acumula na tela e a contagem para quando "
+                                 "o fotopico de 662 keV passa de "
+                                 f"{espectros.LIMIAR_SIGNIFICANCIA:.0f}σ")
+
+        if st.button("📡 Realizar Medição", type="primary"):
+            # Consultas ao campo pré-calculado do cenário
+            taxa = campo.taxa_dose(cenario, pos_x, pos_y)
+            distancia = campo.distancia_fonte(cenario, pos_x, pos_y) / escala
+
+            st.markdown("---")
+            st.subheader("📊 Resultado da Medição")
+            for o in cenario.obstaculos:
+                if o.cobre(pos_x, pos_y):
+                    st.caption(f"📍 Medição feita sobre: {o.nome} ({o.material})")
+
+            # Leitura com o ruído do detector, que também atualiza a posterior;
+            # a do NaI é a janela do fotopico do próprio espectro medido
+            modelo = localizacao.modelo(detector)
+            rng = np.random.default_rng()
+            if detector == "Detector NaI(Tl)":
+                # Resumo acima do espectro, preenchido ao fim da contagem
+                resumo_nai = st.container()
+                if ao_vivo:
+                    espectro, tempo = adquirir_nai(cenario, pos_x, pos_y, modelo.tempo, rng)
+                else:
+                    espectro, tempo = espectro_nai(cenario, pos_x, pos_y, modelo.tempo, rng), modelo.tempo
+                    grafico, canais = grafico_espectro_nai(cenario)
+                    grafico.linha(espectros.ENERGIAS[canais], espectro[canais], cor='blue', espessura=1.5)
+                    grafico.area(espectros.ENERGIAS[canais], espectro[canais])
+                    # Cada medição sorteia um espectro novo: nada a reaproveitar do cache
+                    graficos.exibir(grafico, "missao_fonte_perdida/nai", figsize=(10, 4), cache=False)
+                modelo = modelo._replace(tempo=tempo)
+                leitura = espectros.contagens_janela(espectro, localizacao.CRISTAL_NAI,
+                                                     localizacao.E_JANELA_NAI) / tempo
+            else:
+                leitura = localizacao.amostrar_leitura(modelo, taxa, rng)
+            st.session_state.posterior_fonte.atualizar(modelo, pos_x, pos_y, leitura)
+            taxa_medida = localizacao.taxa_equivalente(modelo, leitura)
+            st.session_state.medicoes_fonte[(pos_x, pos_y)] = round(taxa_medida, 6)
+
+            # Resultados baseados no detector e na taxa no ponto
+            if detector == "Geiger-Müller":
+                contagem = leitura
+                if contagem >= campo.SATURACAO_GM:
+                    st.error("⚠️ **SATURAÇÃO COMPLETA!**")
+                    st.warning("O Geiger não consegue medir - taxa muito alta!")
+                    leitura = f"> {campo.SATURACAO_GM:,.0f} cps (saturado)".replace(",", ".")
+                elif contagem >= 1000:
+                    st.success("📈 **SINAL FORTE**")
+                    leitura = f"~{contagem:,.0f} cps".replace(",", ".")
+                elif contagem >= 100:
+                    st.info("📉 **SINAL MODERADO**")
+                    leitura = f"~{contagem:.0f} cps"
+                else:
+                    st.warning("🔇 **SINAL FRACO**")
+                    leitura = f"{contagem:.1f} cps"
+
+                st.metric("Taxa de contagem", leitura)
+
+            elif detector == "Câmara de Ionização":
+                corrente = leitura
+                col_a, col_b = st.columns(2)
+                col_a.metric("Corrente medida", f"{corrente:.2e} A")
+                col_b.metric("Taxa de kerma no ar", f"{taxa_medida:.3g} µGy/h")
+
+                if distancia < 2:
+                    st.success("🔋 **CORRENTE ALTA** - Fonte próxima!")
+                elif distancia < 5:
+                    st.info("⚡ **CORRENTE MODERADA**")
+                else:
+                    st.warning("🔌 **CORRENTE BAIXA**")
+
+            elif detector == "Detector NaI(Tl)":
+                with resumo_nai:
+                    st.success("📊 **ESPECTRO OBTIDO**")
+                    st.metric(f"Fotopico de 662 keV ({modelo.tempo:.0f} s)", f"{leitura:.1f} cps")
+
+            # Dica baseada na distância
+            st.markdown("---")
+            st.subheader("💡 Dica do Sistema")
+
+            indice = campo.fonte_na_celula(cenario, pos_x, pos_y)
+            if indice is not None:
+                fonte = cenario.fontes[indice]
+                st.session_state.fontes_recolhidas.append(fonte)
+                cenario = campo.sem_fonte(cenario, indice)
+                st.session_state.cenario_fonte = cenario
+
+                if cenario.fontes:
+                    st.success(f"🎯 **FONTE RECOLHIDA:** {fonte.nuclideo} "
+                               f"({fonte.atividade:.0f} MBq). Ainda faltam {len(cenario.fontes)}!")
+                    st.session_state.medicoes_fonte = {}
+                    st.session_state.posterior_fonte = localizacao.Posterior(cenario)
+                else:
+                    st.success("🎯 **VOCÊ ENCONTROU A FONTE!**")
+                    st.balloons()
+
+                    # Recompensas
+                    recompensa_xp = 180
+                    recompensa_dinheiro = 1200
+
+                    st.session_state.xp_total += recompensa_xp
+                    st.session_state.xp += recompensa_xp
+                    st.session_state.dinheiro += recompensa_dinheiro
+                    st.session_state.reputacao += 12
+                    st.session_state.missoes_completas += 1
+
+                    # Marcar conquista
+                    if st.session_state.tentativas < 5:
+                        if not st.session_state.conquistas['detetive_perfeito']:
+                            st.session_state.conquistas['detetive_perfeito'] = True
+                            st.info("🏅 **Conquista: Detetive Perfeito!**")
+
+                    st.markdown(f"""
+                    ### 🏆 Missão Cumprida!
+                    - ⭐ **+{recompensa_xp} XP**
+                    - 💰 **+R$ {recompensa_dinheiro}**
+                    - 🏥 **+12 Reputação**
+                    - 🔍 **Tentativas:** {st.session_state.tentativas}
+                    """)
+
+                    persistencia.salvar_sessao(st.session_state)
+
+                    # Próxima visita sorteia outro cenário
+                    del st.session_state.cenario_fonte
+
+            elif distancia < 2:
+                st.success("🔥 **MUITO QUENTE!** Quase encontrou!")
+            elif distancia < 4:
+                st.info("🌡️ **QUENTE** - Continue nesta direção")
+            elif distancia < 7:
+                st.warning("🌤️ **MORNO** - Você está no caminho certo")
+            else:
+                st.error("❄️ **FRIO** - Tente outra área do laboratório")
+
+    with area_mapa:
+        mapa_busca(cenario)
+        if st.session_state.get('assistente_fonte') and 'cenario_fonte' in st.session_state:
+            assistente_busca(cenario)
+
+@st.fragment
+def dica_fonte():
+    """Botão de dica da missão da fonte perdida"""
+
+    # Sem dica enquanto o próximo cenário não for sorteado; com o
+    # assistente ligado as dicas pagas não são necessárias
+    if 'cenario_fonte' not in st.session_state or st.session_state.get('assistente_fonte'):
+        return
+
+    # Botão de ajuda
+    if st.button("🆘 Usar Dica (custa 50 de reputação)"):
+        if st.session_state.reputacao >= 50:
+            st.session_state.reputacao -= 50
+            st.session_state.dicas_usadas += 1
+            persistencia.salvar_sessao(st.session_state)
+
+            # Dar dica sobre a posição da próxima fonte a recolher
+            cenario = st.session_state.cenario_fonte
+            fonte_x, fonte_y = cenario.fontes[0].x, cenario.fontes[0].y
+            terco = -(-cenario.largura // 3)
+
+            dicas = [
+                f"A fonte está na coluna X = {fonte_x} do mapa",
+                f"A fonte está na linha Y = {fonte_y} do mapa",
+                f"A fonte está no quadrante {fonte_x//terco + 1}{fonte_y//terco + 1}",
+                f"Distância da origem: √({fonte_x}² + {fonte_y}²) ≈ {np.sqrt(fonte_x**2 + fonte_y**2):.1f}"
+            ]
+
+            st.info(f"💡 **Dica {st.session_state.dicas_usadas}:** {random.choice(dicas)}")
+        else:
+            st.warning("Reputação insuficiente para dicas!")
+
+def missao_fonte_perdida():
+    """Missão: Encontrar fonte radioativa perdida no laboratório"""
+
+    st.title("🕵️ MISSÃO: DETETIVE RADIOATIVO")
+
+    laboratorio = st.selectbox("Local da busca:", list(LABORATORIOS))
+
+    # Sortear o cenário se não existir ou se o local mudou
+    if ('cenario_fonte' not in st.session_state
+            or st.session_state.get('laboratorio_fonte') != laboratorio):
+        sortear_busca(laboratorio)
+
+    # Contexto da missão
+    st.markdown("""
+    ### 📋 Contexto:
+    **Hora:** 22:30 PM  
+    **Local:** Laboratório de Física Médica  
+
+    Uma fonte de **Cs-137** (450 MBq) desapareceu do cofre blindado.
+    A fonte é perigosa e precisa ser encontrada urgentemente!
+    Nos locais maiores, outras fontes esquecidas também contribuem para as leituras.
+    Paredes, armários e bancadas atenuam a radiação entre a fonte e o detector.
+
+    ### 🎯 Sua Missão:
+    Usar diferentes detectores para localizar e recolher todas as fontes.
+
+    ### ⚠️ Limitações:
+    - Geiger satura perto da fonte
+    - Câmara de ionização precisa de calibração
+    - NaI tem melhor sensibilidade mas é mais lento
+    """)
+
+    st.markdown("---")
+
+    # Mapa do local (cada célula é 1 m²)
+    lado = LABORATORIOS[laboratorio][0]
+    st.subheader(f"🗺️ Mapa do Local ({lado}×{lado} metros)")
+    st.toggle("🧭 Assistente de localização bayesiano (substitui as dicas pagas)",
+              key="assistente_fonte")
+
+    controles_busca()
+
+    dica_fonte()
+
+# ------------------------------------------------------------
+# SELEÇÃO DE MISSÃO
+# ------------------------------------------------------------
+
+def mostrar_missoes():
+    """Página de seleção e execução das missões"""
+    
+    st.title("🎯 MISSÕES DISPONÍVEIS")
+    
+    # Seleção de missão
+    missao_selecionada = st.selectbox(
+        "Escolha uma missão para iniciar:",
+        ["🔬 Emergência na Farmácia Radioativa (Nível 1)",
+         "🏥 Calibração de Acelerador Linear (Nível 2)",
+         "🕵️ Detetive Radioativo: Fonte Perdida (Nível 1)"]
+    )
+    
+    if missao_selecionada == "🔬 Emergência na Farmácia Radioativa (Nível 1)":
+        st.session_state.missao_atual = "farmacia_radioativa"
+    elif missao_selecionada == "🏥 Calibração de Acelerador Linear (Nível 2)":
+        st.session_state.missao_atual = "calibracao_acelerador"
+    elif missao_selecionada == "🕵️ Detetive Radioativo: Fonte Perdida (Nível 1)":
+        st.session_state.missao_atual = "fonte_perdida"
+    
+    # Executar missão se selecionada
+    if 'missao_atual' in st.session_state:
+        if st.session_state.missao_atual == "farmacia_radioativa":
+            missao_farmacia_radioativa()
+        elif st.session_state.missao_atual == "calibracao_acelerador":
+            missao_calibracao_acelerador()
+        elif st.session_state.missao_atual == "fonte_perdida":
+            missao_fonte_perdida()
+        
+        # Botão para voltar
+        if st.button("🏠 Voltar ao Menu"):
+            st.session_state.missao_atual = None
+            st.rerun()
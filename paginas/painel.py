@@ -0,0 +1,107 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Painel Principal
+=============================================================
+
+Página inicial com o resumo do jogador e as próximas missões.
+=============================================================
+"""
+
+import random
+
+import streamlit as st
+
+# ============================================================
+# MÓDULO 1: PAINEL PRINCIPAL
+# ============================================================
+
+def mostrar_painel_principal():
+    """Exibe o painel principal do jogo"""
+    
+    st.title("🏥 FÍSICO MÉDICO: A MISSÃO")
+    
+    # Banner principal
+    st.image("https://via.placeholder.com/800x200/1E3A8A/FFFFFF?text=Hospital+Imagin%C3%A1rio+da+Sa%C3%BAde+P%C3%BAblica", 
+             width="stretch")
+    
+    # Introdução
+    st.markdown("""
+    ## 👨‍⚕️ Bem-vindo ao HISP - Hospital Imaginário da Saúde Pública
+    
+    Você é um **Físico Médico estagiário** iniciando sua carreira no maior 
+    centro de referência do país. Sua missão: aprender e aplicar os conceitos 
+    de física radiológica para salvar vidas e garantir a segurança.
+    
+    ### 🎯 Seus Objetivos:
+    1. Completar missões em diferentes departamentos
+    2. Aprender e aplicar cálculos radiológicos
+    3. Escolher os equipamentos certos para cada situação
+    4. Subir de nível e se tornar um especialista
+    
+    ### 📊 Seu Progresso Atual:
+    """)
+    
+    # Métricas do jogador
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("📈 Nível", st.session_state.nivel)
+    
+    with col2:
+        st.metric("⭐ XP Total", st.session_state.xp_total)
+    
+    with col3:
+        st.metric("💰 Dinheiro", f"R$ {st.session_state.dinheiro}")
+    
+    with col4:
+        st.metric("🏥 Reputação", f"{st.session_state.reputacao}/100")
+    
+    st.markdown("---")
+    
+    # Próximas missões disponíveis
+    st.subheader("🎯 Próximas Missões Disponíveis")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        with st.container(border=True):
+            st.markdown("### 🔬 **Medicina Nuclear**")
+            st.markdown("**Calcular dose de I-131**")
+            st.markdown("👤 Nível requerido: 1")
+            st.markdown("⏱️ Duração: 10 min")
+            if st.button("Iniciar Missão 1", key="missao1"):
+                st.session_state.missao_atual = "farmacia_radioativa"
+                st.rerun()
+    
+    with col2:
+        with st.container(border=True):
+            st.markdown("### 🏥 **Radioterapia**")
+            st.markdown("**Calibrar acelerador**")
+            st.markdown("👤 Nível requerido: 2")
+            st.markdown("⏱️ Duração: 15 min")
+            if st.button("Iniciar Missão 2", key="missao2"):
+                st.session_state.missao_atual = "calibracao_acelerador"
+                st.rerun()
+    
+    with col3:
+        with st.container(border=True):
+            st.markdown("### 🛡️ **Radioproteção**")
+            st.markdown("**Encontrar fonte perdida**")
+            st.markdown("👤 Nível requerido: 1")
+            st.markdown("⏱️ Duração: 12 min")
+            if st.button("Iniciar Missão 3", key="missao3"):
+                st.session_state.missao_atual = "fonte_perdida"
+                st.rerun()
+    
+    # Dicas do dia
+    st.markdown("---")
+    st.subheader("💡 Dica do Dia")
+    
+    dicas = [
+        "💡 **Dica de Decaimento**: Use a fórmula A(t) = A₀ × (½)^(t/T) para calcular atividades remanescentes",
+        "💡 **Dica de Detector**: Geiger satura acima de 5.000 cps - afaste-se de fontes fortes!",
+        "💡 **Dica de Segurança**: Sempre use o princípio ALARA: tão baixo quanto razoavelmente alcançável",
+        "💡 **Dica de Cálculo**: Verifique sempre as unidades antes de calcular!"
+    ]
+    
+    st.info(random.choice(dicas))
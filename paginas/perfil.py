@@ -0,0 +1,184 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Perfil
+=============================================================
+
+Perfil do jogador: estatísticas, habilidades, inventário e conquistas.
+=============================================================
+"""
+
+import streamlit as st
+
+# ============================================================
+# MÓDULO 5: PERFIL E PROGRESSO
+# ============================================================
+
+def mostrar_perfil():
+    """Exibe o perfil do jogador e progresso"""
+    
+    st.title("👤 SEU PERFIL DE FÍSICO MÉDICO")
+    
+    # Cabeçalho do perfil
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        # Avatar baseado no nível
+        if st.session_state.nivel < 10:
+            avatar = "👨‍🎓"
+        elif st.session_state.nivel < 20:
+            avatar = "👨‍⚕️"
+        elif st.session_state.nivel < 30:
+            avatar = "👨‍🔬"
+        else:
+            avatar = "👨‍🏫"
+        
+        st.markdown(f"# {avatar}")
+        st.markdown(f"### Nível {st.session_state.nivel}")
+        
+        # Barra de XP
+        xp_necessario = st.session_state.nivel * 100
+        xp_atual = st.session_state.xp
+        progresso = min(xp_atual / xp_necessario, 1.0)
+        
+        st.progress(progresso, text=f"XP: {xp_atual}/{xp_necessario}")
+    
+    with col2:
+        st.subheader("📊 Estatísticas do Jogador")
+        
+        col_a, col_b, col_c = st.columns(3)
+        
+        with col_a:
+            st.metric("⭐ XP Total", st.session_state.xp_total)
+            st.metric("💰 Dinheiro", f"R$ {st.session_state.dinheiro}")
+        
+        with col_b:
+            st.metric("🎯 Missões", st.session_state.missoes_completas)
+            st.metric("⚠️ Erros", st.session_state.erros_cometidos)
+        
+        with col_c:
+            st.metric("🏥 Reputação", f"{st.session_state.reputacao}/100")
+            st.metric("📈 Precisão", 
+                     f"{(st.session_state.missoes_completas/(st.session_state.missoes_completas + st.session_state.erros_cometidos)*100):.1f}%" 
+                     if st.session_state.missoes_completas + st.session_state.erros_cometidos > 0 else "0%")
+    
+    st.markdown("---")
+    
+    # Habilidades
+    st.subheader("🎓 Suas Habilidades")
+    
+    for nome, dados in st.session_state.habilidades.items():
+        col1, col2 = st.columns([1, 3])
+        
+        with col1:
+            nivel = dados['nivel']
+            # Ícone baseado no nível
+            if nivel == 0:
+                icone = "🔒"
+                cor = "gray"
+            elif nivel < 3:
+                icone = "📖"
+                cor = "blue"
+            elif nivel < 5:
+                icone = "📚"
+                cor = "green"
+            else:
+                icone = "🏆"
+                cor = "gold"
+            
+            st.markdown(f"### {icone} Nível {nivel}")
+        
+        with col2:
+            # Barra de progresso da habilidade
+            xp_hab = dados['xp']
+            xp_necessario_hab = nivel * 50 + 50
+            
+            if nivel > 0:
+                progresso_hab = min(xp_hab / xp_necessario_hab, 1.0)
+                st.progress(progresso_hab, text=f"XP: {xp_hab}/{xp_necessario_hab}")
+            
+            # Fórmulas desbloqueadas
+            if dados['formulas']:
+                with st.expander(f"Fórmulas desbloqueadas ({len(dados['formulas'])})"):
+                    for formula in dados['formulas']:
+                        st.code(formula, language=None)
+    
+    st.markdown("---")
+    
+    # Inventário
+    st.subheader("💼 Seu Inventário")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 🔬 Detectores")
+        
+        for nome, dados in st.session_state.inventario['detectores'].items():
+            if dados['quantidade'] > 0:
+                # Emojis para cada detector
+                emojis = {
+                    'geiger': '📡',
+                    'camera_ionizacao': '⚡',
+                    'nai': '💎'
+                }
+                
+                st.markdown(f"{emojis.get(nome, '🔧')} **{nome.replace('_', ' ').title()}**")
+                st.markdown(f"  Quantidade: {dados['quantidade']}")
+                st.markdown(f"  Condição: {dados['condicao']}%")
+    
+    with col2:
+        st.markdown("### 🧰 Ferramentas")
+        
+        for nome, disponivel in st.session_state.inventario['ferramentas'].items():
+            if disponivel:
+                emojis = {
+                    'calculadora': '🧮',
+                    'tabela_constantes': '📋',
+                    'manual': '📖'
+                }
+                
+                st.markdown(f"{emojis.get(nome, '🔧')} **{nome.replace('_', ' ').title()}**")
+    
+    st.markdown("---")
+    
+    # Conquistas
+    st.subheader("🏅 Suas Conquistas")
+    
+    conquistas_info = {
+        'primeiro_calculo': {
+            'nome': 'Primeiro Cálculo',
+            'descricao': 'Complete seu primeiro cálculo de dose',
+            'icone': '🔢'
+        },
+        'detetive_perfeito': {
+            'nome': 'Detetive Perfeito',
+            'descricao': 'Encontre uma fonte perdida em menos de 5 tentativas',
+            'icone': '🕵️'
+        },
+        'mestre_dosimetria': {
+            'nome': 'Mestre da Dosimetria',
+            'descricao': 'Calibre um acelerador com erro menor que 1%',
+            'icone': '🎯'
+        },
+        'salvador_vidas': {
+            'nome': 'Salvador de Vidas',
+            'descricao': 'Complete 10 missões sem erros graves',
+            'icone': '🦸'
+        }
+    }
+    
+    cols = st.columns(4)
+    
+    for idx, (chave, desbloqueada) in enumerate(st.session_state.conquistas.items()):
+        info = conquistas_info[chave]
+        
+        with cols[idx % 4]:
+            if desbloqueada:
+                st.markdown(f"### {info['icone']}")
+                st.markdown(f"**{info['nome']}**")
+                st.markdown(f"*{info['descricao']}*")
+                st.success("✅ Desbloqueada")
+            else:
+                st.markdown(f"### 🔒")
+                st.markdown(f"**{info['nome']}**")
+                st.markdown(f"*Conquista bloqueada*")
+                st.info("Em progresso...")
@@ -0,0 +1,108 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Ranking
+=============================================================
+
+Classificação dos físicos médicos por XP.
+=============================================================
+"""
+
+import streamlit as st
+
+import persistencia
+
+# ============================================================
+# MÓDULO 6: LOJA E RANKING
+# ============================================================
+
+def mostrar_ranking():
+    """Exibe o ranking de todos os jogadores salvos"""
+    
+    st.title("🏆 RANKING DOS FÍSICOS MÉDICOS")
+    
+    armazem = persistencia.obter_armazem()
+    jogador_id = st.session_state.get('jogador_id')
+    seu_xp = st.session_state.xp_total
+    
+    # Top 10 e posição vêm do índice de XP; a sua linha usa o estado
+    # da sessão, que pode estar à frente do que já foi gravado
+    sua_posicao = armazem.posicao(seu_xp, ignorar=jogador_id)
+    ranking_data = [j for j in armazem.top(11) if j["id"] != jogador_id]
+    if sua_posicao <= 10:
+        ranking_data.insert(sua_posicao - 1, {
+            "id": jogador_id, "nome": "Você", "nivel": st.session_state.nivel,
+            "xp": seu_xp, "especialidade": persistencia.especialidade(st.session_state.habilidades)
+        })
+    ranking_data = ranking_data[:10]
+    
+    st.info(f"📊 **Sua posição no ranking:** #{sua_posicao}")
+    
+    # Exibir top 10
+    st.subheader("🥇 Top 10 Físicos Médicos")
+    
+    for i, jogador in enumerate(ranking_data[:10]):
+        col1, col2, col3, col4 = st.columns([1, 3, 2, 2])
+        
+        with col1:
+            # Medalhas para os primeiros lugares
+            if i == 0:
+                st.markdown("🥇")
+            elif i == 1:
+                st.markdown("🥈")
+            elif i == 2:
+                st.markdown("🥉")
+            else:
+                st.markdown(f"**#{i+1}**")
+        
+        with col2:
+            if jogador["nome"] == "Você":
+                st.markdown(f"### 👤 **{jogador['nome']}**")
+            else:
+                st.markdown(f"**{jogador['nome']}**")
+        
+        with col3:
+            st.markdown(f"**Nível {jogador['nivel']}**")
+            st.markdown(f"⭐ {jogador['xp']:,} XP")
+        
+        with col4:
+            # Emoji para especialidade
+            emojis = {
+                "Medicina Nuclear": "🔬",
+                "Radioterapia": "🏥",
+                "Radioproteção": "🛡️",
+                "Diagnóstico": "📷",
+                "Estagiário": "👨‍🎓"
+            }
+            st.markdown(f"{emojis.get(jogador['especialidade'], '👨‍⚕️')} {jogador['especialidade']}")
+    
+    # Estatísticas do ranking
+    st.markdown("---")
+    st.subheader("📈 Estatísticas do Ranking")
+    
+    # Agregados mantidos a cada gravação (custo independe do nº de jogadores)
+    estatisticas = armazem.estatisticas()
+    st.caption(f"👥 {estatisticas['jogadores']:,} físicos médicos cadastrados")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Média de Nível", f"{estatisticas['media_nivel']:.1f}")
+    
+    with col2:
+        st.metric("Média de XP", f"{estatisticas['media_xp']:,.0f}")
+    
+    with col3:
+        st.metric("Especialidade mais comum", estatisticas['especialidade_mais_comum'])
+    
+    # Progresso em relação ao topo
+    if ranking_data:
+        st.markdown("---")
+        
+        xp_top = ranking_data[0]["xp"]
+        
+        if seu_xp < xp_top:
+            percentual = (seu_xp / xp_top) * 100
+            st.progress(percentual/100, text=f"Progresso em relação ao 1º lugar: {percentual:.1f}%")
+            
+            xp_necessario = xp_top - seu_xp
+            st.info(f"⭐ Você precisa de mais **{xp_necessario:,.0f} XP** para alcançar o 1º lugar!")
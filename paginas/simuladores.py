@@ -0,0 +1,978 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Simuladores
+=============================================================
+
+Simuladores de detectores, de decaimento e de blindagem.
+=============================================================
+"""
+
+import math
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import atenuacao
+import blindagem
+import cadeias
+import contagem
+import espectros
+import fisica
+import graficos
+import nuclideos
+import transporte
+
+# ============================================================
+# MÓDULO 4: SIMULADORES
+# ============================================================
+
+# Materiais do simulador de blindagem → nome na tabela de atenuação
+MATERIAIS_BLINDAGEM = {
+    "Chumbo (Pb)": "Pb",
+    "Concreto": "Concreto comum",
+    "Aço": "Aço",
+    "Água": "Água",
+    "Tungstênio": "W",
+    "Cobre": "Cu",
+    "Alumínio": "Al",
+    "Polietileno": "Polietileno",
+    "Concreto baritado": "Concreto baritado",
+    "Vidro plumbífero": "Vidro plumbífero",
+    "Polietileno borado": "Polietileno borado",
+}
+
+MATERIAL_PERSONALIZADO = "🧪 Personalizado..."
+
+# Exibição da tabela tipada do simulador de detectores
+COLUNAS_DETECTORES = {
+    "_index": st.column_config.TextColumn("Detector"),
+    "eficiencia": st.column_config.NumberColumn("Eficiência", format="percent"),
+    "resolucao": st.column_config.TextColumn("Resolução"),
+    "tempo_morto_us": st.column_config.NumberColumn("Tempo morto (µs)", format="%g"),
+    "taxa_cps": st.column_config.NumberColumn("Taxa (cps)", format="%.0f"),
+    "limite_cps": st.column_config.NumberColumn("Limite 1/τ (cps)", format="%.0f"),
+    "saturado": st.column_config.CheckboxColumn("Saturado"),
+    "aplicacao": st.column_config.TextColumn("Aplicação"),
+    "custo_brl": st.column_config.NumberColumn("Custo", format="R$ %.0f"),
+}
+
+# Radionuclídeos com linhas de fótons, para o modo espectro
+EMISSORES_GAMA = tuple(nome for nome in nuclideos.NOMES if len(nuclideos.nuclideo(nome).energias))
+
+def meio_transporte(mat):
+    """Meio do transporte Monte Carlo para um material da tabela de atenuação"""
+    return transporte.Meio(mat.nome, tuple(mat.energias),
+                           tuple(np.exp(mat.ln_mu_rho) * mat.densidade),
+                           mat.densidade, mat.z_sobre_a)
+
+def mostrar_simuladores():
+    """Módulo com simuladores interativos"""
+    
+    st.title("🔬 SIMULADORES DE DETECTORES")
+    
+    simulador = st.selectbox(
+        "Selecione o simulador:",
+        ["📡 Simulador de Detectores", "🌡️ Simulador de Decaimento", 
+         "⛓️ Simulador de Cadeias (Bateman)", "🛡️ Simulador de Blindagem",
+         "🧱 Otimizador de Blindagem em Camadas", "🏗️ Projeto de Barreiras (NCRP)"]
+    )
+    
+    if simulador == "📡 Simulador de Detectores":
+        simulador_detectores()
+    elif simulador == "🌡️ Simulador de Decaimento":
+        simulador_decaimento()
+    elif simulador == "⛓️ Simulador de Cadeias (Bateman)":
+        simulador_cadeias()
+    elif simulador == "🛡️ Simulador de Blindagem":
+        simulador_blindagem()
+    elif simulador == "🧱 Otimizador de Blindagem em Camadas":
+        otimizador_camadas()
+    elif simulador == "🏗️ Projeto de Barreiras (NCRP)":
+        projeto_barreiras()
+
+FONTES_DETECTORES = ["Cs-137", "Co-60", "I-131", "Tc-99m", "Am-241"]
+
+@st.fragment
+def simulador_detectores():
+    """Simulador comparativo de detectores"""
+    
+    st.subheader("📡 Simulador Comparativo de Detectores")
+    
+    # Seleção de parâmetros
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Energia da linha de fótons principal, da tabela de nuclídeos
+        fonte = st.selectbox(
+            "Fonte radioativa",
+            FONTES_DETECTORES,
+            format_func=lambda nome: f"{nome} ({nuclideos.nuclideo(nome).energia_principal:g} keV)"
+        )
+        
+        E = nuclideos.nuclideo(fonte).energia_principal
+    
+    with col2:
+        atividade = st.number_input("Atividade (MBq)", min_value=0.1, value=100.0, step=10.0)
+        distancia = st.slider("Distância (m)", 0.1, 10.0, 1.0, 0.1)
+    
+    # Parâmetros dos detectores (tempo morto em µs)
+    detectores = {
+        "Geiger-Müller": {
+            "eficiencia": 0.01,
+            "resolucao": "N/A",
+            "tempo_morto": 200,
+            "custo": 500,
+            "aplicacao": "Monitoração presença"
+        },
+        "Câmara de Ionização": {
+            "eficiencia": 0.05,
+            "resolucao": "N/A",
+            "tempo_morto": 0,
+            "custo": 2000,
+            "aplicacao": "Dosimetria absoluta"
+        },
+        "Detector Proporcional": {
+            "eficiencia": 0.08,
+            "resolucao": "10-20%",
+            "tempo_morto": 1,
+            "custo": 3000,
+            "aplicacao": "Espectrometria α/β"
+        },
+        "NaI(Tl)": {
+            "eficiencia": 0.25,
+            "resolucao": "6-8%",
+            "tempo_morto": 0.1,
+            "custo": 5000,
+            "aplicacao": "Medicina nuclear"
+        }
+    }
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        modelo = st.radio("Modelo de tempo morto", list(contagem.MODELOS_TEMPO_MORTO),
+                          help="Não paralisável: m = n/(1 + nτ). Paralisável: m = n·e^(-nτ).")
+    with col2:
+        faixa_atividades = st.select_slider("Faixa de atividades (MBq)",
+                                            [0.1, 1.0, 10.0, 100.0, 1e3, 1e4, 1e5], (1.0, 1e4))
+    with col3:
+        faixa_distancias = st.slider("Faixa de distâncias (m)", 0.1, 10.0, (0.1, 10.0), 0.1)
+
+    # Toda a grade atividade × distância numa chamada, com o ponto escolhido incluído
+    atividades = np.unique(np.append(np.geomspace(*faixa_atividades, 80), atividade))
+    distancias = np.unique(np.append(np.geomspace(*faixa_distancias, 60), distancia))
+    verdadeira, observada, saturado = contagem.varredura(
+        atividades, distancias, [d["eficiencia"] for d in detectores.values()],
+        [d["tempo_morto"] for d in detectores.values()], modelo)
+    i, j = np.searchsorted(atividades, atividade), np.searchsorted(distancias, distancia)
+
+    st.markdown("---")
+    st.subheader("📊 Resultados no Ponto Escolhido")
+
+    # Tabela tipada: a formatação só entra na exibição (column_config)
+    tabela = tabela_detectores(detectores, observada[:, i, j], saturado[:, i, j])
+    st.dataframe(tabela, width="stretch", column_config=COLUNAS_DETECTORES)
+    st.download_button("📥 Resultados (CSV)", tabela.to_csv(), "detectores.csv", "text/csv")
+    
+    # Gráfico comparativo
+    nomes = list(tabela.index)
+    grafico = graficos.Grafico('Comparação de Detectores', '', 'Taxa de Contagem (cps)',
+                               grade='y')
+    grafico.barras(nomes, tabela["taxa_cps"], np.where(tabela["saturado"], 'red', 'blue'))
+    limite_geiger = tabela.at["Geiger-Müller", "limite_cps"]
+    grafico.horizontal(limite_geiger, cor='orange',
+                       rotulo=f'Limite Geiger ({limite_geiger:,.0f} cps)'.replace(",", "."), opacidade=1.0)
+    
+    # Adicionar valores nas barras
+    grafico.texto(nomes, tabela["taxa_cps"], [f'{t:,.0f}' for t in tabela["taxa_cps"]])
+    
+    graficos.exibir(grafico, "simulador_detectores")
+    
+    # Conclusões
+    st.markdown("---")
+    st.subheader("💡 Conclusões da Simulação")
+    
+    with st.expander("📚 Análise Detalhada"):
+        st.markdown(f"""
+        **Para fonte de {fonte} ({E} keV) a {distancia} m:**
+        
+        1. **Geiger-Müller:** {'**Satura!** Use outro detector ou aumente a distância.' if tabela.at["Geiger-Müller", "saturado"] else 'Adequado para monitoração.'}
+        
+        2. **Câmara de Ionização:** {'Corrente muito baixa para esta distância.' if tabela.at["Câmara de Ionização", "taxa_cps"] < 100 else 'Ideal para dosimetria precisa.'}
+        
+        3. **Detector Proporcional:** Boa para espectrometria nesta faixa de energia.
+        
+        4. **NaI(Tl):** Excelente eficiência, ideal para quantificação.
+        
+        **Recomendação:** {recomendar_detector(E, atividade, distancia)}
+        """)
+
+    # Curvas de resposta da grade inteira
+    st.markdown("---")
+    st.subheader("📈 Curvas de Resposta (Tempo Morto)")
+    st.caption(f"Modelo {modelo.lower()}; saturado a partir de nτ = {contagem.SATURACAO:g} "
+               f"(taxa verdadeira n, tempo morto τ). A câmara de ionização opera em modo corrente.")
+
+    grafico = graficos.Grafico('Taxa observada × taxa verdadeira', 'Taxa verdadeira (cps)',
+                               'Taxa observada (cps)', escala_x='log', escala_y='log')
+    extremos = [verdadeira.min(), verdadeira.max()]
+    grafico.linha(extremos, extremos, cor='gray', rotulo='Sem tempo morto', espessura=1, estilo='--')
+    for k, nome in enumerate(detectores):
+        # m depende só de n: a grade inteira cai sobre uma curva por detector
+        ordem = np.argsort(verdadeira[k], axis=None)
+        ordem = ordem[np.linspace(0, ordem.size - 1, 300).astype(int)]
+        n, m = verdadeira[k].ravel()[ordem], observada[k].ravel()[ordem]
+        # O paralisável cai a zero: abaixo de 0,01 cps a escala log não tem o que mostrar
+        visivel = m > 0.01
+        grafico.linha(n[visivel], m[visivel], cor=graficos.PALETA[k], rotulo=nome)
+    graficos.exibir(grafico, "simulador_detectores/tempo_morto")
+
+    grafico = graficos.Grafico(f'Taxa observada × atividade a {distancia} m (tracejado: verdadeira)',
+                               'Atividade (MBq)', 'Taxa de contagem (cps)',
+                               escala_x='log', escala_y='log')
+    for k, nome in enumerate(detectores):
+        visivel = observada[k, :, j] > 0.01
+        grafico.linha(atividades[visivel], observada[k, visivel, j], cor=graficos.PALETA[k], rotulo=nome)
+        grafico.linha(atividades, verdadeira[k, :, j], cor=graficos.PALETA[k], espessura=1, estilo='--')
+    grafico.vertical(atividade, rotulo=f'{atividade:g} MBq')
+    graficos.exibir(grafico, "simulador_detectores/atividades")
+
+    trem_pulsos({nome: verdadeira[k, i, j] for k, nome in enumerate(detectores)
+                 if nome in contagem.CONTADORES}, modelo)
+    espectro_detectores(fonte, atividade, distancia)
+
+def tabela_detectores(detectores, taxas, saturados):
+    """Resultados no ponto escolhido, uma linha por detector, com tipos numéricos
+
+    Eficiência em fração, taxas em cps (a observada, mesmo quando
+    saturado) e o limite 1/τ (NaN sem tempo morto).
+    """
+    tempos_mortos = np.array([d["tempo_morto"] for d in detectores.values()], dtype=float)
+    limites = np.full(tempos_mortos.shape, np.nan)
+    np.divide(1e6, tempos_mortos, out=limites, where=tempos_mortos > 0)
+    return pd.DataFrame({
+        "eficiencia": np.array([d["eficiencia"] for d in detectores.values()], dtype=float),
+        "resolucao": [d["resolucao"] for d in detectores.values()],
+        "tempo_morto_us": tempos_mortos,
+        "taxa_cps": np.asarray(taxas, dtype=float),
+        "limite_cps": limites,
+        "saturado": np.asarray(saturados, dtype=bool),
+        "aplicacao": [d["aplicacao"] for d in detectores.values()],
+        "custo_brl": np.array([d["custo"] for d in detectores.values()], dtype=float),
+    }, index=pd.Index(list(detectores), name="detector"))
+
+def trem_pulsos(taxas, modelo):
+    """Modo evento a evento dos contadores de pulso, na taxa verdadeira do ponto escolhido"""
+    st.markdown("---")
+    st.subheader("⚡ Trem de Pulsos (Evento a Evento)")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        nome = st.selectbox("Contador", list(contagem.CONTADORES))
+    with col2:
+        eventos = st.select_slider("Eventos", [100_000, 1_000_000, 3_000_000, 10_000_000, 30_000_000],
+                                   1_000_000, format_func=lambda n: f"{n:,}")
+    with col3:
+        limiar = st.slider("Limiar do discriminador", 0.0, 1.5, 0.5, 0.05,
+                           help="Em unidades da altura média de um pulso isolado; "
+                                "eventos empilhados somam as alturas")
+
+    contador = contagem.CONTADORES[nome]
+    taxa = float(taxas[nome])
+    tau = contador.tempo_morto * 1e-6
+    st.caption(f"Taxa verdadeira no ponto escolhido: {taxa:,.0f} cps (nτ = {taxa * tau:.3g}); "
+               f"τ = {contador.tempo_morto:g} µs, largura do pulso {contador.largura_pulso:g} µs, "
+               f"modelo {modelo.lower()}.")
+
+    if st.button("Simular trem de pulsos"):
+        with st.spinner(f"Gerando {eventos:,} eventos..."):
+            inicio = time.perf_counter()
+            trem = contagem.simular_trem(contador, taxa, eventos, limiar, modelo)
+            duracao = time.perf_counter() - inicio
+        # O modelo vale para os pulsos que passam do discriminador
+        esperada = contagem.MODELOS_TEMPO_MORTO[modelo](trem.acima_limiar / trem.tempo, tau)
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Taxa verdadeira", f"{trem.eventos / trem.tempo:,.0f} cps")
+        with col2:
+            st.metric("Taxa medida (simulada)", f"{trem.taxa_medida:,.0f} cps")
+        with col3:
+            st.metric(f"Taxa esperada ({modelo.lower()})", f"{esperada:,.0f} cps",
+                      help="Modelo de tempo morto aplicado à taxa acima do limiar; o "
+                           "empilhamento cai dentro do tempo morto e só muda a altura. "
+                           "Com limiar acima de 1 passam sobretudo pulsos empilhados, o "
+                           "trem deixa de ser Poisson e o modelo é só aproximado")
+        with col4:
+            st.metric("Perdas", f"{1 - trem.registrados / max(trem.eventos, 1):.1%}")
+
+        # Intervalos entre registros: exponencial deslocada de τ (nada abaixo do tempo morto)
+        centros = (trem.bordas[:-1] + trem.bordas[1:]) / 2 * 1e6
+        grafico = graficos.Grafico(f'Intervalos entre registros - {nome}', 'Intervalo (µs)',
+                                   'Registros')
+        grafico.linha(centros, trem.intervalos, cor='purple')
+        grafico.area(centros, trem.intervalos, cor='purple')
+        grafico.vertical(contador.tempo_morto, cor='red', rotulo=f'τ = {contador.tempo_morto:g} µs')
+        graficos.exibir(grafico, "simulador_detectores/intervalos")
+
+        # Taxa medida em cada porta de tempo: flutuação de Poisson reduzida pelo tempo morto
+        contagens, bordas = np.histogram(trem.taxas_portas, bins=30)
+        centros = (bordas[:-1] + bordas[1:]) / 2
+        grafico = graficos.Grafico(f'Taxa medida em {trem.portas.size:,} portas de {trem.porta:.3g} s',
+                                   'Taxa medida (cps)', 'Portas')
+        grafico.linha(centros, contagens, cor='teal')
+        grafico.area(centros, contagens, cor='teal')
+        grafico.vertical(esperada, cor='red', rotulo='Esperada')
+        graficos.exibir(grafico, "simulador_detectores/portas")
+
+        st.caption(
+            f"🎲 {trem.eventos:,} eventos em {duracao:.2f} s "
+            f"({trem.eventos / duracao:,.0f} eventos/s, até {transporte.processos_disponiveis()} processos) "
+            f"- {trem.eventos - trem.acima_limiar:,} abaixo do limiar, "
+            f"{trem.acima_limiar - trem.registrados:,} no tempo morto, "
+            f"{trem.empilhados:,} registros com eventos empilhados"
+        )
+
+def espectro_detectores(fonte, atividade, distancia):
+    """Espectro NaI(Tl) de uma mistura de fontes, pela matriz de resposta do cristal"""
+    st.markdown("---")
+    st.subheader("📈 Espectro no NaI(Tl)")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        mistura = st.multiselect("Fontes no espectro", FONTES_DETECTORES, default=[fonte],
+                                 help="Cada fonte com a atividade e a distância acima")
+    with col2:
+        cristal = st.selectbox("Cristal", list(espectros.CRISTAIS), index=1)
+    with col3:
+        tempo = st.select_slider("Tempo de contagem (s)", [10, 30, 60, 300, 600, 1800, 3600], 60)
+
+    linhas = [espectros.linhas_fonte(nome, atividade, distancia) for nome in mistura]
+    energias = np.concatenate([np.empty(0)] + [e for e, _ in linhas])
+    fluencias = np.concatenate([np.empty(0)] + [f for _, f in linhas])
+    esperado = espectros.espectro_esperado(cristal, energias, fluencias, tempo)
+    # Semente derivada das entradas: as mesmas entradas redesenham o mesmo espectro,
+    # que vem do cache de figuras em vez de ocupar uma entrada nova a cada execução
+    semente = int(graficos.chave_figura("espectro_detectores",
+                                        [sorted(mistura), cristal, tempo, atividade, distancia])[:16], 16)
+    contagens = espectros.amostrar(esperado, np.random.default_rng(semente))
+
+    E_max = max([1500.0] + [1.25 * max(e) for e, _ in linhas])
+    canais = slice(0, int(E_max / espectros.LARGURA_CANAL))
+
+    grafico = graficos.Grafico(f'Espectro NaI(Tl) {cristal} ({tempo} s, com fundo natural)',
+                               'Energia (keV)', 'Contagens por canal')
+    grafico.linha(espectros.ENERGIAS[canais], contagens[canais], cor='blue', espessura=1.5)
+    grafico.area(espectros.ENERGIAS[canais], contagens[canais])
+    for nome in mistura:
+        E_pico = nuclideos.nuclideo(nome).energia_principal
+        grafico.vertical(E_pico, cor='red', rotulo=f'{E_pico:g} keV ({nome})')
+    graficos.exibir(grafico, "simulador_detectores/espectro", figsize=(10, 4))
+
+    colunas = st.columns(len(mistura) + 1)
+    colunas[0].metric("Taxa total", f"{contagens.sum() / tempo:,.0f} cps".replace(",", "."))
+    for coluna, nome in zip(colunas[1:], mistura):
+        E_pico = nuclideos.nuclideo(nome).energia_principal
+        pico = espectros.contagens_janela(contagens, cristal, E_pico) / tempo
+        coluna.metric(f"Fotopico {E_pico:g} keV", f"{pico:.1f} cps")
+
+def recomendar_detector(energia, atividade, distancia):
+    """Recomenda o detector ideal baseado nos parâmetros"""
+    
+    if energia < 100:  # Baixa energia
+        if atividade < 10:  # Baixa atividade
+            return "**Câmara de Ionização** para dosimetria precisa"
+        else:
+            return "**NaI(Tl)** para melhor eficiência"
+    
+    elif energia < 500:  # Energia média
+        if distancia < 2:  # Perto
+            return "**Detector Proporcional** (Geiger pode saturar)"
+        else:
+            return "**NaI(Tl)** ou **Geiger** para monitoração"
+    
+    else:  # Alta energia
+        return "**NaI(Tl)** para melhor eficiência em gama"
+
+@st.fragment
+def simulador_decaimento():
+    """Simulador de decaimento de múltiplos radionuclídeos"""
+    
+    st.subheader("🌡️ Simulador de Decaimento de Radionuclídeos")
+    
+    # Radionuclídeos comparáveis (meias-vidas da tabela de nuclídeos, em s)
+    radionuclideos = ["Tc-99m", "I-131", "F-18", "Ga-68", "Lu-177", "Co-60", "Cs-137"]
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        selecionados = st.multiselect(
+            "Selecione os radionuclídeos para comparar:",
+            radionuclideos,
+            default=["Tc-99m", "I-131", "F-18"]
+        )
+        
+        A0 = st.number_input("Atividade inicial (MBq)", value=1000.0)
+    
+    with col2:
+        tempo = st.number_input("Tempo decorrido", value=24.0)
+        tempo_unidade = st.selectbox("Unidade de tempo", ["horas", "dias", "anos"])
+    
+    if st.button("Simular Decaimento"):
+        if not selecionados:
+            st.warning("Selecione pelo menos um radionuclídeo!")
+            return
+        
+        st.markdown("---")
+        
+        # Criar gráfico
+        grafico = graficos.Grafico(
+            f'Comparação de Decaimento Radionuclídeo\n(A₀ = {A0} MBq, t = {tempo} {tempo_unidade})',
+            'Tempo (horas)', 'Atividade (MBq)', y_min=0
+        )
+        
+        # Tempo em horas
+        t_horas = tempo * nuclideos.UNIDADES_TEMPO[tempo_unidade] / nuclideos.HORA
+        
+        for i, nome in enumerate(selecionados):
+            nuclideo = nuclideos.nuclideo(nome)
+            T_horas = nuclideo.meia_vida / nuclideos.HORA
+            cor = graficos.PALETA[i % len(graficos.PALETA)]
+            
+            # Curva de decaimento
+            tempos = np.linspace(0, min(T_horas * 5, 500), 500)
+            atividades = fisica.atividade_decaida(A0, tempos, T_horas)
+            
+            # Atividade no tempo especificado
+            A_t = float(fisica.atividade_decaida(A0, t_horas, T_horas))
+            
+            grafico.linha(tempos, atividades, cor=cor,
+                          rotulo=f"{nome} (T₁/₂={nuclideos.formatar_meia_vida(nuclideo.meia_vida)})")
+            grafico.pontos(t_horas, A_t, cor=cor)
+            
+            # Anotação
+            grafico.texto([t_horas], [A_t], [f'{A_t:.0f} MBq'], cor=cor, deslocamento=(10, 10))
+        
+        grafico.vertical(t_horas, cor='gray', opacidade=0.5)
+        grafico.horizontal(A0/2, cor='gray', estilo=':', rotulo='50% atividade', opacidade=0.5)
+        grafico.horizontal(A0/4, cor='lightgray', estilo=':', rotulo='25% atividade', opacidade=0.3)
+        
+        graficos.exibir(grafico, "simulador_decaimento", figsize=(12, 6))
+        
+        # Tabela de resultados
+        st.markdown("---")
+        st.subheader("📋 Resultados Numéricos")
+        
+        dados = []
+        for nome in selecionados:
+            nuclideo = nuclideos.nuclideo(nome)
+            
+            # Tempo e meia-vida em segundos: qualquer combinação de unidades é exata
+            A_t = float(fisica.atividade_decaida(A0, t_horas * nuclideos.HORA, nuclideo.meia_vida))
+            percentual = A_t / A0 * 100
+            
+            dados.append({
+                "Radionuclídeo": nome,
+                "Meia-vida": nuclideos.formatar_meia_vida(nuclideo.meia_vida),
+                "Uso Principal": nuclideo.uso,
+                f"Atividade após {tempo} {tempo_unidade}": f"{A_t:.1f} MBq",
+                "Percentual": f"{percentual:.1f}%"
+            })
+        
+        df = pd.DataFrame(dados)
+        st.dataframe(df, width="stretch")
+
+@st.fragment
+def simulador_cadeias():
+    """Simulador de cadeias pai → filha (equações de Bateman)"""
+    
+    st.subheader("⛓️ Simulador de Cadeias de Decaimento")
+    
+    st.markdown("""
+    **Equações de Bateman:** dNᵢ/dt = Σ bⱼᵢ·λⱼ·Nⱼ − λᵢ·Nᵢ
+    
+    A filha cresce a partir do pai e decai com a própria meia-vida. Se o pai vive
+    muito mais que a filha, as atividades se igualam (**equilíbrio secular**); se vive
+    só um pouco mais, a filha acompanha o pai numa razão constante (**equilíbrio transiente**).
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        nome_cadeia = st.selectbox("Cadeia", list(cadeias.CADEIAS))
+        cadeia, eluivel = cadeias.CADEIAS[nome_cadeia]
+        A0 = st.number_input(f"Atividade inicial de {cadeia.nomes[0]} (MBq)", value=1000.0, min_value=0.0)
+    
+    # Horizonte padrão: dez meias-vidas da filha mais longa que ainda é mais curta que o pai
+    T_pai = cadeia.meias_vidas[0]
+    filhas_curtas = [T for T in cadeia.meias_vidas[1:] if T < T_pai]
+    horizonte = 10 * max(filhas_curtas) if filhas_curtas else 5 * T_pai
+    
+    with col2:
+        duracao = st.number_input("Duração (horas)", min_value=0.01,
+                                  value=round(horizonte / nuclideos.HORA, 2))
+        escala_log = st.checkbox("Escala logarítmica", value=False)
+    
+    eluir = False
+    if eluivel is not None:
+        eluir = st.checkbox(f"🧪 Eluir {cadeia.nomes[eluivel]} do gerador periodicamente")
+        if eluir:
+            col1, col2 = st.columns(2)
+            with col1:
+                intervalo = st.number_input("Intervalo entre eluições (horas)", min_value=0.1,
+                                            value=24.0 if duracao >= 48 else max(0.1, duracao / 4))
+            with col2:
+                eficiencia = st.slider("Eficiência da eluição (%)", 50, 100, 90) / 100
+    
+    tempos = np.linspace(0, duracao * nuclideos.HORA, 600)
+    if eluir:
+        instantes = np.arange(intervalo, duracao, intervalo) * nuclideos.HORA
+        atividades, eluido = cadeias.atividades_com_eluicao(cadeia, A0, tempos, instantes,
+                                                            eluivel, eficiencia)
+    else:
+        atividades = cadeias.atividades(cadeia, A0, tempos)
+    
+    grafico = graficos.Grafico(f'{nome_cadeia}\n(A₀ = {A0:g} MBq)', 'Tempo (horas)',
+                               'Atividade (MBq)', escala_y='log' if escala_log else 'linear',
+                               y_min=None if escala_log else 0)
+    for i, (nome, T) in enumerate(zip(cadeia.nomes, cadeia.meias_vidas)):
+        if T == nuclideos.ESTAVEL:
+            continue
+        curva = atividades[i]
+        if escala_log:
+            curva = np.where(curva > 0, curva, np.nan)
+        grafico.linha(tempos / nuclideos.HORA, curva, cor=graficos.PALETA[i % len(graficos.PALETA)],
+                      rotulo=nome)
+    graficos.exibir(grafico, "simulador_cadeias", figsize=(12, 6))
+    
+    # Equilíbrio de cada par pai → filha radioativa
+    st.markdown("### ⚖️ Equilíbrio pai-filha")
+    for pai, filha, fracao in cadeia.ramificacoes:
+        T_p, T_f = cadeia.meias_vidas[pai], cadeia.meias_vidas[filha]
+        if T_f > 1000 * T_p:  # filha estável na prática (ex.: Tc-99)
+            continue
+        tipo = cadeias.tipo_equilibrio(T_p, T_f)
+        texto = f"**{cadeia.nomes[pai]} → {cadeia.nomes[filha]}** ({fracao:.1%}): {tipo}"
+        if tipo != "sem equilíbrio":
+            texto += (f" - A_filha/A_pai → {cadeias.razao_equilibrio(T_p, T_f, fracao):.3f}, "
+                      f"máximo da filha em {cadeias.tempo_maximo_filha(T_p, T_f) / nuclideos.HORA:.2f} h")
+        st.markdown(f"- {texto}")
+    
+    # Atividades no fim do intervalo
+    st.markdown("### 📋 Atividades no fim do intervalo")
+    colunas = st.columns(len(cadeia.nomes))
+    for coluna, nome, T, A in zip(colunas, cadeia.nomes, cadeia.meias_vidas, atividades[:, -1]):
+        with coluna:
+            st.metric(nome, "estável" if T == nuclideos.ESTAVEL else f"{A:.4g} MBq")
+    
+    if eluir and len(eluido):
+        st.markdown(f"### 🧪 Eluições de {cadeia.nomes[eluivel]}")
+        df = pd.DataFrame({
+            "Eluição": np.arange(1, len(eluido) + 1),
+            "Instante (h)": instantes / nuclideos.HORA,
+            "Atividade eluída (MBq)": eluido.round(1)
+        })
+        st.dataframe(df, width="stretch", hide_index=True)
+
+def escolher_fonte():
+    """Fonte de fótons: (energias, rendimentos, E da linha principal, descrição)"""
+    fonte = st.radio("Fonte de fótons", ["Energia única", "Espectro de radionuclídeo"],
+                     horizontal=True)
+    
+    if fonte == "Energia única":
+        E = st.number_input(
+            "Energia do fóton (keV)", min_value=atenuacao.E_MIN, max_value=atenuacao.E_MAX,
+            value=662.0, step=10.0,
+            help="Ex.: 50 keV (raio-X diagnóstico), 140 keV (Tc-99m), 662 keV (Cs-137), "
+                 "1250 keV (Co-60), 6000 keV (LINAC)"
+        )
+        return np.array([E]), np.array([1.0]), E, f"{E:g} keV"
+    
+    nome = st.selectbox(
+        "Radionuclídeo", EMISSORES_GAMA, index=EMISSORES_GAMA.index("I-131"),
+        format_func=lambda n: f"{n} ({len(nuclideos.nuclideo(n).energias)} linhas)"
+    )
+    registro = nuclideos.nuclideo(nome)
+    return registro.energias, registro.rendimentos, registro.energia_principal, nome
+
+def editor_material():
+    """Monta uma mistura por frações em massa; None se a composição for inválida"""
+    base = st.selectbox("Partir da receita", list(atenuacao.RECEITAS))
+    descricao, densidade, fracoes = atenuacao.RECEITAS[base]
+    
+    nome = st.text_input("Nome do material", f"{base} (modificado)")
+    densidade = st.number_input("Densidade (g/cm³)", min_value=0.001, max_value=25.0,
+                                value=densidade, step=0.05, key=f"densidade_{base}")
+    composicao = st.data_editor(
+        pd.DataFrame({"Componente": list(fracoes), "Fração em massa": list(fracoes.values())}),
+        num_rows="dynamic", hide_index=True, width="stretch", key=f"composicao_{base}",
+        column_config={
+            "Componente": st.column_config.SelectboxColumn(options=atenuacao.NOMES, required=True),
+            "Fração em massa": st.column_config.NumberColumn(min_value=0.0, max_value=1.0,
+                                                             format="%.4f", required=True),
+        }
+    ).dropna()
+    
+    fracoes = composicao.groupby("Componente")["Fração em massa"].sum()
+    soma = float(fracoes.sum())
+    if soma <= 0:
+        st.error("Informe ao menos um componente com fração positiva.")
+        return None
+    if abs(soma - 1) > 0.01:
+        st.warning(f"As frações somam {soma:.3f}; foram normalizadas para 1.")
+    return atenuacao.misturar(nome or "Personalizado", densidade, fracoes.to_dict())
+
+@st.fragment
+def simulador_blindagem():
+    """Simulador de blindagem radiológica"""
+    
+    st.subheader("🛡️ Simulador de Blindagem Radiológica")
+    
+    st.markdown("""
+    **Fórmula da atenuação:** I = I₀ × e^(-μx)
+    
+    Onde:
+    - I₀: intensidade inicial
+    - I: intensidade transmitida  
+    - μ: coeficiente de atenuação linear (cm⁻¹), função da energia
+    - x: espessura do material (cm)
+    
+    Para um radionuclídeo com várias linhas de rendimentos yᵢ: I/I₀ = Σ yᵢ·e^(-μᵢx) / Σ yᵢ
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        energias, rendimentos, E, descricao_fonte = escolher_fonte()
+        
+        reducao_desejada = st.selectbox(
+            "Redução desejada",
+            ["10× (1 ordem)", "100× (2 ordens)", "1000× (3 ordens)", "10.000× (4 ordens)"]
+        )
+        
+        reducoes = {
+            "10× (1 ordem)": 10,
+            "100× (2 ordens)": 100,
+            "1000× (3 ordens)": 1000,
+            "10.000× (4 ordens)": 10000
+        }
+        
+        R = reducoes[reducao_desejada]
+    
+    with col2:
+        material = st.selectbox("Material de blindagem",
+                                [*MATERIAIS_BLINDAGEM, MATERIAL_PERSONALIZADO])
+        
+        if material == MATERIAL_PERSONALIZADO:
+            mat = editor_material()
+            if mat is None:
+                return
+            material = mat.nome
+        else:
+            mat = atenuacao.material(MATERIAIS_BLINDAGEM[material])
+        # μ da linha principal (a primeira, de maior rendimento)
+        mu = float(atenuacao.mu(mat, E))
+        st.caption(f"{mat.descricao}: ρ = {mat.densidade:g} g/cm³, "
+                   f"μ/ρ({E:g} keV) = {atenuacao.mu_rho(mat, E):.4g} cm²/g")
+    
+    modelo = st.radio(
+        "Modelo do feixe",
+        ["Feixe estreito: e^(-μx)", "Feixe largo: Monte Carlo"],
+        horizontal=True,
+        help="O feixe largo conta também os fótons espalhados que atravessam a blindagem (buildup)"
+    )
+    
+    if modelo == "Feixe largo: Monte Carlo":
+        col1, col2 = st.columns(2)
+        with col1:
+            historias = st.select_slider(
+                "Histórias (fótons simulados)",
+                options=[100_000, 1_000_000, 10_000_000],
+                value=1_000_000,
+                format_func=lambda n: f"{n:,}"
+            )
+        with col2:
+            semente = st.number_input("Semente", 0, 2**31 - 1, 42,
+                                      help="A mesma semente reproduz o mesmo resultado")
+    
+    if st.button("Calcular Blindagem"):
+        # Calcular espessura necessária
+        # I/I₀ = 1/R: x = ln(R) / μ para uma linha; para um espectro, resolvido numericamente
+        x = float(atenuacao.espessura_para_transmissao(mat, energias, rendimentos, 1 / R))
+        mu_efetivo = np.log(R) / x
+        
+        st.success(f"**Espessura necessária de {material}:** {x:.2f} cm")
+        
+        # Gráfico da atenuação (todas as linhas × todas as espessuras de uma vez)
+        espessuras = np.linspace(0, x * 2, 100)
+        atenuacoes = atenuacao.transmissao_espectro(mat, energias, rendimentos, espessuras)
+        
+        grafico = graficos.Grafico(f'Atenuação de {descricao_fonte} em {material}\n'
+                                   f'(μ efetivo = {mu_efetivo:.3f} cm⁻¹)',
+                                   f'Espessura de {material} (cm)', 'Transmissão (I/I₀)',
+                                   escala_y='log')
+        grafico.linha(espessuras, atenuacoes, cor='blue')
+        if len(energias) > 1:
+            grafico.linha(espessuras, fisica.transmissao(mu, espessuras), cor='gray', estilo='--',
+                          rotulo=f'Só a linha principal ({E:g} keV)')
+        grafico.vertical(x, cor='red', rotulo=f'Espessura necessária: {x:.2f} cm')
+        grafico.horizontal(1/R, cor='green', rotulo=f'Redução desejada: 1/{R}')
+        
+        graficos.exibir(grafico, "simulador_blindagem")
+        
+        # μ/ρ em toda a faixa tabelada, com as linhas da fonte marcadas
+        faixa = np.geomspace(atenuacao.E_MIN, atenuacao.E_MAX, 400)
+        grafico = graficos.Grafico(f'Coeficiente de atenuação mássica - {material}',
+                                   'Energia (keV)', 'μ/ρ (cm²/g)',
+                                   escala_x='log', escala_y='log')
+        grafico.linha(faixa, atenuacao.mu_rho(mat, faixa), cor='darkblue')
+        grafico.pontos(energias, atenuacao.mu_rho(mat, energias), cor='red',
+                       rotulo=f'Linhas de {descricao_fonte}', tamanho=60)
+        graficos.exibir(grafico, "simulador_blindagem/mu_rho")
+        
+        if modelo == "Feixe largo: Monte Carlo":
+            # O Monte Carlo é monoenergético: transporta a linha principal pela espessura
+            # que reduz essa linha R× (com a espessura do espectro inteiro, linhas mais
+            # duras deixariam a principal sem nenhum fóton não colidido)
+            x_mc = x if len(energias) == 1 else float(np.log(R) / mu)
+            if len(energias) > 1:
+                st.caption(f"O Monte Carlo transporta só a linha principal ({E:g} keV), "
+                           f"por {x_mc:.2f} cm: a espessura que reduz essa linha {R}×.")
+            with st.spinner(f"Transportando {historias:,} fótons..."):
+                inicio = time.perf_counter()
+                resultado = transporte.simular_placa(meio_transporte(mat), E, x_mc,
+                                                     historias, semente=int(semente))
+                duracao = time.perf_counter() - inicio
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Transmissão e^(-μx)", f"{fisica.transmissao(mu, x_mc):.2e}")
+            with col2:
+                st.metric("Transmissão Monte Carlo", f"{resultado.fracao_transmitida:.2e}")
+            
+            if resultado.nao_colididos == 0:
+                st.warning(f"Nenhum dos {historias:,} fótons atravessou {x_mc:.2f} cm sem colidir: "
+                           f"o buildup não tem referência. Aumente o número de histórias.")
+            else:
+                B_numero, B_energia = resultado.buildup(E)
+                with col3:
+                    st.metric("Buildup (número)", f"{B_numero:.2f}")
+                with col4:
+                    st.metric("Buildup (energia)", f"{B_energia:.2f}")
+                
+                # O buildup cresce com a espessura: isto é só uma primeira correção
+                x_largo = x_mc + np.log(B_numero) / mu
+                st.info(f"📐 Com o buildup, a redução de {R}× da linha de {E:g} keV exige cerca de "
+                        f"**{x_largo:.2f} cm** (estimativa x + ln(B)/μ)")
+            
+            centros = (resultado.bordas[:-1] + resultado.bordas[1:]) / 2
+            espectro = resultado.espectro / resultado.historias
+            grafico = graficos.Grafico(f'Espectro transmitido - {E:g} keV, {x_mc:.2f} cm de {material}',
+                                       'Energia (keV)', 'Fótons por fóton incidente')
+            grafico.linha(centros, espectro, cor='purple')
+            grafico.area(centros, espectro, cor='purple')
+            graficos.exibir(grafico, "simulador_blindagem/espectro")
+            
+            st.caption(
+                f"🎲 {historias:,} histórias em {duracao:.2f} s "
+                f"({historias / duracao:,.0f} histórias/s, até {transporte.processos_disponiveis()} processos) "
+                f"- {resultado.refletidos / historias:.1%} retroespalhados"
+            )
+        
+        # Informações adicionais
+        with st.expander("📚 Informações Técnicas"):
+            if len(energias) == 1:
+                passo_espessura = f"x = ln({R}) / {mu:.3f} = **{x:.2f} cm**"
+            else:
+                passo_espessura = (f"Σ yᵢ·e^(-μᵢx) / Σ yᵢ = 1/{R} resolvido para x = **{x:.2f} cm** "
+                                   f"(μ efetivo = ln({R}) / x = {mu_efetivo:.3f} cm⁻¹)")
+            st.markdown(f"""
+            **Cálculo detalhado:**
+            1. Redução desejada: **1/{R}** da intensidade original
+            2. Coeficiente de atenuação (μ) a {E:g} keV: **{mu:.3f} cm⁻¹**
+            3. Espessura: {passo_espessura}
+            
+            **Comparação com outros materiais:**
+            """)
+            
+            # Comparar com outros materiais (μ contínuo: todos têm valor em qualquer energia)
+            comparacao = []
+            for outro in MATERIAIS_BLINDAGEM:
+                if outro != material:
+                    mat_outro = atenuacao.material(MATERIAIS_BLINDAGEM[outro])
+                    x_outro = float(atenuacao.espessura_para_transmissao(mat_outro, energias,
+                                                                         rendimentos, 1 / R))
+                    comparacao.append({
+                        "Material": outro,
+                        "μ (cm⁻¹)": f"{float(atenuacao.mu(mat_outro, E)):.3f}",
+                        "Espessura necessária (cm)": f"{x_outro:.1f}",
+                        "Relação": f"{x_outro/x:.1f}×"
+                    })
+            
+            df_comp = pd.DataFrame(comparacao)
+            st.dataframe(df_comp, width="stretch")
+            
+            st.markdown(f"""
+            **Recomendações práticas:**
+            - **{descricao_fonte}:** {'Efeito fotoelétrico domina' if E < 100 else 'Compton domina' if E < 1000 else 'Produção de par domina'}
+            - **{material}:** {'Excelente para baixas energias' if E < 200 and material == 'Chumbo (Pb)' else 'Bom custo-benefício' if material == 'Concreto' else 'Alta densidade'}
+            - **Alternativas:** Considere blindagem em camadas para altas energias
+            """)
+
+@st.fragment
+def otimizador_camadas():
+    """Busca de pilhas de materiais com a menor custo, massa ou espessura"""
+    
+    st.subheader("🧱 Otimizador de Blindagem em Camadas")
+    
+    st.markdown("""
+    Combina até N materiais (ex.: chumbo + aço + concreto) para atingir a redução desejada.
+    Em feixe estreito a transmissão da pilha é o produto das transmissões das camadas,
+    e a ordem não importa. Uma pilha está na **fronteira de Pareto** quando nenhuma outra
+    é melhor em todos os objetivos ao mesmo tempo.
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        energias, rendimentos, E, descricao_fonte = escolher_fonte()
+        R = st.select_slider("Redução desejada", options=[10, 100, 1000, 10_000, 100_000],
+                             value=1000, format_func=lambda r: f"{r:,}×".replace(",", "."))
+    
+    with col2:
+        materiais = st.multiselect("Materiais candidatos", list(MATERIAIS_BLINDAGEM),
+                                   default=["Chumbo (Pb)", "Aço", "Concreto"])
+        max_camadas = st.slider("Máximo de camadas", 1, 4, 3,
+                                help="Com 4 camadas a grade de cada camada fica mais grossa")
+        objetivos = st.multiselect("Objetivos", list(blindagem.OBJETIVOS),
+                                   default=["custo", "espessura"], max_selections=3,
+                                   format_func=blindagem.OBJETIVOS.get)
+    
+    with st.expander("⚖️ Restrições (0 = sem limite)"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            espessura_max = st.number_input("Espessura total máxima (cm)", 0.0, 1000.0, 0.0)
+        with col2:
+            massa_max = st.number_input("Massa máxima (kg/m²)", 0.0, 1e5, 0.0)
+        with col3:
+            custo_max = st.number_input("Custo máximo (R$/m²)", 0.0, 1e7, 0.0)
+        st.caption("Preços de referência (R$/kg): " + ", ".join(
+            f"{nome} {preco:g}" for nome, preco in blindagem.CUSTO_POR_KG.items()))
+    
+    if st.button("Otimizar"):
+        if not materiais or not objetivos:
+            st.warning("Escolha ao menos um material e um objetivo.")
+            return
+        
+        inicio = time.perf_counter()
+        resultado = blindagem.otimizar_camadas(
+            [MATERIAIS_BLINDAGEM[m] for m in materiais], energias, rendimentos, 1 / R,
+            max_camadas=max_camadas, objetivos=tuple(objetivos),
+            espessura_max=espessura_max or math.inf, massa_max=massa_max or math.inf,
+            custo_max=custo_max or math.inf
+        )
+        duracao = time.perf_counter() - inicio
+        
+        if not len(resultado.custo):
+            st.error("Nenhuma pilha atinge a redução desejada dentro das restrições.")
+            return
+        
+        st.success(f"**{len(resultado.fronteira)} pilhas na fronteira de Pareto** entre "
+                   f"{len(resultado.custo):,} pilhas viáveis ({duracao * 1000:.0f} ms)")
+        
+        # Melhor pilha em cada objetivo
+        colunas = st.columns(len(objetivos))
+        for coluna, nome in zip(colunas, objetivos):
+            valores = resultado.objetivo(nome)
+            melhor = resultado.fronteira[np.argmin(valores[resultado.fronteira])]
+            with coluna:
+                st.metric(f"Melhor: {blindagem.OBJETIVOS[nome]}", f"{valores[melhor]:,.1f}")
+                st.caption(blindagem.descrever_pilha(resultado.materiais, resultado.espessuras[melhor]))
+        
+        # Fronteira sobre uma amostra das pilhas viáveis
+        eixo_x, eixo_y = [*objetivos, *(o for o in ("espessura", "custo") if o not in objetivos)][:2]
+        rng = np.random.default_rng(0)
+        amostra = rng.choice(len(resultado.custo), min(len(resultado.custo), 2000), replace=False)
+        
+        grafico = graficos.Grafico(f'Pilhas para redução de {R}× - {descricao_fonte}',
+                                   blindagem.OBJETIVOS[eixo_x], blindagem.OBJETIVOS[eixo_y])
+        grafico.pontos(resultado.objetivo(eixo_x)[amostra], resultado.objetivo(eixo_y)[amostra],
+                       cor='lightgray', rotulo='Pilhas viáveis', tamanho=10)
+        grafico.pontos(resultado.objetivo(eixo_x)[resultado.fronteira],
+                       resultado.objetivo(eixo_y)[resultado.fronteira],
+                       cor='red', rotulo='Fronteira de Pareto', tamanho=25)
+        graficos.exibir(grafico, "otimizador_camadas")
+        
+        st.dataframe(resultado.tabela().round(2), width="stretch", hide_index=True)
+
+@st.fragment
+def projeto_barreiras():
+    """Cálculo em lote das barreiras de uma sala (NCRP 147/151)"""
+    
+    st.subheader("🏗️ Projeto de Barreiras (NCRP)")
+    
+    st.markdown("""
+    Uma linha por barreira e tipo de radiação. Paredes secundárias recebem duas linhas
+    (espalhamento e fuga) com o mesmo nome; a espessura final segue a regra da NCRP.
+    
+    - **primária:** B = P·d² / (W·U·T)
+    - **espalhamento:** B = P·d_esp²·d² / (a(θ)·W·T·F/400)
+    - **fuga:** B = P·d² / (10⁻³·W·T)
+    
+    P em mSv/semana, W em Gy/semana a 1 m, distâncias em m, área do campo F em cm².
+    """)
+    
+    arquivo = st.file_uploader("Tabela de barreiras (CSV)", type=["csv"],
+                               help="Colunas: " + ", ".join(blindagem.COLUNAS_BARREIRAS))
+    if arquivo is not None:
+        try:
+            base = blindagem.ler_barreiras(arquivo)
+        except (ValueError, KeyError) as erro:
+            st.error(f"Tabela inválida: {erro}")
+            return
+    else:
+        base = blindagem.tipar_barreiras(blindagem.barreiras_exemplo())
+    
+    tabela = st.data_editor(
+        base.astype({"barreira": object, "material": object}), num_rows="dynamic",
+        hide_index=True, width="stretch",
+        key=f"barreiras_{getattr(arquivo, 'file_id', 'exemplo')}",
+        column_config={
+            "tipo": st.column_config.SelectboxColumn(options=list(blindagem.TIPOS_BARREIRA), required=True),
+            "material": st.column_config.SelectboxColumn(
+                options=[*atenuacao.COMPOSTOS, *atenuacao.RECEITAS, *atenuacao.ELEMENTOS], required=True),
+        }
+    )
+    
+    if st.button("Calcular barreiras"):
+        try:
+            resultado = blindagem.calcular_barreiras(tabela)
+        except (ValueError, KeyError) as erro:
+            st.error(f"Tabela inválida: {erro}")
+            return
+        final = blindagem.combinar_secundarias(resultado)
+        
+        grafico = graficos.Grafico('Espessura final por barreira', '', 'Espessura (cm)', grade='y')
+        grafico.barras(final["barreira"], final["espessura_final_cm"],
+                       [graficos.PALETA[i % len(graficos.PALETA)] for i in range(len(final))])
+        grafico.texto(final["barreira"], final["espessura_final_cm"],
+                      [f"{x:.1f} cm" for x in final["espessura_final_cm"]])
+        graficos.exibir(grafico, "projeto_barreiras")
+        
+        st.markdown("**Espessuras finais**")
+        st.dataframe(final.round(2), width="stretch", hide_index=True)
+        st.markdown("**Cálculo por linha**")
+        st.dataframe(resultado[["barreira", "tipo", "material", "energia_efetiva_keV", "transmissao",
+                                "numero_tvl", "tvl_cm", "espessura_cm"]],
+                     width="stretch", hide_index=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button("📥 Resultado (CSV)", resultado.to_csv(index=False),
+                               "barreiras.csv", "text/csv")
+        with col2:
+            st.download_button("📄 Relatório (Markdown)", blindagem.relatorio_barreiras(resultado),
+                               "relatorio_barreiras.md", "text/markdown")
+        st.caption("Estimativa de feixe estreito, sem buildup: confira com as TVLs de feixe "
+                   "largo da NCRP antes de construir.")
@@ -0,0 +1,497 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Persistência do Progresso
+=============================================================
+
+Armazena o progresso de cada jogador (nível, XP, dinheiro,
+habilidades, inventário, conquistas...) fora do st.session_state,
+identificado pelo ID do jogador.
+
+Backends (variável de ambiente FMGAME_PERSISTENCIA):
+- "sqlite" (padrão): arquivo SQLite em modo WAL (FMGAME_DB)
+- "memoria": dicionário em memória, sem sobreviver ao processo
+
+As gravações são feitas em segundo plano ("write-behind"): a
+sessão só enfileira o estado, que é agrupado por jogador e
+gravado em lotes numa única transação por uma thread dedicada.
+Assim as recompensas das missões nunca bloqueiam o rerun. Um lote
+que falha (disco cheio, banco travado) volta para a fila sem
+sobrescrever estados mais novos e é regravado com espera
+crescente; a thread de gravação não morre por isso.
+=============================================================
+"""
+
+import atexit
+import bisect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+# Campos do st.session_state que formam o progresso do jogador
+CAMPOS_PROGRESSO = [
+    'nivel', 'xp', 'xp_total', 'dinheiro', 'reputacao',
+    'missoes_completas', 'erros_cometidos',
+    'habilidades', 'inventario', 'conquistas'
+]
+
+CAMINHO_PADRAO = Path(__file__).resolve().parent / "fmgame.db"
+
+ESPERA_MAXIMA = 30.0  # s entre novas tentativas depois de lotes que falharam
+
+_log = logging.getLogger(__name__)
+
+ESPECIALIDADE_PADRAO = "Estagiário"
+
+# Área de atuação de cada habilidade: a especialidade do jogador no
+# ranking é a área da sua habilidade de maior nível
+AREAS_HABILIDADES = {
+    'decaimento': "Medicina Nuclear",
+    'espectrometria': "Medicina Nuclear",
+    'dosimetria': "Radioterapia",
+    'protecao': "Radioproteção",
+    'detectores': "Diagnóstico",
+}
+
+# Colegas fictícios que povoam o ranking de um servidor novo
+# (id, nome, nível, XP, especialidade); o prefixo dos ids é
+# reservado, para que nenhum jogador assuma (e sobrescreva) um deles
+PREFIXO_RESERVADO = "npc:"
+JOGADORES_INICIAIS = [
+    ("npc:carla.silva", "Dra. Carla Silva", 42, 12500, "Medicina Nuclear"),
+    ("npc:marcos.oliveira", "Dr. Marcos Oliveira", 38, 11000, "Radioterapia"),
+    ("npc:ana.santos", "Dra. Ana Santos", 35, 9800, "Radioproteção"),
+    ("npc:roberto.lima", "Dr. Roberto Lima", 28, 7500, "Diagnóstico"),
+    ("npc:fernanda.costa", "Dra. Fernanda Costa", 25, 6200, "Medicina Nuclear"),
+    ("npc:paulo.mendes", "Dr. Paulo Mendes", 22, 5400, "Radioterapia"),
+    ("npc:juliana.alves", "Dra. Juliana Alves", 19, 4300, "Radioproteção"),
+    ("npc:ricardo.sousa", "Dr. Ricardo Sousa", 16, 3500, "Diagnóstico"),
+    ("npc:beatriz.martins", "Dra. Beatriz Martins", 12, 2800, "Medicina Nuclear"),
+]
+
+# ============================================================
+# INTERFACE DOS ARMAZÉNS
+# ============================================================
+
+class ArmazemJogadores:
+    """Interface comum dos backends de persistência"""
+
+    def carregar(self, jogador_id):
+        """Estado salvo do jogador (dict) ou None se for novo"""
+        raise NotImplementedError
+
+    def salvar(self, jogador_id, estado):
+        """Registra o estado do jogador (pode ser gravado depois)"""
+        raise NotImplementedError
+
+    def descarregar(self):
+        """Grava imediatamente tudo o que estiver pendente"""
+
+    def fechar(self):
+        """Descarrega e libera os recursos do backend"""
+        self.descarregar()
+
+    def top(self, k):
+        """Os k jogadores com mais XP (dicts id/nome/nivel/xp/especialidade)"""
+        raise NotImplementedError
+
+    def posicao(self, xp_total, ignorar=None):
+        """Posição (1 = primeiro) de quem tem xp_total, sem contar o jogador ignorar"""
+        raise NotImplementedError
+
+    def estatisticas(self):
+        """Agregados do ranking: jogadores, média de nível e de XP, especialidade mais comum"""
+        raise NotImplementedError
+
+def especialidade(habilidades):
+    """Área da habilidade de maior nível; Estagiário enquanto nenhuma se destaca"""
+    niveis = {}
+    for nome, dados in (habilidades or {}).items():
+        area = AREAS_HABILIDADES.get(nome)
+        if area:
+            niveis[area] = max(niveis.get(area, 0), int(dados.get('nivel', 0)))
+    ordem = sorted(niveis.values(), reverse=True)
+    if not ordem or ordem[0] <= 1 or ordem[1:2] == ordem[:1]:
+        return ESPECIALIDADE_PADRAO
+    return max(niveis, key=niveis.get)
+
+def _linha_ranking(jogador_id, estado):
+    """(nome, nível, XP, especialidade) de um estado salvo; o nome é o próprio id"""
+    return (jogador_id, int(estado.get('nivel', 1)), int(estado.get('xp_total', 0)),
+            especialidade(estado.get('habilidades')))
+
+def _jogador_ranking(jogador_id, nome, nivel, xp_total, especialidade):
+    return {"id": jogador_id, "nome": nome, "nivel": nivel, "xp": xp_total,
+            "especialidade": especialidade}
+
+def _estatisticas(jogadores, soma_nivel, soma_xp, mais_comum):
+    return {
+        "jogadores": jogadores,
+        "media_nivel": soma_nivel / jogadores if jogadores else 0.0,
+        "media_xp": soma_xp / jogadores if jogadores else 0.0,
+        "especialidade_mais_comum": mais_comum[0][0] if mais_comum else ESPECIALIDADE_PADRAO,
+    }
+
+class ArmazemMemoria(ArmazemJogadores):
+    """Backend em memória (testes e implantações sem disco)"""
+
+    def __init__(self):
+        self._estados = {}
+        self._trava = threading.Lock()
+
+        # Ranking: lista ordenada por (-XP, id) e agregados incrementais
+        self._linhas = {}
+        self._ordem = []
+        self._soma_nivel = 0
+        self._soma_xp = 0
+        self._especialidades = Counter()
+        for jogador_id, nome, nivel, xp_total, especialidade in JOGADORES_INICIAIS:
+            self._registrar(jogador_id, (nome, nivel, xp_total, especialidade))
+
+    def carregar(self, jogador_id):
+        with self._trava:
+            estado = self._estados.get(jogador_id)
+        return json.loads(estado) if estado is not None else None
+
+    def salvar(self, jogador_id, estado):
+        texto = json.dumps(estado, ensure_ascii=False)
+        with self._trava:
+            self._estados[jogador_id] = texto
+            self._registrar(jogador_id, _linha_ranking(jogador_id, estado))
+
+    def _registrar(self, jogador_id, linha):
+        """Atualiza a ordem e os agregados trocando a linha antiga pela nova"""
+        antiga = self._linhas.get(jogador_id)
+        if antiga is not None:
+            del self._ordem[bisect.bisect_left(self._ordem, (-antiga[2], jogador_id))]
+            self._soma_nivel -= antiga[1]
+            self._soma_xp -= antiga[2]
+            self._especialidades[antiga[3]] -= 1
+        self._linhas[jogador_id] = linha
+        bisect.insort(self._ordem, (-linha[2], jogador_id))
+        self._soma_nivel += linha[1]
+        self._soma_xp += linha[2]
+        self._especialidades[linha[3]] += 1
+
+    def top(self, k):
+        with self._trava:
+            return [_jogador_ranking(jogador_id, *self._linhas[jogador_id])
+                    for _, jogador_id in self._ordem[:k]]
+
+    def posicao(self, xp_total, ignorar=None):
+        with self._trava:
+            acima = bisect.bisect_left(self._ordem, (-xp_total, ""))
+            linha = self._linhas.get(ignorar)
+        if linha is not None and linha[2] > xp_total:
+            acima -= 1
+        return acima + 1
+
+    def estatisticas(self):
+        with self._trava:
+            return _estatisticas(len(self._linhas), self._soma_nivel, self._soma_xp,
+                                 self._especialidades.most_common(1))
+
+# ============================================================
+# BACKEND SQLITE (WAL + WRITE-BEHIND)
+# ============================================================
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS jogadores (
+    id TEXT PRIMARY KEY,
+    nivel INTEGER NOT NULL,
+    xp_total INTEGER NOT NULL,
+    estado TEXT NOT NULL,
+    atualizado REAL NOT NULL
+);
+"""
+
+# Colunas do ranking acrescentadas a bancos já existentes
+COLUNAS_RANKING = {
+    "nome": "TEXT NOT NULL DEFAULT ''",
+    "especialidade": f"TEXT NOT NULL DEFAULT '{ESPECIALIDADE_PADRAO}'",
+}
+
+# Índice do ranking e agregados mantidos por gatilhos a cada gravação:
+# o top-K e a posição percorrem só o índice, e as médias e a
+# especialidade mais comum não dependem do número de jogadores
+ESQUEMA_RANKING = """
+BEGIN;
+CREATE INDEX IF NOT EXISTS idx_jogadores_xp ON jogadores (xp_total DESC, id);
+
+CREATE TABLE IF NOT EXISTS agregados (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    jogadores INTEGER NOT NULL,
+    soma_nivel INTEGER NOT NULL,
+    soma_xp INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO agregados
+    SELECT 0, COUNT(*), COALESCE(SUM(nivel), 0), COALESCE(SUM(xp_total), 0) FROM jogadores;
+
+CREATE TABLE IF NOT EXISTS especialidades (
+    especialidade TEXT PRIMARY KEY,
+    jogadores INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_especialidades_jogadores ON especialidades (jogadores);
+INSERT OR IGNORE INTO especialidades
+    SELECT especialidade, COUNT(*) FROM jogadores GROUP BY especialidade;
+
+CREATE TRIGGER IF NOT EXISTS jogadores_inserir AFTER INSERT ON jogadores BEGIN
+    UPDATE agregados SET jogadores = jogadores + 1,
+        soma_nivel = soma_nivel + NEW.nivel, soma_xp = soma_xp + NEW.xp_total;
+    INSERT INTO especialidades VALUES (NEW.especialidade, 1)
+        ON CONFLICT(especialidade) DO UPDATE SET jogadores = jogadores + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS jogadores_atualizar AFTER UPDATE ON jogadores BEGIN
+    UPDATE agregados SET soma_nivel = soma_nivel - OLD.nivel + NEW.nivel,
+        soma_xp = soma_xp - OLD.xp_total + NEW.xp_total;
+    UPDATE especialidades SET jogadores = jogadores - 1
+        WHERE especialidade = OLD.especialidade;
+    INSERT INTO especialidades VALUES (NEW.especialidade, 1)
+        ON CONFLICT(especialidade) DO UPDATE SET jogadores = jogadores + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS jogadores_excluir AFTER DELETE ON jogadores BEGIN
+    UPDATE agregados SET jogadores = jogadores - 1,
+        soma_nivel = soma_nivel - OLD.nivel, soma_xp = soma_xp - OLD.xp_total;
+    UPDATE especialidades SET jogadores = jogadores - 1
+        WHERE especialidade = OLD.especialidade;
+END;
+COMMIT;
+"""
+
+SEMEAR = """
+INSERT OR IGNORE INTO jogadores (id, nome, nivel, xp_total, especialidade, estado, atualizado)
+VALUES (?, ?, ?, ?, ?, '{}', 0)
+"""
+
+GRAVAR = """
+INSERT INTO jogadores (id, nome, nivel, xp_total, especialidade, estado, atualizado)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    nome = excluded.nome,
+    nivel = excluded.nivel,
+    xp_total = excluded.xp_total,
+    especialidade = excluded.especialidade,
+    estado = excluded.estado,
+    atualizado = excluded.atualizado
+"""
+
+class ArmazemSQLite(ArmazemJogadores):
+    """Backend SQLite com gravação em lotes por uma thread dedicada"""
+
+    def __init__(self, caminho=CAMINHO_PADRAO, intervalo=0.5, max_lote=1000):
+        self.caminho = str(caminho)
+        self.intervalo = intervalo
+        self.max_lote = max_lote
+        self.lotes_gravados = 0
+        self.estados_gravados = 0
+        self.falhas = 0
+        self.ultimo_erro = None
+
+        # Jogador → estado (JSON) aguardando gravação; regravações do
+        # mesmo jogador antes do próximo lote substituem a anterior
+        self._pendentes = {}
+        self._em_gravacao = {}
+        self._condicao = threading.Condition()
+        self._local = threading.local()
+        self._encerrar = False
+
+        conexao = self._conexao()
+        conexao.execute("PRAGMA journal_mode=WAL")
+        conexao.executescript(ESQUEMA)
+        colunas = {linha[1] for linha in conexao.execute("PRAGMA table_info(jogadores)")}
+        for coluna, definicao in COLUNAS_RANKING.items():
+            if coluna not in colunas:
+                conexao.execute(f"ALTER TABLE jogadores ADD COLUMN {coluna} {definicao}")
+        conexao.execute("UPDATE jogadores SET nome = id WHERE nome = ''")
+        conexao.commit()
+        conexao.executescript(ESQUEMA_RANKING)
+        with conexao:
+            conexao.executemany(SEMEAR, JOGADORES_INICIAIS)
+
+        self._gravador = threading.Thread(target=self._laco_gravacao,
+                                          name="fmgame-write-behind", daemon=True)
+        self._gravador.start()
+
+    def _conexao(self):
+        """Conexão própria de cada thread (leituras em paralelo no WAL)"""
+        conexao = getattr(self._local, "conexao", None)
+        if conexao is None:
+            conexao = sqlite3.connect(self.caminho, timeout=30)
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            conexao.execute("PRAGMA busy_timeout=30000")
+            self._local.conexao = conexao
+        return conexao
+
+    def carregar(self, jogador_id):
+        # Leitura das próprias gravações: o pendente mais novo vence o disco
+        with self._condicao:
+            texto = self._pendentes.get(jogador_id) or self._em_gravacao.get(jogador_id)
+        if texto is None:
+            linha = self._conexao().execute(
+                "SELECT estado FROM jogadores WHERE id = ?", (jogador_id,)
+            ).fetchone()
+            if linha is None:
+                return None
+            texto = linha[0]
+        return json.loads(texto)
+
+    def salvar(self, jogador_id, estado):
+        texto = json.dumps(estado, ensure_ascii=False)
+        with self._condicao:
+            self._pendentes[jogador_id] = texto
+            if len(self._pendentes) >= self.max_lote:
+                self._condicao.notify()
+
+    def descarregar(self):
+        """Espera a fila esvaziar; RuntimeError se o gravador parou ou um lote falhou"""
+        with self._condicao:
+            falhas = self.falhas
+            self._condicao.notify()
+            while self._pendentes or self._em_gravacao:
+                if not self._gravador.is_alive():
+                    perdidos = len(self._pendentes) + len(self._em_gravacao)
+                    raise RuntimeError(f"gravador parado: {perdidos} estados não gravados "
+                                       f"em {self.caminho}")
+                if self.falhas != falhas:
+                    raise RuntimeError(f"falha ao gravar em {self.caminho}; "
+                                       f"{len(self._pendentes)} estados aguardam nova tentativa"
+                                       ) from self.ultimo_erro
+                self._condicao.wait(timeout=self.intervalo)
+
+    def fechar(self):
+        with self._condicao:
+            self._encerrar = True
+            self._condicao.notify()
+        self._gravador.join()
+
+    def _laco_gravacao(self):
+        """Thread de gravação: junta os pendentes e grava em um lote"""
+        seguidas = 0  # lotes seguidos que falharam
+        while True:
+            with self._condicao:
+                if not self._pendentes and not self._encerrar:
+                    self._condicao.wait(timeout=self.intervalo)
+                if not self._pendentes:
+                    if self._encerrar:
+                        return
+                    continue
+                self._em_gravacao, self._pendentes = self._pendentes, {}
+
+            try:
+                self._gravar_lote(self._em_gravacao)
+                erro = None
+            except Exception as e:  # qualquer falha: a thread não pode morrer com o lote
+                erro = e
+                _log.exception("Falha ao gravar lote de %d jogadores em %s",
+                               len(self._em_gravacao), self.caminho)
+
+            with self._condicao:
+                if erro is None:
+                    seguidas = 0
+                else:
+                    # O lote volta à fila, sem passar por cima de estados mais novos
+                    for jogador_id, texto in self._em_gravacao.items():
+                        self._pendentes.setdefault(jogador_id, texto)
+                    self.falhas += 1
+                    self.ultimo_erro = erro
+                    seguidas += 1
+                self._em_gravacao = {}
+                self._condicao.notify_all()
+
+                if erro is not None:
+                    if self._encerrar:
+                        _log.error("Encerrando com %d estados não gravados em %s",
+                                   len(self._pendentes), self.caminho)
+                        return
+                    self._condicao.wait(timeout=min(self.intervalo * 2**seguidas, ESPERA_MAXIMA))
+
+    def _gravar_lote(self, lote):
+        agora = time.time()
+        linhas = []
+        for jogador_id, texto in lote.items():
+            linhas.append((jogador_id, *_linha_ranking(jogador_id, json.loads(texto)),
+                           texto, agora))
+        conexao = self._conexao()
+        with conexao:
+            conexao.executemany(GRAVAR, linhas)
+        self.lotes_gravados += 1
+        self.estados_gravados += len(linhas)
+
+    # O ranking lê o que já está no disco: gravações ainda na fila
+    # aparecem depois do próximo lote (intervalo de segundos)
+
+    def top(self, k):
+        linhas = self._conexao().execute(
+            "SELECT id, nome, nivel, xp_total, especialidade FROM jogadores "
+            "ORDER BY xp_total DESC, id LIMIT ?", (k,)
+        ).fetchall()
+        return [_jogador_ranking(*linha) for linha in linhas]
+
+    def posicao(self, xp_total, ignorar=None):
+        acima, = self._conexao().execute(
+            "SELECT COUNT(*) FROM jogadores WHERE xp_total > ? AND id IS NOT ?",
+            (xp_total, ignorar)
+        ).fetchone()
+        return acima + 1
+
+    def estatisticas(self):
+        conexao = self._conexao()
+        jogadores, soma_nivel, soma_xp = conexao.execute(
+            "SELECT jogadores, soma_nivel, soma_xp FROM agregados"
+        ).fetchone()
+        mais_comum = conexao.execute(
+            "SELECT especialidade FROM especialidades ORDER BY jogadores DESC LIMIT 1"
+        ).fetchall()
+        return _estatisticas(jogadores, soma_nivel, soma_xp, mais_comum)
+
+# ============================================================
+# ARMAZÉM DO PROCESSO
+# ============================================================
+
+_armazem = None
+_trava_armazem = threading.Lock()
+
+def obter_armazem():
+    """Armazém único do processo, criado na primeira utilização"""
+    global _armazem
+    if _armazem is None:
+        with _trava_armazem:
+            if _armazem is None:
+                backend = os.environ.get("FMGAME_PERSISTENCIA", "sqlite").lower()
+                if backend == "memoria":
+                    _armazem = ArmazemMemoria()
+                else:
+                    _armazem = ArmazemSQLite(os.environ.get("FMGAME_DB", CAMINHO_PADRAO))
+                atexit.register(_armazem.fechar)
+    return _armazem
+
+# ============================================================
+# INTEGRAÇÃO COM A SESSÃO
+# ============================================================
+
+def id_reservado(jogador_id):
+    """True para ids que os jogadores não podem usar (os dos colegas fictícios)"""
+    return jogador_id.lower().startswith(PREFIXO_RESERVADO)
+
+def estado_da_sessao(sessao):
+    """Extrai da sessão apenas os campos de progresso"""
+    return {campo: sessao[campo] for campo in CAMPOS_PROGRESSO if campo in sessao}
+
+def salvar_sessao(sessao):
+    """Enfileira o progresso do jogador logado, se tiver mudado"""
+    jogador_id = sessao.get('jogador_id')
+    if not jogador_id or id_reservado(jogador_id):
+        return False
+    estado = estado_da_sessao(sessao)
+    assinatura = json.dumps(estado, sort_keys=True, ensure_ascii=False)
+    if sessao.get('estado_salvo') == assinatura:
+        return False
+    obter_armazem().salvar(jogador_id, estado)
+    sessao['estado_salvo'] = assinatura
+    return True
@@ -0,0 +1,240 @@
+"""
+=============================================================
+FÍSICO MÉDICO: A MISSÃO - Transporte de Fótons (Monte Carlo)
+=============================================================
+
+Transporte Monte Carlo de fótons através de uma placa de
+blindagem, sem nenhuma dependência do Streamlit.
+
+Cada lote acompanha todas as suas histórias ao mesmo tempo em
+arrays NumPy: sorteio da profundidade de interação, absorção
+fotoelétrica ou espalhamento Compton (Klein-Nishina, método de
+Kahn) e saída pela face de trás (transmitido) ou da frente
+(refletido). Os lotes usam sementes derivadas de uma única
+SeedSequence e rodam num pool de processos, de modo que o
+resultado depende só da semente, e não do número de processos.
+
+Simplificações: placa lateralmente infinita, feixe incidente
+normal e produção de pares contada como absorção.
+=============================================================
+"""
+
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+import fisica
+
+RAIO_CLASSICO_ELETRON = 2.8179403e-13  # cm
+NUMERO_AVOGADRO = 6.02214076e23  # mol⁻¹
+
+ENERGIA_CORTE = 10.0  # keV; abaixo disso o fóton é absorvido no local
+HISTORIAS_POR_LOTE = 250_000
+CANAIS_ESPECTRO = 60
+
+# ============================================================
+# MEIO ATENUADOR
+# ============================================================
+
+class Meio(NamedTuple):
+    """Material da placa: tabela de μ total e densidade eletrônica"""
+    nome: str
+    energias_keV: tuple   # energias tabeladas (keV, crescentes)
+    mu: tuple             # μ total em cada energia (cm⁻¹)
+    densidade: float      # g/cm³
+    z_sobre_a: float      # razão Z/A média (mol/g)
+
+def mu_total(meio, E):
+    """μ total (cm⁻¹) interpolado em log-log, constante fora da tabela"""
+    log_E = np.log(np.asarray(E, dtype=float))
+    return np.exp(np.interp(log_E, np.log(meio.energias_keV), np.log(meio.mu)))
+
+def secao_klein_nishina(E):
+    """Seção de choque Compton total por elétron (cm²), de Klein-Nishina"""
+    k = np.asarray(E, dtype=float) / fisica.ENERGIA_REPOUSO_ELETRON
+    um_2k = 1 + 2 * k
+    log_1_2k = np.log(um_2k)
+    return 2 * np.pi * RAIO_CLASSICO_ELETRON ** 2 * (
+        (1 + k) / k ** 2 * (2 * (1 + k) / um_2k - log_1_2k / k)
+        + log_1_2k / (2 * k)
+        - (1 + 3 * k) / um_2k ** 2
+    )
+
+def mu_compton(meio, E):
+    """Parte Compton de μ (cm⁻¹): densidade eletrônica × σ de Klein-Nishina"""
+    eletrons_cm3 = meio.densidade * meio.z_sobre_a * NUMERO_AVOGADRO
+    return eletrons_cm3 * secao_klein_nishina(E)
+
+# ============================================================
+# AMOSTRAGEM DAS INTERAÇÕES
+# ============================================================
+
+def amostrar_compton(E, rng):
+    """Energia espalhada e cos θ pelo método de Kahn (rejeição vetorizada)"""
+    k = E / fisica.ENERGIA_REPOUSO_ELETRON
+    razao = np.empty_like(E)   # ξ = E / E'
+    pendentes = np.arange(E.size)
+
+    while pendentes.size:
+        kp = k[pendentes]
+        r1, r2, r3 = rng.random((3, pendentes.size))
+        ramo_baixo = r1 <= (1 + 2 * kp) / (9 + 2 * kp)
+
+        xi = np.where(ramo_baixo, 1 + 2 * kp * r2, (1 + 2 * kp) / (1 + 2 * kp * r2))
+        cos_t = 1 - (xi - 1) / kp
+        aceito = np.where(ramo_baixo,
+                          r3 <= 4 * (1 / xi - 1 / xi ** 2),
+                          r3 <= 0.5 * (cos_t ** 2 + 1 / xi))
+
+        razao[pendentes[aceito]] = xi[aceito]
+        pendentes = pendentes[~aceito]
+
+    return E / razao, np.clip(1 - (razao - 1) / k, -1.0, 1.0)
+
+def girar_direcao(u, cos_t, rng):
+    """Novo cosseno diretor em z após desviar θ com azimute uniforme"""
+    phi = 2 * np.pi * rng.random(u.size)
+    seno_u = np.sqrt(np.maximum(0.0, 1 - u ** 2))
+    seno_t = np.sqrt(np.maximum(0.0, 1 - cos_t ** 2))
+    return np.clip(u * cos_t + seno_u * seno_t * np.cos(phi), -1.0, 1.0)
+
+# ============================================================
+# RESULTADO
+# ============================================================
+
+class ResultadoTransporte(NamedTuple):
+    """Contagens de um ou mais lotes (somáveis)"""
+    historias: int
+    transmitidos: int          # atravessaram a placa (com ou sem colisão)
+    nao_colididos: int         # atravessaram sem interagir
+    refletidos: int            # voltaram pela face de entrada
+    energia_transmitida: float # soma das energias transmitidas (keV)
+    espectro: np.ndarray       # contagens do espectro transmitido por canal
+    bordas: np.ndarray         # bordas dos canais (keV)
+
+    def somar(self, outro):
+        return ResultadoTransporte(
+            self.historias + outro.historias,
+            self.transmitidos + outro.transmitidos,
+            self.nao_colididos + outro.nao_colididos,
+            self.refletidos + outro.refletidos,
+            self.energia_transmitida + outro.energia_transmitida,
+            self.espectro + outro.espectro,
+            self.bordas,
+        )
+
+    @property
+    def fracao_transmitida(self):
+        """Fótons transmitidos por fóton incidente (feixe largo)"""
+        return self.transmitidos / self.historias
+
+    @property
+    def fracao_nao_colidida(self):
+        """Estimativa Monte Carlo de e^(-μx) (feixe estreito)"""
+        return self.nao_colididos / self.historias
+
+    def buildup(self, E0):
+        """Fatores de buildup (número e energia) em relação ao feixe não colidido"""
+        if self.nao_colididos == 0:
+            return math.inf, math.inf
+        return (self.transmitidos / self.nao_colididos,
+                self.energia_transmitida / (self.nao_colididos * E0))
+
+# ============================================================
+# SIMULAÇÃO DE UM LOTE
+# ============================================================
+
+def simular_lote(meio, E0, espessura, historias, semente):
+    """Transporta um lote de fótons monoenergéticos por uma placa"""
+    rng = np.random.default_rng(semente)
+    bordas = np.linspace(0.0, E0, CANAIS_ESPECTRO + 1)
+
+    z = np.zeros(historias)
+    u = np.ones(historias)
+    E = np.full(historias, float(E0))
+    colidiu = np.zeros(historias, dtype=bool)
+
+    transmitidos = nao_colididos = refletidos = 0
+    energia_transmitida = 0.0
+    espectro = np.zeros(CANAIS_ESPECTRO, dtype=np.int64)
+
+    while E.size:
+        # Distância até a próxima interação
+        mu = mu_total(meio, E)
+        z = z + u * (-np.log1p(-rng.random(E.size)) / mu)
+
+        # Saídas pela face de trás e pela da frente
+        saiu_tras = z >= espessura
+        saiu_frente = z < 0
+        transmitidos += int(saiu_tras.sum())
+        nao_colididos += int((saiu_tras & ~colidiu).sum())
+        refletidos += int(saiu_frente.sum())
+        energia_transmitida += float(E[saiu_tras].sum())
+        espectro += np.histogram(E[saiu_tras], bordas)[0]
+
+        dentro = ~(saiu_tras | saiu_frente)
+        z, u, E, mu = z[dentro], u[dentro], E[dentro], mu[dentro]
+
+        # Compton ou absorção (fotoelétrico, e pares acima de 1,022 MeV)
+        p_compton = np.minimum(mu_compton(meio, E) / mu, 1.0)
+        espalha = rng.random(E.size) < p_compton
+        z, u, E = z[espalha], u[espalha], E[espalha]
+
+        E, cos_t = amostrar_compton(E, rng)
+        u = girar_direcao(u, cos_t, rng)
+
+        vivo = E > ENERGIA_CORTE
+        z, u, E = z[vivo], u[vivo], E[vivo]
+        colidiu = np.ones(E.size, dtype=bool)
+
+    return ResultadoTransporte(historias, transmitidos, nao_colididos, refletidos,
+                               energia_transmitida, espectro, bordas)
+
+# ============================================================
+# EXECUÇÃO EM LOTES NO POOL DE PROCESSOS
+# ============================================================
+
+_executor = None
+_trava_executor = threading.Lock()
+
+def processos_disponiveis():
+    """Processos do pool (FMGAME_PROCESSOS ou número de CPUs)"""
+    return int(os.environ.get("FMGAME_PROCESSOS", os.cpu_count() or 1))
+
+def obter_executor():
+    """Pool de processos do servidor, criado na primeira utilização"""
+    global _executor
+    if _executor is None:
+        with _trava_executor:
+            if _executor is None:
+                # "spawn": o servidor do Streamlit tem várias threads vivas
+                _executor = ProcessPoolExecutor(
+                    max_workers=processos_disponiveis(),
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+    return _executor
+
+def simular_placa(meio, E0, espessura, historias, semente=0, paralelo=True,
+                  historias_por_lote=HISTORIAS_POR_LOTE):
+    """Transporte de `historias` fótons, dividido em lotes reprodutíveis"""
+    tamanhos = [historias_por_lote] * (historias // historias_por_lote)
+    if historias % historias_por_lote:
+        tamanhos.append(historias % historias_por_lote)
+    sementes = np.random.SeedSequence(semente).spawn(len(tamanhos))
+    argumentos = [(meio, float(E0), float(espessura), n, s) for n, s in zip(tamanhos, sementes)]
+
+    if paralelo and len(argumentos) > 1 and processos_disponiveis() > 1:
+        futuros = [obter_executor().submit(simular_lote, *args) for args in argumentos]
+        parciais = [f.result() for f in futuros]
+    else:
+        parciais = [simular_lote(*args) for args in argumentos]
+
+    resultado = parciais[0]
+    for parcial in parciais[1:]:
+        resultado = resultado.somar(parcial)
+    return resultado